@@ -0,0 +1,67 @@
+"""Время и размер отчетов сценария: отдельные файлы collect_*_report
+против одного документа collect_bundle_report.
+
+Запуск: python -m benchmarks.bench_bundle_report [повторов]
+"""
+
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+from business_logic.arcanes_classes import Client, Scenario
+from src import main_reports, reports_collection
+
+CLIENTS = [
+    Client("John", date(1963, 12, 7), "M"),
+    Client("Jul", date(1982, 7, 23), "F"),
+    Client("Jeck", date(2019, 2, 16), "M"),
+]
+SCENARIOS = {
+    "adult": (Scenario("adult", CLIENTS[:1]),
+              lambda s: main_reports.collect_adult_report(s.clients[0])),
+    "child": (Scenario("child", CLIENTS[2:]),
+              lambda s: main_reports.collect_child_report(s.clients[0])),
+    "couple": (Scenario("couple", CLIENTS[:2]),
+               main_reports.collect_couple_report),
+    "group": (Scenario("group", CLIENTS), main_reports.collect_group_report),
+}
+
+
+def _files(report) -> list[Path]:
+    if isinstance(report, list):
+        return [path for item in report for path in _files(item)]
+    return [report]
+
+
+def _measure(collect, repeat: int) -> tuple[float, int, int]:
+    began = time.perf_counter()
+    for _ in range(repeat):
+        files = _files(collect())
+    elapsed = (time.perf_counter() - began) / repeat * 1000
+    return elapsed, len(files), sum(path.stat().st_size for path in files)
+
+
+def main() -> None:
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        reports_collection.OUTPUT_PATH = Path(tmp_dir)
+        # первый документ разбирает шрифты и читает шаблоны, в замеры не входит
+        main_reports.collect_bundle_report(SCENARIOS["group"][0])
+
+        print(f"{'сценарий':<10} {'отдельные файлы':>30} {'один документ':>24}")
+        for name, (scenario, collect) in SCENARIOS.items():
+            separate = _measure(lambda: collect(scenario), repeat)
+            bundle = _measure(
+                lambda: main_reports.collect_bundle_report(scenario), repeat)
+            print(
+                f"{name:<10} {separate[1]:>3} ф. {separate[2] / 1024:9.1f} КБ"
+                f" {separate[0]:7.1f} мс {bundle[2] / 1024:9.1f} КБ"
+                f" {bundle[0]:7.1f} мс"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Календарь личных арканов на год для списка клиентов с записью в файл.
+
+Запуск: python -m benchmarks.bench_calendar [клиентов] [csv|jsonl] [файл]
+"""
+
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+from business_logic.calendar_engine import (
+    CalendarFormat,
+    iter_calendar,
+    write_calendar,
+)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    name = sys.argv[2] if len(sys.argv) > 2 else "csv"
+    if name not in ("csv", "jsonl"):
+        raise SystemExit(f"Неизвестный формат {name}: csv или jsonl")
+    file_format: CalendarFormat = name
+    path = Path(sys.argv[3]) if len(sys.argv) > 3 else Path(
+        f"/tmp/calendar.{file_format}")
+
+    rng = np.random.default_rng(1)
+    birthdays = np.datetime64("1950-01-01") + rng.integers(
+        0, 365 * 60, count).astype("timedelta64[D]")
+
+    began = time.perf_counter()
+    rows = write_calendar(
+        path,
+        iter_calendar(np.arange(count), birthdays,
+                      date(2025, 1, 1), date(2025, 12, 31)),
+        file_format,
+    )
+    elapsed = time.perf_counter() - began
+    size = path.stat().st_size / 2**30
+
+    print(f"{count:,} клиентов x 365 дней: {rows:,} строк"
+          f" за {elapsed:.1f} с, файл {size:.1f} ГБ")
+
+
+if __name__ == "__main__":
+    main()
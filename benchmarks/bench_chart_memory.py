@@ -0,0 +1,71 @@
+"""Память, занимаемая картами клиентов: классы arcanes_classes.py
+против CompactChart.
+
+Запуск: python -m benchmarks.bench_chart_memory [количество клиентов]
+"""
+
+import sys
+import tracemalloc
+from datetime import date, timedelta
+
+from business_logic.arcanes_classes import TRIANGLE_FIELDS, ChartProfile, Client
+from business_logic.chart_cache import chart_cache
+from business_logic.compact_chart import CompactChart
+
+
+def _clients(count: int) -> list[Client]:
+    start = date(1950, 1, 1)
+    return [
+        Client(name="Клиент", birthday=start + timedelta(days=n % 36500),
+               gender="M")
+        for n in range(count)
+    ]
+
+
+def _full_profile(client: Client) -> ChartProfile:
+    """Профиль со всеми рассчитанными значениями, как после отчета"""
+    profile = ChartProfile(client_info=client)
+    profile.mainstar.to_dict()
+    profile.errorstar.to_dict()
+    profile.missionstar.to_dict()
+    profile.footerstar.to_dict()
+    for row in profile.triangles.rows:
+        for field in TRIANGLE_FIELDS:
+            getattr(row, field)
+    return profile
+
+
+def _measure(build, clients: list[Client]) -> int:
+    # кэш арканов не наполняется: в замер входят только сами записи
+    with chart_cache.disabled():
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        charts = [build(client) for client in clients]
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del charts
+    return size
+
+
+def main(count: int = 20_000) -> None:
+    clients = _clients(count)
+
+    profile_size = _measure(_full_profile, clients)
+    compact_size = _measure(CompactChart.from_client, clients)
+
+    print(f"{count:,} клиентов")
+    print(
+        f"ChartProfile:  {profile_size / 2**20:8.1f} МБ"
+        f"  ({profile_size / count:6.0f} байт на клиента)"
+    )
+    print(
+        f"CompactChart:  {compact_size / 2**20:8.1f} МБ"
+        f"  ({compact_size / count:6.0f} байт на клиента)"
+    )
+    print(f"экономия: x{profile_size / compact_size:.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
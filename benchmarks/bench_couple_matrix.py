@@ -0,0 +1,40 @@
+"""Поиск лучших пар по всем сочетаниям двух списков клиентов.
+
+Запуск: python -m benchmarks.bench_couple_matrix [клиентов в списке] [k]
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from business_logic.couple_matrix import top_couples
+
+
+def _birthdays(count: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    start = np.datetime64("1950-01-01")
+    return start + rng.integers(0, 365 * 60, count).astype("timedelta64[D]")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    k = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    left, right = _birthdays(count, 1), _birthdays(count, 2)
+
+    tracemalloc.start()
+    began = time.perf_counter()
+    matches = top_couples(left, right, k=k)
+    elapsed = time.perf_counter() - began
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"пар {count:,} x {count:,}: top-{k} за {elapsed:.2f} с,"
+          f" пик памяти {peak / 2**20:.1f} МБ")
+    for match in matches[:5]:
+        print(f"  {match.left:>7} + {match.right:>7}: {match.score}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Сравнение табличного digital_root со строковой реализацией.
+
+Запуск: python -m benchmarks.bench_digital_root [количество вызовов]
+"""
+
+import random
+import sys
+import timeit
+
+from business_logic.arcanes_classes import digital_root, simple_digital_root
+
+
+def string_digital_root(num: int, arcanes_number: int = 22) -> int:
+    number = num
+    while number > arcanes_number:
+        number = sum(int(d) for d in str(number))
+    return number
+
+
+def string_simple_digital_root(num: int) -> int:
+    return sum(int(d) for d in str(num))
+
+
+def _measure(func, numbers: list[int], **kwargs) -> float:
+    def run():
+        for n in numbers:
+            func(n, **kwargs)
+
+    return min(timeit.repeat(run, number=1, repeat=3))
+
+
+def main(calls: int = 1_000_000) -> None:
+    rng = random.Random(0)
+    # типичные входы: дни, месяцы, годы и промежуточные суммы арканов
+    numbers = [
+        rng.choice(
+            (rng.randint(1, 31), rng.randint(1, 12), rng.randint(1900, 2100),
+             rng.randint(2, 110))
+        )
+        for _ in range(calls)
+    ]
+
+    cases = [
+        ("digital_root(22)", string_digital_root, digital_root, {}),
+        (
+            "digital_root(9)",
+            string_digital_root,
+            digital_root,
+            {"arcanes_number": 9},
+        ),
+        ("simple_digital_root", string_simple_digital_root,
+         simple_digital_root, {}),
+    ]
+    print(f"{calls:,} вызовов")
+    for name, old, new, kwargs in cases:
+        old_time = _measure(old, numbers, **kwargs)
+        new_time = _measure(new, numbers, **kwargs)
+        print(
+            f"{name:<22} строки: {old_time:6.3f} c  таблица: {new_time:6.3f} c"
+            f"  ускорение: x{old_time / new_time:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,55 @@
+"""Время подготовки документа CustomPDF со всеми пятью шрифтами:
+разбор TTF в каждом документе (add_font) против реестра шрифтов.
+
+Запуск: python -m benchmarks.bench_font_registry [документов]
+"""
+
+import sys
+import time
+
+from config.settings import FONTS
+from utils.pdf_utility import CustomPDF
+
+
+class LegacyPDF(CustomPDF):
+    """CustomPDF с прежним добавлением шрифтов через add_font"""
+
+    def __init__(self) -> None:
+        super(CustomPDF, self).__init__(orientation="P", unit="mm", format="a4")
+        self._needs_background = False
+        self._background_color = (0, 0, 0)
+        for family, path in FONTS.items():
+            self.add_font(family, "", str(path))
+
+
+def _with_fonts(factory) -> CustomPDF:
+    pdf = factory()
+    for family in FONTS:
+        pdf.set_font(family, size=12)
+    return pdf
+
+
+def _per_document(factory, count: int) -> float:
+    began = time.perf_counter()
+    for _ in range(count):
+        _with_fonts(factory)
+    return (time.perf_counter() - began) / count * 1000
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+    # первый документ разбирает шрифты в реестре
+    began = time.perf_counter()
+    _with_fonts(CustomPDF)
+    first = (time.perf_counter() - began) * 1000
+
+    legacy = _per_document(LegacyPDF, count)
+    registry = _per_document(CustomPDF, count)
+    print(f"add_font в каждом документе: {legacy:8.2f} мс на документ")
+    print(f"реестр шрифтов:             {registry:8.2f} мс на документ"
+          f" (первый документ {first:.2f} мс)")
+
+
+if __name__ == "__main__":
+    main()
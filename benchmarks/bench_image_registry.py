@@ -0,0 +1,47 @@
+"""Время вставки шаблонов в документ: чтение JPEG с диска в каждом
+документе (FPDF.image с путем) против общего кэша шаблонов.
+
+Запуск: python -m benchmarks.bench_image_registry [документов]
+"""
+
+import sys
+import time
+
+from fpdf import FPDF
+
+from config.settings import PITHAGORIAN_TABLE, TRIANGLES
+from utils.image_registry import preload_templates, register_image
+
+# пять страниц отчета triangles и таблица Пифагора
+TEMPLATES = [
+    TRIANGLES[name]
+    for name in ("personality", "spirituality", "money", "relationship", "health")
+] + [PITHAGORIAN_TABLE["jpg"]]
+
+
+def _per_document(image, count: int) -> float:
+    began = time.perf_counter()
+    for _ in range(count):
+        pdf = FPDF()
+        for template in TEMPLATES:
+            pdf.add_page()
+            pdf.image(image(pdf, template), x=0, y=0, w=pdf.w)
+    return (time.perf_counter() - began) / count * 1000
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    began = time.perf_counter()
+    preload_templates()
+    first = (time.perf_counter() - began) * 1000
+
+    from_file = _per_document(lambda pdf, template: str(template), count)
+    cached = _per_document(register_image, count)
+    print(f"чтение файлов в каждом документе: {from_file:8.2f} мс на документ")
+    print(f"кэш шаблонов:                     {cached:8.2f} мс на документ"
+          f" (чтение всех шаблонов {first:.2f} мс)")
+
+
+if __name__ == "__main__":
+    main()
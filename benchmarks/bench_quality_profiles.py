@@ -0,0 +1,72 @@
+"""Размер и время создания отчетов каждого типа по профилям качества
+шаблонов (print, screen, preview).
+
+Запуск: python -m benchmarks.bench_quality_profiles [повторов]
+"""
+
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from typing import get_args
+
+from business_logic.arcanes_classes import ChartProfile, Client
+from src import reports_collection
+from utils.template_profiles import ProfileType, build_variants
+
+REPORTS = {
+    "fullstar": lambda clients, quality: (
+        reports_collection.create_fullstar_report(clients[0], quality=quality)),
+    "triangles": lambda clients, quality: (
+        reports_collection.collect_triangles_adult(
+            clients[0], quality=quality)),
+    "predict": lambda clients, quality: (
+        reports_collection.collect_predict_report(clients[0], quality=quality)),
+    "pythagorian": lambda clients, quality: (
+        reports_collection.create_pythagorian_table(
+            clients[0], quality=quality)),
+    "couple": lambda clients, quality: (
+        reports_collection.create_couple_report(clients, quality=quality)),
+}
+
+
+def _measure(report, profiles, quality, repeat: int) -> tuple[float, int]:
+    began = time.perf_counter()
+    for _ in range(repeat):
+        result = report(profiles, quality)
+    elapsed = (time.perf_counter() - began) / repeat * 1000
+    paths = result if isinstance(result, list) else [result]
+    return elapsed, sum(Path(path).stat().st_size for path in paths)
+
+
+def main() -> None:
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    profiles = [
+        ChartProfile(Client("John", date(1963, 12, 7), "M")),
+        ChartProfile(Client("Jul", date(1982, 7, 23), "F")),
+    ]
+    qualities = get_args(ProfileType)
+
+    began = time.perf_counter()
+    build_variants(force=True)
+    print(f"сборка вариантов шаблонов: {time.perf_counter() - began:.2f} с")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        reports_collection.OUTPUT_PATH = Path(tmp_dir)
+        # первый документ разбирает шрифты и читает шаблоны, в замеры не входит
+        for quality in qualities:
+            for report in REPORTS.values():
+                report(profiles, quality)
+
+        print(f"{'отчет':<12}" + "".join(f"{q:>22}" for q in qualities))
+        for name, report in REPORTS.items():
+            row = f"{name:<12}"
+            for quality in qualities:
+                elapsed, size = _measure(report, profiles, quality, repeat)
+                row += f" {size / 1024:9.1f} КБ {elapsed:6.1f} мс"
+            print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Размер и время создания отчетов каждого типа: все пять шрифтов
+через add_font против ленивой регистрации облегченных шрифтов.
+
+Запуск: python -m benchmarks.bench_report_fonts
+"""
+
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+from benchmarks.bench_font_registry import LegacyPDF
+from business_logic.arcanes_classes import ChartProfile, Client
+from src import reports_collection
+from utils import pdf_creator
+from utils.pdf_utility import CustomPDF
+
+REPORTS = {
+    "fullstar": lambda profiles: reports_collection.create_fullstar_report(
+        profiles[0]),
+    "triangles": lambda profiles: reports_collection.collect_triangles_adult(
+        profiles[0]),
+    "predict": lambda profiles: reports_collection.collect_predict_report(
+        profiles[0]),
+    "pythagorian": lambda profiles: reports_collection.create_pythagorian_table(
+        profiles[0]),
+    "couple": lambda profiles: reports_collection.create_couple_report(profiles),
+}
+
+
+def _measure(pdf_class, report, profiles) -> tuple[float, int]:
+    pdf_creator.CustomPDF = pdf_class
+    began = time.perf_counter()
+    result = report(profiles)
+    elapsed = (time.perf_counter() - began) * 1000
+    paths = result if isinstance(result, list) else [result]
+    return elapsed, sum(Path(path).stat().st_size for path in paths)
+
+
+def main() -> None:
+    profiles = [
+        ChartProfile(Client(name="John", birthday=date(1963, 12, 7), gender="M")),
+        ChartProfile(Client(name="Jul", birthday=date(1982, 7, 23), gender="F")),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        reports_collection.OUTPUT_PATH = Path(tmp_dir)
+        # первый документ разбирает шрифты реестра, в замеры не входит
+        reports_collection.create_couple_report(profiles)
+
+        print(f"{'отчет':<12} {'add_font':>22} {'реестр':>22}")
+        for name, report in REPORTS.items():
+            legacy_time, legacy_size = _measure(LegacyPDF, report, profiles)
+            time_, size = _measure(CustomPDF, report, profiles)
+            print(
+                f"{name:<12} {legacy_size / 1024:9.1f} КБ {legacy_time:7.1f} мс"
+                f" {size / 1024:9.1f} КБ {time_:7.1f} мс"
+                f"  (-{(legacy_size - size) / 1024:.1f} КБ)"
+            )
+
+    pdf_creator.CustomPDF = CustomPDF
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Построение обратного индекса комбинаций и время запросов.
+
+Запуск: python -m benchmarks.bench_triples_index [количество клиентов]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from data_requests.triples_index import TriplesIndex
+
+
+def main(count: int = 1_000_000) -> None:
+    rng = np.random.default_rng(0)
+    start = np.datetime64("1930-01-01")
+    birthdays = start + rng.integers(0, 80 * 365, size=count).astype(
+        "timedelta64[D]")
+    client_ids = np.arange(count)
+
+    index = TriplesIndex()
+    began = time.perf_counter()
+    half = count // 2
+    index.add_clients(client_ids[:half], birthdays[:half])
+    index.add_clients(client_ids[half:], birthdays[half:])
+    print(f"индекс {count:,} клиентов: {time.perf_counter() - began:.2f} с")
+
+    for combination, name in (
+        ("18-6-6", "Треугольник Личность"),
+        ("6-5", None),
+        ("3-6-9", "Треугольник Отношения"),
+    ):
+        began = time.perf_counter()
+        found = index.query(combination, name)
+        elapsed = (time.perf_counter() - began) * 1000
+        print(
+            f"{combination:<7} {name or 'любая тройка':<24}"
+            f" {len(found):>8,} клиентов за {elapsed:7.3f} мс"
+        )
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
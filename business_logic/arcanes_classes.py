@@ -1,12 +1,17 @@
 # business_logic/arcanes_classes.py
 from dataclasses import dataclass
 from datetime import date
-from functools import cached_property
-from typing import Dict, Literal, OrderedDict, Tuple
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Dict, Literal, Mapping, NamedTuple, OrderedDict, Tuple
 
 from loguru import logger
 
-ScenarioType = Literal["adult", "child", "couple"]
+from business_logic.chart_cache import chart_cache
+from business_logic.render_payload import RenderPayload
+from utils.transform_utils import format_pythagorian_cell
+
+ScenarioType = Literal["adult", "child", "couple", "group"]
 GenderType = Literal["M", "F"]
 PointerType = Literal["personality", "spirituality",
                       "money", "relationship", "health"]
@@ -20,6 +25,81 @@ TRIANGLES_NAMES: list[PointerType] = [
     "health",
 ]
 
+MAIN_STAR_FIELDS: tuple[str, ...] = tuple(TRIANGLES_NAMES)
+ERROR_STAR_FIELDS: tuple[str, ...] = tuple(
+    f"err_{name}" for name in TRIANGLES_NAMES)
+MISSION_STAR_FIELDS: tuple[str, ...] = (
+    "mission", "mission_error", "mission_full")
+FOOTER_STAR_FIELDS: tuple[str, ...] = tuple(
+    f"foot_{name}" for name in TRIANGLES_NAMES)
+TRIANGLE_FIELDS: tuple[str, ...] = (
+    "vertex",
+    "left_vertex",
+    "right_vertex",
+    "inverted_vertex",
+    "inverted_left_vertex",
+    "inverted_right_vertex",
+    "left_middle_vertex",
+    "right_middle_vertex",
+)
+
+# Все арканы карты клиента, зависящие только от даты рождения.
+# Поля треугольников именуются f"{pointer}_{field}"
+CHART_FIELDS: tuple[str, ...] = (
+    MAIN_STAR_FIELDS
+    + ERROR_STAR_FIELDS
+    + MISSION_STAR_FIELDS
+    + FOOTER_STAR_FIELDS
+    + tuple(
+        f"{pointer}_{field}"
+        for pointer in TRIANGLES_NAMES
+        for field in TRIANGLE_FIELDS
+    )
+)
+
+CHART_INDEX: Dict[str, int] = {
+    field: idx for idx, field in enumerate(CHART_FIELDS)}
+# Позиция заголовка страницы в ChartProfile.row
+HEADER_INDEX: int = len(CHART_FIELDS)
+
+
+# Арканы основной шкалы отчета predict (main_1..main_20) по кругу
+DIAL_MAIN_FIELDS: tuple[str, ...] = (
+    "personality",
+    "personality_inverted_right_vertex",
+    "err_personality",
+    "spirituality_inverted_left_vertex",
+    "spirituality",
+    "spirituality_inverted_right_vertex",
+    "err_spirituality",
+    "money_inverted_left_vertex",
+    "money",
+    "money_inverted_right_vertex",
+    "err_money",
+    "relationship_inverted_left_vertex",
+    "relationship",
+    "relationship_inverted_right_vertex",
+    "err_relationship",
+    "health_inverted_left_vertex",
+    "health",
+    "health_inverted_right_vertex",
+    "err_health",
+    "personality_inverted_left_vertex",
+)
+
+# 80 позиций шкалы: основной аркан и три промежуточных после него
+DIAL_KEYS: tuple[str, ...] = tuple(
+    key
+    for idx in range(1, len(DIAL_MAIN_FIELDS) + 1)
+    for key in (
+        f"main_{idx}",
+        f"inner_main_{idx}_left",
+        f"inner_main_{idx}_middle",
+        f"inner_main_{idx}_right",
+    )
+)
+DIAL_INDEX: Dict[str, int] = {key: idx for idx, key in enumerate(DIAL_KEYS)}
+
 
 @dataclass
 class Client:
@@ -58,11 +138,14 @@ class MainStar:
     def health(self) -> int:
         return digital_root(2 * self.relationship)
 
-    def to_dict(self) -> dict[str, str]:
+    @cached_property
+    def header_text(self) -> str:
         formatted_birthdate = self.client_info.birthday.strftime("%d.%m.%y")
+        return f"{self.client_info.name} {formatted_birthdate}"
 
+    def to_dict(self) -> dict[str, str]:
         return {
-            "header_text": f"{self.client_info.name} {formatted_birthdate}",
+            "header_text": self.header_text,
             "personality": str(self.personality),
             "spirituality": str(self.spirituality),
             "money": str(self.money),
@@ -179,46 +262,36 @@ class FooterStar:
         }
 
 
+# Вершины треугольника: аркан звезды (вершина) и две соседние ошибки
+# (левая и правая вершины) для каждого поинтера
+TRIANGLE_VERTICES: Dict[PointerType, Tuple[str, str, str]] = {
+    "personality": ("personality", "err_health", "err_personality"),
+    "spirituality": ("spirituality", "err_personality", "err_spirituality"),
+    "money": ("money", "err_spirituality", "err_money"),
+    "relationship": ("relationship", "err_money", "err_relationship"),
+    "health": ("health", "err_relationship", "err_health"),
+}
+
+
 @dataclass(frozen=True)
 class Triangle:
     star: MainStar
     err: ErrorStar
     pointer: PointerType
 
-    @cached_property
-    def vertex_data(self) -> Tuple[int, int, int]:
-        mapping: Dict[PointerType, Tuple[int, int, int]] = {
-            "personality": (
-                self.star.personality,
-                self.err.err_health,
-                self.err.err_personality,
-            ),
-            "spirituality": (
-                self.star.spirituality,
-                self.err.err_personality,
-                self.err.err_spirituality,
-            ),
-            "money": (
-                self.star.money,
-                self.err.err_spirituality,
-                self.err.err_money,
-            ),
-            "relationship": (
-                self.star.relationship,
-                self.err.err_money,
-                self.err.err_relationship,
-            ),
-            "health": (
-                self.star.health,
-                self.err.err_relationship,
-                self.err.err_health,
-            ),
-        }
-        if self.pointer not in mapping:
+    def __post_init__(self) -> None:
+        if self.pointer not in TRIANGLE_VERTICES:
             logger.error(f"Недопустимый поинтер {self.pointer}")
             raise ValueError(f"Недопустимый поинтер {self.pointer}")
 
-        return mapping[self.pointer]
+    @cached_property
+    def vertex_data(self) -> Tuple[int, int, int]:
+        star_key, left_key, right_key = TRIANGLE_VERTICES[self.pointer]
+        return (
+            getattr(self.star, star_key),
+            getattr(self.err, left_key),
+            getattr(self.err, right_key),
+        )
 
     @cached_property
     def vertex(self) -> int:
@@ -282,6 +355,103 @@ class Triangle:
         }
 
 
+class TriangleRow(NamedTuple):
+    """Арканы одного треугольника в порядке TRIANGLE_FIELDS"""
+
+    vertex: int
+    left_vertex: int
+    right_vertex: int
+    inverted_vertex: int
+    inverted_left_vertex: int
+    inverted_right_vertex: int
+    left_middle_vertex: int
+    right_middle_vertex: int
+
+
+TRIANGLES_INDEX: Dict[PointerType, int] = {
+    pointer: idx for idx, pointer in enumerate(TRIANGLES_NAMES)
+}
+
+
+@dataclass(frozen=True)
+class TriangleSet:
+    """Все пять треугольников карты, рассчитанные за один проход"""
+
+    star: MainStar
+    err: ErrorStar
+
+    @cached_property
+    def rows(self) -> Tuple[TriangleRow, ...]:
+        rows = []
+        for pointer in TRIANGLES_NAMES:
+            star_key, left_key, right_key = TRIANGLE_VERTICES[pointer]
+            vertex = getattr(self.star, star_key)
+            left_vertex = getattr(self.err, left_key)
+            right_vertex = getattr(self.err, right_key)
+
+            inverted_vertex = digital_root(left_vertex + right_vertex)
+            inverted_left_vertex = digital_root(left_vertex + vertex)
+            inverted_right_vertex = digital_root(right_vertex + vertex)
+            rows.append(
+                TriangleRow(
+                    vertex=vertex,
+                    left_vertex=left_vertex,
+                    right_vertex=right_vertex,
+                    inverted_vertex=inverted_vertex,
+                    inverted_left_vertex=inverted_left_vertex,
+                    inverted_right_vertex=inverted_right_vertex,
+                    left_middle_vertex=digital_root(
+                        inverted_left_vertex + inverted_right_vertex
+                    ),
+                    right_middle_vertex=digital_root(
+                        vertex + inverted_vertex),
+                )
+            )
+
+        return tuple(rows)
+
+    def __getitem__(self, pointer: PointerType) -> TriangleRow:
+        index = TRIANGLES_INDEX.get(pointer)
+        if index is None:
+            logger.error(f"Недопустимый поинтер {pointer}")
+            raise ValueError(f"Недопустимый поинтер {pointer}")
+
+        return self.rows[index]
+
+    def to_dict(self, pointer: PointerType) -> Dict[str, str]:
+        row = self[pointer]
+        return {
+            field: str(value) for field, value in zip(TRIANGLE_FIELDS, row)
+        }
+
+    def to_dict_inverted(
+        self, pointers: list[PointerType] = TRIANGLES_NAMES
+    ) -> Dict[str, str]:
+        result = {}
+        for pointer in pointers:
+            row = self[pointer]
+            result[f"{pointer}_inverted_vertex"] = str(row.inverted_vertex)
+            result[f"{pointer}_inverted_left_vertex"] = str(
+                row.inverted_left_vertex)
+            result[f"{pointer}_inverted_right_vertex"] = str(
+                row.inverted_right_vertex
+            )
+        return result
+
+    def to_dict_predicted(
+        self, pointers: list[PointerType] = TRIANGLES_NAMES
+    ) -> Dict[str, str]:
+        result = {}
+        for pointer in pointers:
+            row = self[pointer]
+            result[f"{pointer}_inverted_left_vertex"] = str(
+                row.inverted_left_vertex)
+            result[f"{pointer}_inverted_right_vertex"] = str(
+                row.inverted_right_vertex
+            )
+        return result
+
+
 @dataclass(frozen=True)
 class PythagorianTable:
     client_info: Client
@@ -327,38 +497,78 @@ class PythagorianTable:
         else:
             return digital_root(self.number_4, arcanes_number=9)
 
-    def to_dict(self) -> dict[str, str]:
-        all_numbers = "".join(
-            [
-                str(self.number_1),
-                str(self.number_2),
-                str(self.number_3),
-                str(self.number_4),
-                str(self.number_5),
-            ]
+    @cached_property
+    def digit_counts(self) -> Tuple[int, ...]:
+        """Количество цифр 1..9 в числах number_1..number_5"""
+        return digit_histogram(
+            (
+                self.number_1,
+                self.number_2,
+                self.number_3,
+                self.number_4,
+                self.number_5,
+            )
         )
-        logger.debug(f"{all_numbers=}")
+
+    @cached_property
+    def line_sums(self) -> Dict[str, int]:
+        """Суммы ячеек строк, столбцов и диагоналей по PYTHAGORIAN_LINES"""
+        counts = self.digit_counts
+        return {
+            name: sum(counts[digit - 1] for digit in digits)
+            for name, digits in PYTHAGORIAN_LINES.items()
+        }
+
+    def to_extended_dict(self) -> dict[str, int]:
+        """Ячейки "1".."9" и суммы линий таблицы числами"""
+        cells = {str(d): count for d, count in enumerate(self.digit_counts, 1)}
+        return cells | self.line_sums
+
+    def to_payload(self) -> RenderPayload:
+        """Количество цифр по ключам "1".."9" для отрисовки таблицы"""
+        return RenderPayload(self.digit_counts, PYTHAGORIAN_INDEX)
+
+    def to_dict(self) -> dict[str, str]:
         result = OrderedDict()
-        for d in range(1, 10):
-            count_d = all_numbers.count(str(d))
-            result[str(d)] = str(d) * count_d if count_d else "—"
+        for d, count_d in enumerate(self.digit_counts, start=1):
+            result[str(d)] = format_pythagorian_cell(d, count_d)
 
         return result
 
 
-def combine_couple_star(star1: MainStar, star2: MainStar) -> dict[str, str]:
+PYTHAGORIAN_INDEX: Dict[str, int] = {str(d): d - 1 for d in range(1, 10)}
+
+# Линии таблицы в порядке отрисовки build_pythagorian_context:
+# цифры 1..9 заполняют квадрат 3x3 по строкам
+PYTHAGORIAN_LINES: Dict[str, Tuple[int, ...]] = {
+    "row_1": (1, 2, 3),
+    "row_2": (4, 5, 6),
+    "row_3": (7, 8, 9),
+    "column_1": (1, 4, 7),
+    "column_2": (2, 5, 8),
+    "column_3": (3, 6, 9),
+    "diagonal": (1, 5, 9),
+    "anti_diagonal": (3, 5, 7),
+}
+
+
+def digit_histogram(numbers: Tuple[int, ...]) -> Tuple[int, ...]:
+    """Количество цифр 1..9 в записи чисел (знак минуса не учитывается)"""
+    counts = [0] * 10
+    for number in numbers:
+        number = abs(number)
+        while number:
+            number, digit = divmod(number, 10)
+            counts[digit] += 1
+    return tuple(counts[1:])
+
+
+def combine_couple_star(star1: MainStar, star2: MainStar) -> dict[str, int | str]:
     """создание звезды для пары клиентов"""
 
-    attributes = [
-        "personality",
-        "spirituality",
-        "money",
-        "relationship",
-        "health",
-    ]
-    combined_attrs = {
-        attr: str(digital_root(getattr(star1, attr) + getattr(star2, attr)))
-        for attr in attributes
+    combined_attrs: dict[str, int | str] = {
+        attr: digital_root(getattr(star1, attr) + getattr(star2, attr))
+        for attr in MAIN_STAR_FIELDS
     }
     header = f"{star1.client_info.name} + {star2.client_info.name}"
     combined_attrs["header_text"] = header
@@ -366,107 +576,216 @@ def combine_couple_star(star1: MainStar, star2: MainStar) -> dict[str, str]:
     return combined_attrs
 
 
+@dataclass(frozen=True)
+class ChartProfile:
+    """Арканы клиента, рассчитанные один раз для всех отчетов блока"""
+
+    client_info: Client
+
+    @cached_property
+    def mainstar(self) -> MainStar:
+        return MainStar(client_info=self.client_info)
+
+    @cached_property
+    def errorstar(self) -> ErrorStar:
+        return ErrorStar(star=self.mainstar)
+
+    @cached_property
+    def missionstar(self) -> MissionStar:
+        return MissionStar(star=self.mainstar, error=self.errorstar)
+
+    @cached_property
+    def footerstar(self) -> FooterStar:
+        return FooterStar(client_info=self.client_info)
+
+    @cached_property
+    def triangles(self) -> TriangleSet:
+        return TriangleSet(star=self.mainstar, err=self.errorstar)
+
+    @cached_property
+    def pythagorian_table(self) -> PythagorianTable:
+        return PythagorianTable(client_info=self.client_info)
+
+    @cached_property
+    def values(self) -> Mapping[str, int]:
+        """Все арканы карты по ключам CHART_FIELDS.
+        Берутся из общего кэша по дате рождения, если он включен."""
+        return chart_cache.get(self.client_info.birthday, self._compute_values)
+
+    def _compute_values(self) -> Mapping[str, int]:
+        values: Dict[str, int] = {}
+        for source, fields in (
+            (self.mainstar, MAIN_STAR_FIELDS),
+            (self.errorstar, ERROR_STAR_FIELDS),
+            (self.missionstar, MISSION_STAR_FIELDS),
+            (self.footerstar, FOOTER_STAR_FIELDS),
+        ):
+            for field in fields:
+                values[field] = getattr(source, field)
+
+        for pointer, row in zip(TRIANGLES_NAMES, self.triangles.rows):
+            for field, value in zip(TRIANGLE_FIELDS, row):
+                values[f"{pointer}_{field}"] = value
+
+        # значения общие для всех клиентов с той же датой рождения
+        return MappingProxyType(values)
+
+    @cached_property
+    def row(self) -> Tuple[int | str, ...]:
+        """Арканы в порядке CHART_FIELDS и заголовок (HEADER_INDEX)"""
+        return (*self.values.values(), self.mainstar.header_text)
+
+
+@lru_cache(maxsize=None)
+def _page_index(
+    fields: Tuple[str, ...], header: bool = False
+) -> Dict[str, int]:
+    """Индекс страницы: ключ элемента -> позиция в ChartProfile.row"""
+    index = {"header_text": HEADER_INDEX} if header else {}
+    index.update((field, CHART_INDEX[field]) for field in fields)
+    return index
+
+
+def _inverted_fields(pointers: list[PointerType]) -> Tuple[str, ...]:
+    return tuple(
+        f"{pointer}_{field}"
+        for pointer in pointers
+        for field in (
+            "inverted_vertex",
+            "inverted_left_vertex",
+            "inverted_right_vertex",
+        )
+    )
+
+
+def get_fullstar(
+    profile: ChartProfile, pointers: list[PointerType] = TRIANGLES_NAMES
+) -> RenderPayload:
+    """Данные страницы Полная звезда"""
+    fields = (
+        MAIN_STAR_FIELDS
+        + MISSION_STAR_FIELDS
+        + ERROR_STAR_FIELDS
+        + FOOTER_STAR_FIELDS
+        + _inverted_fields(pointers)
+    )
+    return RenderPayload(profile.row, _page_index(fields, header=True))
+
+
 def get_inner_star(
-    client_info: Client, pointers: list[PointerType] = TRIANGLES_NAMES
-) -> dict[str, str]:
-    mainstar = MainStar(client_info=client_info)
-    errorstar = ErrorStar(star=mainstar)
-    inner_star: dict = {
-        **mainstar.to_dict(),
-        **errorstar.to_dict(),
-    }
-    if "header_text" in inner_star:
-        del inner_star["header_text"]
-
-    for pointer in pointers:
-        triangles = Triangle(
-            star=mainstar, err=errorstar, pointer=pointer
-        ).to_dict_inverted()
-        inner_star = inner_star | triangles
-
-    return inner_star
-
-
-def get_full_dial(
-    client_info: Client, pointers: list[PointerType] = TRIANGLES_NAMES
-) -> dict[str, str]:
-    mainstar = MainStar(client_info=client_info)
-    errorstar = ErrorStar(star=mainstar)
-    main_dial: dict = {
-        **mainstar.to_dict(),
-        **errorstar.to_dict(),
+    profile: ChartProfile, pointers: list[PointerType] = TRIANGLES_NAMES
+) -> RenderPayload:
+    """Данные звезды страницы predict (без заголовка)"""
+    fields = MAIN_STAR_FIELDS + ERROR_STAR_FIELDS + _inverted_fields(pointers)
+    return RenderPayload(profile.row, _page_index(fields))
+
+
+def get_triangle(profile: ChartProfile, pointer: PointerType) -> RenderPayload:
+    """Данные страницы треугольника: ключи как в Triangle.to_dict"""
+    if pointer not in TRIANGLE_VERTICES:
+        logger.error(f"Недопустимый поинтер {pointer}")
+        raise ValueError(f"Недопустимый поинтер {pointer}")
+
+    return RenderPayload(profile.row, _triangle_index(pointer))
+
+
+@lru_cache(maxsize=None)
+def _triangle_index(pointer: PointerType) -> Dict[str, int]:
+    return {
+        field: CHART_INDEX[f"{pointer}_{field}"] for field in TRIANGLE_FIELDS
     }
-    if "header_text" in main_dial:
-        del main_dial["header_text"]
-
-    for pointer in pointers:
-        triangles = Triangle(
-            star=mainstar, err=errorstar, pointer=pointer
-        ).to_dict_predicted()
-        main_dial = main_dial | triangles
-
-    key_mapping = [
-        ("personality", "main_1"),
-        ("personality_inverted_right_vertex", "main_2"),
-        ("err_personality", "main_3"),
-        ("spirituality_inverted_left_vertex", "main_4"),
-        ("spirituality", "main_5"),
-        ("spirituality_inverted_right_vertex", "main_6"),
-        ("err_spirituality", "main_7"),
-        ("money_inverted_left_vertex", "main_8"),
-        ("money", "main_9"),
-        ("money_inverted_right_vertex", "main_10"),
-        ("err_money", "main_11"),
-        ("relationship_inverted_left_vertex", "main_12"),
-        ("relationship", "main_13"),
-        ("relationship_inverted_right_vertex", "main_14"),
-        ("err_relationship", "main_15"),
-        ("health_inverted_left_vertex", "main_16"),
-        ("health", "main_17"),
-        ("health_inverted_right_vertex", "main_18"),
-        ("err_health", "main_19"),
-        ("personality_inverted_left_vertex", "main_20"),
-    ]
-
-    new_main_dial = OrderedDict()
-    for old_key, new_key in key_mapping:
-        if old_key in main_dial:
-            new_main_dial[new_key] = main_dial[old_key]
-
-    full_dial = count_dial_data(new_main_dial)
 
-    return full_dial
 
+def get_full_dial(profile: ChartProfile) -> RenderPayload:
+    """Шкала отчета predict: 80 арканов по ключам DIAL_KEYS.
+    Значения остаются числами и форматируются при отрисовке."""
+    values = profile.values
+    ring = count_dial_data([values[field] for field in DIAL_MAIN_FIELDS])
 
-def count_dial_data(dial: dict) -> dict[str, str]:
+    return RenderPayload(ring, DIAL_INDEX)
+
+
+def count_dial_data(main_dial: list[int]) -> list[int]:
     """Создание данных для заполнения промежуточных данных шкалы
-    в отчете predict"""
+    в отчете predict.
+
+    Args:
+        main_dial (list[int]): 20 арканов основной шкалы
+    Returns:
+        list[int]: 80 арканов шкалы: каждый основной аркан и три
+        промежуточных (left, middle, right) до следующего по кругу
+    """
+    full_dial = []
+    for current, following in zip(main_dial, main_dial[1:] + main_dial[:1]):
+        middle = digital_root(current + following)
+        left = digital_root(current + middle)
+        right = digital_root(following + middle)
 
-    keys = list(dial.keys())
-    full_dial = OrderedDict()
-    for i in range(len(keys)):
-        current_key = keys[i]
-        next_key = keys[(i + 1) % len(keys)]
+        full_dial.extend((current, left, middle, right))
+    return full_dial
 
-        full_dial[current_key] = dial[current_key]
 
-        left_key = f"inner_{current_key}_left"
-        middle_key = f"inner_{current_key}_middle"
-        right_key = f"inner_{current_key}_right"
+# Размер таблиц сумм цифр и редукции: покрывает все годы до 9999
+# и любые промежуточные суммы арканов. Числа больше сворачиваются
+# арифметически по блокам из четырех цифр.
+_TABLE_SIZE = 10_000
 
-        middle = digital_root(int(dial[current_key]) + int(dial[next_key]))
-        left = digital_root(int(dial[current_key]) + middle)
-        right = digital_root(int(dial[next_key]) + middle)
+_DIGIT_SUMS: tuple[int, ...] = tuple(
+    n // 1000 + n // 100 % 10 + n // 10 % 10 + n % 10 for n in range(_TABLE_SIZE)
+)
+
+# Таблицы редукции по максимальному числу арканов, строятся по требованию
+_REDUCTION_TABLES: dict[int, tuple[int, ...]] = {}
+
+# Метка значения, на котором строковый алгоритм зацикливается
+# (однозначное число больше arcanes_number < 9)
+_NO_ROOT = -1
 
-        full_dial[left_key] = str(left)
-        full_dial[middle_key] = str(middle)
-        full_dial[right_key] = str(right)
-    return full_dial
+
+def _digit_sum(num: int) -> int:
+    """Сумма цифр неотрицательного числа без преобразования в строку."""
+    total = 0
+    while num >= _TABLE_SIZE:
+        num, rest = divmod(num, _TABLE_SIZE)
+        total += _DIGIT_SUMS[rest]
+
+    return total + _DIGIT_SUMS[num]
+
+
+def reduction_table(arcanes_number: int = 22) -> tuple[int, ...]:
+    """Возвращает таблицу числовых корней для чисел 0.._TABLE_SIZE-1.
+
+    Args:
+        arcanes_number (int, optional): Максимальное количество арканов.
+         Defaults to 22.
+    Returns:
+        tuple[int, ...]: значение по индексу n равно digital_root(n)
+    """
+    table = _REDUCTION_TABLES.get(arcanes_number)
+    if table is not None:
+        return table
+
+    values: list[int] = []
+    for n in range(_TABLE_SIZE):
+        if n <= arcanes_number:
+            values.append(n)
+        elif n < 10:
+            values.append(_NO_ROOT)
+        else:
+            # сумма цифр n меньше n, поэтому уже посчитана
+            values.append(values[_DIGIT_SUMS[n]])
+
+    table = tuple(values)
+    _REDUCTION_TABLES[arcanes_number] = table
+    return table
 
 
 def simple_digital_root(num: int) -> int:
     """Рассчитывает числовой корень из суммы цифр входящего числа."""
-    return sum(int(d) for d in str(num))
+    if num < 0:
+        raise ValueError(f"Недопустимое отрицательное число {num}")
+
+    return _digit_sum(num)
 
 
 def digital_root(num: int, arcanes_number: int = 22) -> int:
@@ -478,9 +797,16 @@ def digital_root(num: int, arcanes_number: int = 22) -> int:
     Returns:
         int: числовой корень
     """
-    number = num
+    if num <= arcanes_number:
+        return num
+
+    while num >= _TABLE_SIZE:
+        num = _digit_sum(num)
 
-    while number > arcanes_number:
-        number = sum(int(d) for d in str(number))
+    number = reduction_table(arcanes_number)[num]
+    if number == _NO_ROOT:
+        logger.error(f"Числовой корень {num} не сводится к {arcanes_number}")
+        raise ValueError(
+            f"Числовой корень {num} не сводится к {arcanes_number}")
 
     return number
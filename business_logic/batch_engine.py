@@ -0,0 +1,233 @@
+# business_logic/batch_engine.py
+"""Векторный расчет арканов для массивов дат рождения.
+
+Результаты совпадают со скалярными классами arcanes_classes.py,
+но считаются сразу для всех клиентов в виде структуры массивов:
+словаря {поле CHART_FIELDS: np.ndarray}.
+"""
+
+from datetime import date
+from typing import Sequence
+
+import numpy as np
+
+from business_logic.arcanes_classes import (
+    CHART_FIELDS,
+    DIAL_MAIN_FIELDS,
+    PYTHAGORIAN_LINES,
+    TRIANGLES_NAMES,
+    reduction_table,
+)
+
+# Тип массивов с результатами: все арканы помещаются в байт
+CHART_DTYPE = np.uint8
+
+# Таблицы редукции в виде массивов numpy по максимальному числу арканов
+_ARRAY_TABLES: dict[int, np.ndarray] = {}
+
+
+def digital_root_array(values: np.ndarray, arcanes_number: int = 22) -> np.ndarray:
+    """Векторный аналог digital_root для массивов чисел 0..9999.
+
+    Args:
+        values (np.ndarray): массив неотрицательных чисел меньше 10000
+        arcanes_number (int, optional): Максимальное количество арканов.
+         Defaults to 22.
+    Returns:
+        np.ndarray: массив числовых корней
+    """
+    table = _ARRAY_TABLES.get(arcanes_number)
+    if table is None:
+        table = np.asarray(reduction_table(arcanes_number), dtype=np.int16)
+        _ARRAY_TABLES[arcanes_number] = table
+
+    return table[values]
+
+
+def split_birthdays(
+    birthdays: np.ndarray | Sequence[date],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Раскладывает массив дат на дни, месяцы и годы.
+
+    Args:
+        birthdays (np.ndarray | Sequence[date]): массив datetime64
+            или последовательность объектов date
+    Returns:
+        tuple: массивы (day, month, year) типа int64
+    """
+    dates = np.asarray(birthdays, dtype="datetime64[D]")
+    months_start = dates.astype("datetime64[M]")
+
+    day = (dates - months_start).astype(np.int64) + 1
+    month = months_start.astype(np.int64) % 12 + 1
+    year = dates.astype("datetime64[Y]").astype(np.int64) + 1970
+
+    return day, month, year
+
+
+def compute_charts(
+    birthdays: np.ndarray | Sequence[date],
+) -> dict[str, np.ndarray]:
+    """Рассчитывает все арканы звезд и треугольников за один проход.
+
+    Args:
+        birthdays (np.ndarray | Sequence[date]): даты рождения
+    Returns:
+        dict[str, np.ndarray]: массивы арканов по ключам CHART_FIELDS
+    """
+    day, month, year = split_birthdays(birthdays)
+    root = digital_root_array
+
+    # MainStar
+    personality = root(day)
+    spirituality = root(month)
+    money = root(year)
+    relationship = root(personality + spirituality + money)
+    health = root(2 * relationship)
+    star = [personality, spirituality, money, relationship, health]
+
+    # ErrorStar: сумма соседних вершин звезды
+    err = [root(star[i] + star[(i + 1) % 5]) for i in range(5)]
+
+    # MissionStar
+    mission = root(np.sum(np.stack(star), axis=0))
+    mission_error = root(np.sum(np.stack(err), axis=0))
+    mission_full = root(mission + mission_error)
+
+    # FooterStar
+    foot_personality = root(day, 9)
+    foot_spirituality = root(month, 9)
+    foot_money = root(year, 9)
+    foot_relationship = root(
+        foot_personality + foot_spirituality + foot_money, 9)
+    foot_health = root(2 * foot_relationship, 9)
+
+    columns: list[np.ndarray] = [
+        *star,
+        *err,
+        mission,
+        mission_error,
+        mission_full,
+        foot_personality,
+        foot_spirituality,
+        foot_money,
+        foot_relationship,
+        foot_health,
+    ]
+
+    # Triangle: вершина звезды и две соседние ошибки
+    for i, _ in enumerate(TRIANGLES_NAMES):
+        vertex = star[i]
+        left_vertex = err[i - 1]
+        right_vertex = err[i]
+        inverted_vertex = root(left_vertex + right_vertex)
+        inverted_left_vertex = root(left_vertex + vertex)
+        inverted_right_vertex = root(right_vertex + vertex)
+        left_middle_vertex = root(inverted_left_vertex + inverted_right_vertex)
+        right_middle_vertex = root(vertex + inverted_vertex)
+        columns.extend(
+            [
+                vertex,
+                left_vertex,
+                right_vertex,
+                inverted_vertex,
+                inverted_left_vertex,
+                inverted_right_vertex,
+                left_middle_vertex,
+                right_middle_vertex,
+            ]
+        )
+
+    return {
+        field: column.astype(CHART_DTYPE)
+        for field, column in zip(CHART_FIELDS, columns, strict=True)
+    }
+
+
+def stack_charts(charts: dict[str, np.ndarray]) -> np.ndarray:
+    """Собирает результаты compute_charts в матрицу (клиенты x CHART_FIELDS)"""
+    return np.column_stack([charts[field] for field in CHART_FIELDS])
+
+
+def compute_dials(charts: dict[str, np.ndarray]) -> np.ndarray:
+    """Рассчитывает шкалы отчета predict для всех клиентов сразу.
+
+    Args:
+        charts (dict[str, np.ndarray]): результат compute_charts
+    Returns:
+        np.ndarray: матрица (клиенты x 80) в порядке DIAL_KEYS
+    """
+    main = np.column_stack(
+        [charts[field] for field in DIAL_MAIN_FIELDS]).astype(np.int16)
+    # следующий основной аркан по кругу
+    following = np.roll(main, -1, axis=1)
+
+    middle = digital_root_array(main + following)
+    left = digital_root_array(main + middle)
+    right = digital_root_array(following + middle)
+
+    ring = np.stack([main, left, middle, right], axis=2)
+    return ring.reshape(len(main), -1).astype(CHART_DTYPE)
+
+
+def _digit_sum_array(values: np.ndarray) -> np.ndarray:
+    """Векторный аналог simple_digital_root для чисел 0..9999"""
+    return values // 1000 + values // 100 % 10 + values // 10 % 10 + values % 10
+
+
+def _reduce_to_nine(values: np.ndarray) -> np.ndarray:
+    """digital_root(num, arcanes_number=9): числа до 9 (в том числе
+    отрицательные) не меняются"""
+    reduced = digital_root_array(np.clip(values, 0, None), 9)
+    return np.where(values <= 9, values, reduced)
+
+
+def compute_pythagorian(birthdays: np.ndarray) -> dict[str, np.ndarray]:
+    """Рассчитывает таблицы Пифагора для массива дат рождения.
+
+    Правила number_1..number_5 совпадают с PythagorianTable, включая
+    ветку для дат до 2000 года.
+
+    Args:
+        birthdays (np.ndarray): массив дат рождения
+    Returns:
+        dict[str, np.ndarray]: числа "number_1".."number_5",
+        "digit_counts" - матрица (клиенты x цифры 1..9)
+        и суммы линий по ключам PYTHAGORIAN_LINES
+    """
+    day, month, year = split_birthdays(birthdays)
+    before_2000 = year < 2000
+
+    number_1 = _digit_sum_array(day) + _digit_sum_array(month) + _digit_sum_array(year)
+    number_2 = np.where(
+        np.isin(number_1, (11, 22, 33)), number_1, _reduce_to_nine(number_1))
+    # первая цифра дня: день 1..31
+    first_symbol = np.where(day >= 10, day // 10, day)
+    number_3 = np.where(before_2000, number_1 - 2 * first_symbol, 19)
+    number_4 = np.where(before_2000, _reduce_to_nine(number_3), number_1 + 19)
+    number_5 = np.where(before_2000, 0, _reduce_to_nine(number_4))
+    numbers = [number_1, number_2, number_3, number_4, number_5]
+
+    # гистограмма цифр: номера (клиент, цифра) всех разрядов пяти чисел
+    rows = np.arange(len(day)) * 10
+    cells = []
+    for number in numbers:
+        rest = np.abs(number)
+        while rest.any():
+            present = rest > 0
+            cells.append(rows[present] + rest[present] % 10)
+            rest = rest // 10
+    cells.append(np.empty(0, dtype=np.int64))
+    histogram = np.bincount(
+        np.concatenate(cells), minlength=len(day) * 10).reshape(-1, 10)
+    digit_counts = histogram[:, 1:].astype(CHART_DTYPE)
+
+    result: dict[str, np.ndarray] = {
+        f"number_{idx}": number.astype(np.int16)
+        for idx, number in enumerate(numbers, start=1)
+    }
+    result["digit_counts"] = digit_counts
+    for name, digits in PYTHAGORIAN_LINES.items():
+        columns = [digit - 1 for digit in digits]
+        result[name] = digit_counts[:, columns].sum(axis=1, dtype=np.int16)
+    return result
@@ -0,0 +1,207 @@
+# business_logic/calendar_engine.py
+"""Календарь личных арканов клиентов по дням и месяцам.
+
+Личные арканы периода строятся на арифметике MainStar:
+    personal_year  = digital_root(personality + spirituality + digital_root(год))
+    personal_month = digital_root(personal_year + месяц)
+    personal_day   = digital_root(personal_month + день)
+
+Весь диапазон дат считается одной операцией numpy для части клиентов,
+части выдаются генератором, поэтому память не зависит от размера списка.
+write_calendar записывает части в csv или jsonl по мере расчета.
+"""
+
+import json
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Iterator, Literal, NamedTuple
+
+import numpy as np
+from loguru import logger
+
+from business_logic.batch_engine import (
+    compute_charts,
+    digital_root_array,
+    split_birthdays,
+)
+
+PeriodType = Literal["day", "month"]
+CalendarFormat = Literal["csv", "jsonl"]
+
+# Количество клиентов в одной части расчета
+CHUNK_SIZE = 2_000
+
+
+class CalendarBlock(NamedTuple):
+    """Личные арканы части клиентов (строки) по датам периода (столбцы).
+
+    Для периода "month" dates - первые числа месяцев, personal_day - None.
+    """
+
+    client_ids: np.ndarray
+    dates: np.ndarray
+    personal_year: np.ndarray
+    personal_month: np.ndarray
+    personal_day: np.ndarray | None
+
+
+def period_dates(start: date, end: date, period: PeriodType = "day") -> np.ndarray:
+    """Даты периодов диапазона [start, end] в виде datetime64[D]"""
+    if end < start:
+        logger.error(f"Некорректный диапазон дат {start} - {end}")
+        raise ValueError(f"Некорректный диапазон дат {start} - {end}")
+
+    if period == "day":
+        return np.arange(
+            np.datetime64(start, "D"),
+            np.datetime64(end, "D") + np.timedelta64(1, "D"),
+        )
+    if period == "month":
+        months = np.arange(
+            np.datetime64(start, "M"),
+            np.datetime64(end, "M") + np.timedelta64(1, "M"),
+        )
+        return months.astype("datetime64[D]")
+
+    logger.error(f"Неизвестный период календаря {period}")
+    raise ValueError(f"Неизвестный период {period}")
+
+
+def personal_arcana(
+    personality: np.ndarray,
+    spirituality: np.ndarray,
+    dates: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Личные год, месяц и день клиентов (строки) по датам (столбцы)"""
+    day, month, year = split_birthdays(dates)
+    base = personality.astype(np.int16) + spirituality
+
+    personal_year = digital_root_array(
+        base[:, None] + digital_root_array(year)[None, :])
+    personal_month = digital_root_array(personal_year + month[None, :])
+    personal_day = digital_root_array(personal_month + day[None, :])
+    return personal_year, personal_month, personal_day
+
+
+def iter_calendar(
+    client_ids: np.ndarray,
+    birthdays: np.ndarray,
+    start: date,
+    end: date,
+    period: PeriodType = "day",
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[CalendarBlock]:
+    """Лениво выдает личные арканы клиентов за диапазон частями.
+
+    Args:
+        client_ids (np.ndarray): id клиентов
+        birthdays (np.ndarray): даты рождения клиентов
+        start (date): первая дата диапазона
+        end (date): последняя дата диапазона (включительно)
+        period (PeriodType): "day" - по дням, "month" - по месяцам
+        chunk_size (int): количество клиентов в части
+    """
+    dates = period_dates(start, end, period)
+
+    for offset in range(0, len(birthdays), chunk_size):
+        rows = slice(offset, offset + chunk_size)
+        charts = compute_charts(birthdays[rows])
+        personal_year, personal_month, personal_day = personal_arcana(
+            charts["personality"], charts["spirituality"], dates)
+
+        yield CalendarBlock(
+            client_ids=np.asarray(client_ids[rows]),
+            dates=dates,
+            personal_year=personal_year,
+            personal_month=personal_month,
+            personal_day=personal_day if period == "day" else None,
+        )
+
+
+# Колонки файла календаря (write_calendar)
+CALENDAR_COLUMNS = (
+    "client_id", "date", "personal_year", "personal_month", "personal_day")
+
+# Арканы 0..22: основание кода сочетания арканов строки
+_ARCANES_BASE = 23
+
+
+def _calendar_tails(file_format: str, with_day: bool) -> np.ndarray:
+    """Окончания строк для всех сочетаний арканов по коду сочетания.
+
+    Строка календаря - начало (клиент, дата) и окончание с арканами.
+    Арканов в окончании два или три, каждый 0..22, поэтому различных
+    окончаний всего 23**2 или 23**3 (12167), и они форматируются один раз.
+    Элемент code таблицы - окончание для арканов, которые являются
+    цифрами числа code по основанию 23 (год, месяц, день): write_calendar
+    считает коды всей части календаря одной операцией numpy и берет
+    готовые строки по индексу вместо форматирования каждого числа.
+    """
+    columns = CALENDAR_COLUMNS[2:] if with_day else CALENDAR_COLUMNS[2:4]
+    tails = []
+    for code in range(_ARCANES_BASE ** len(columns)):
+        values = []
+        for _ in columns:
+            code, value = divmod(code, _ARCANES_BASE)
+            values.append(value)
+        values.reverse()
+        if file_format == "csv":
+            tails.append("".join(f",{value}" for value in values) + "\n")
+        else:
+            tails.append(
+                "".join(
+                    f', "{name}": {value}' for name, value in zip(columns, values)
+                ) + "}\n"
+            )
+    return np.array(tails, dtype=object)
+
+
+def write_calendar(
+    file_path: Path,
+    blocks: Iterable[CalendarBlock],
+    file_format: CalendarFormat = "csv",
+) -> int:
+    """
+    Записывает календарь личных арканов построчно: клиент, дата, арканы.
+    Части календаря записываются по мере расчета, в памяти одна часть.
+    :param file_path: Путь к файлу для записи.
+    :param blocks: Части календаря из iter_calendar.
+    :param file_format: "csv" или "jsonl".
+    :return: Количество записанных строк (без заголовка).
+    """
+    if file_format not in ("csv", "jsonl"):
+        logger.error(f"Неизвестный формат календаря {file_format}")
+        raise ValueError(f"Неизвестный формат {file_format}")
+
+    rows = 0
+    tails: np.ndarray | None = None
+    with open(file_path, "w", encoding="utf-8", newline="") as file:
+        for block in blocks:
+            with_day = block.personal_day is not None
+            if tails is None:
+                tails = _calendar_tails(file_format, with_day)
+                if file_format == "csv":
+                    columns = CALENDAR_COLUMNS if with_day else CALENDAR_COLUMNS[:4]
+                    file.write(",".join(columns) + "\n")
+
+            # код строки: арканы - цифры по основанию 23, см. _calendar_tails
+            codes = block.personal_year.astype(np.int32) * _ARCANES_BASE
+            codes += block.personal_month
+            if block.personal_day is not None:
+                codes *= _ARCANES_BASE
+                codes += block.personal_day
+
+            dates = [str(day) for day in block.dates.tolist()]
+            for client_id, row in zip(block.client_ids.tolist(), tails[codes]):
+                if file_format == "csv":
+                    heads = [f"{client_id},{day}" for day in dates]
+                else:
+                    heads = [
+                        f'{{"client_id": {json.dumps(client_id)}, "date": "{day}"'
+                        for day in dates
+                    ]
+                file.write("".join([head + tail for head, tail in zip(heads, row)]))
+            rows += codes.size
+
+    logger.info(f"Календарь {file_path}: {rows} строк")
+    return rows
@@ -0,0 +1,122 @@
+# business_logic/chart_cache.py
+"""Общий для процесса кэш арканов по дате рождения.
+
+Все арканы карты зависят только от даты рождения, поэтому клиенты
+с одинаковой датой используют один рассчитанный результат. Имя клиента
+в кэш не попадает (оно нужно только для заголовка страницы).
+"""
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Generic, Iterator, TypeVar
+
+from config.settings import CHART_CACHE
+
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ChartCache(Generic[V]):
+    """LRU-кэш с ограничением размера, безопасный для потоков"""
+
+    def __init__(self, maxsize: int = 1024, enabled: bool = True) -> None:
+        if maxsize < 1:
+            raise ValueError(f"Недопустимый размер кэша {maxsize}")
+
+        self._maxsize = maxsize
+        self._enabled = enabled
+        self._data: OrderedDict[date, V] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def get(self, birthday: date, compute: Callable[[], V]) -> V:
+        """Возвращает значение для даты, рассчитывая его при промахе"""
+        if not self._enabled:
+            return compute()
+
+        with self._lock:
+            if birthday in self._data:
+                self._data.move_to_end(birthday)
+                self._hits += 1
+                return self._data[birthday]
+            self._misses += 1
+
+        # расчет вне блокировки: другие потоки не ждут
+        value = compute()
+
+        with self._lock:
+            self._data[birthday] = value
+            self._data.move_to_end(birthday)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+        return value
+
+    def configure(
+        self, maxsize: int | None = None, enabled: bool | None = None
+    ) -> None:
+        with self._lock:
+            if maxsize is not None:
+                if maxsize < 1:
+                    raise ValueError(f"Недопустимый размер кэша {maxsize}")
+                self._maxsize = maxsize
+                while len(self._data) > self._maxsize:
+                    self._data.popitem(last=False)
+                    self._evictions += 1
+            if enabled is not None:
+                self._enabled = enabled
+
+    @contextmanager
+    def disabled(self) -> Iterator[None]:
+        """Отключает кэш на время блока (например, в тестах)"""
+        previous = self._enabled
+        self._enabled = False
+        try:
+            yield
+        finally:
+            self._enabled = previous
+
+    def clear(self) -> None:
+        """Очищает кэш и сбрасывает счетчики"""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._data),
+                maxsize=self._maxsize,
+            )
+
+
+# Кэш арканов процесса, используется ChartProfile
+chart_cache: ChartCache = ChartCache(
+    maxsize=CHART_CACHE["maxsize"], enabled=CHART_CACHE["enabled"]
+)
@@ -0,0 +1,147 @@
+# business_logic/chart_formulas.py
+"""Декларативные формулы арканов, скомпилированные в план расчета.
+
+Формула позиции - digital_root суммы других позиций или входов
+(day, month, year) с ограничением arcanes_number (по умолчанию 22),
+см. config/chart_formulas.json. Компиляция раскладывает формулы в
+последовательность шагов без повторов:
+- одинаковые суммы считаются один раз: слагаемые сортируются,
+  поэтому a + b и b + a - один шаг;
+- digital_root одной позиции, значение которой уже не больше
+  arcanes_number, не считается, а ссылается на эту позицию.
+Один и тот же план вычисляется для одной даты и для массива дат.
+"""
+
+import json
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Tuple
+
+import numpy as np
+from loguru import logger
+
+from business_logic.arcanes_classes import digital_root
+from business_logic.batch_engine import (
+    CHART_DTYPE,
+    digital_root_array,
+    split_birthdays,
+)
+from config.settings import CHART_FORMULAS
+
+# Входы плана в порядке split_birthdays
+INPUTS: Tuple[str, ...] = ("day", "month", "year")
+
+# Слагаемое шага: (номер значения плана, множитель)
+Term = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class FormulaStep:
+    """Шаг плана: digital_root(sum(множитель * значение)) в новое значение"""
+
+    arcanes_number: int
+    terms: Tuple[Term, ...]
+
+
+@dataclass(frozen=True)
+class FormulaPlan:
+    """План расчета: значения 0..len(INPUTS)-1 - входы,
+    каждый шаг добавляет следующее значение"""
+
+    steps: Tuple[FormulaStep, ...]
+    # позиция -> номер значения
+    outputs: Dict[str, int]
+
+    def evaluate(self, birthday: date) -> Dict[str, int]:
+        """Арканы одной даты рождения по всем позициям плана"""
+        values = [birthday.day, birthday.month, birthday.year]
+        for step in self.steps:
+            total = sum(coef * values[idx] for idx, coef in step.terms)
+            values.append(digital_root(total, step.arcanes_number))
+
+        return {name: values[idx] for name, idx in self.outputs.items()}
+
+    def evaluate_batch(self, birthdays: np.ndarray) -> Dict[str, np.ndarray]:
+        """Арканы массива дат рождения по всем позициям плана"""
+        values: list[np.ndarray] = list(split_birthdays(birthdays))
+        for step in self.steps:
+            (first, first_coef), *rest = step.terms
+            total = values[first] * first_coef
+            for idx, coef in rest:
+                total = total + values[idx] * coef
+            values.append(digital_root_array(total, step.arcanes_number))
+
+        return {
+            name: values[idx].astype(CHART_DTYPE)
+            for name, idx in self.outputs.items()
+        }
+
+
+def compile_formulas(spec: dict) -> FormulaPlan:
+    """Компилирует описание формул в план с исключением общих подвыражений.
+
+    Args:
+        spec (dict): {"inputs": {вход: максимум}, "formulas": {позиция:
+                     {"sum": [слагаемые], "arcanes_number": 22}}}
+    Returns:
+        FormulaPlan: план расчета всех позиций formulas
+    """
+    formulas: dict = spec["formulas"]
+    if set(spec["inputs"]) != set(INPUTS):
+        logger.error(f"Входы формул {list(spec['inputs'])} вместо {INPUTS}")
+        raise ValueError(f"Входы формул должны быть {INPUTS}")
+
+    # максимальные значения для исключения лишних digital_root
+    maximum: list[int] = [spec["inputs"][name] for name in INPUTS]
+    resolved: Dict[str, int] = {name: idx for idx, name in enumerate(INPUTS)}
+    steps: list[FormulaStep] = []
+    # (arcanes_number, слагаемые) -> номер значения
+    known: Dict[Tuple[int, Tuple[Term, ...]], int] = {}
+    in_progress: set[str] = set()
+
+    def resolve(name: str) -> int:
+        if name in resolved:
+            return resolved[name]
+        if name not in formulas:
+            logger.error(f"Неизвестная позиция в формулах: {name}")
+            raise ValueError(f"Неизвестная позиция {name}")
+        if name in in_progress:
+            logger.error(f"Циклическая формула позиции {name}")
+            raise ValueError(f"Циклическая формула позиции {name}")
+
+        in_progress.add(name)
+        formula = formulas[name]
+        arcanes_number = formula.get("arcanes_number", 22)
+        counts = Counter(resolve(term) for term in formula["sum"])
+        terms = tuple(sorted(counts.items()))
+        in_progress.discard(name)
+
+        if len(terms) == 1 and terms[0][1] == 1 and (
+            maximum[terms[0][0]] <= arcanes_number
+        ):
+            # digital_root не меняет значение: ссылка на слагаемое
+            index = terms[0][0]
+        elif (arcanes_number, terms) in known:
+            index = known[(arcanes_number, terms)]
+        else:
+            index = len(maximum)
+            steps.append(FormulaStep(arcanes_number, terms))
+            maximum.append(arcanes_number)
+            known[(arcanes_number, terms)] = index
+
+        resolved[name] = index
+        return index
+
+    outputs = {name: resolve(name) for name in formulas}
+    logger.debug(f"План формул: {len(formulas)} позиций, {len(steps)} шагов")
+    return FormulaPlan(steps=tuple(steps), outputs=outputs)
+
+
+@lru_cache(maxsize=None)
+def load_plan(json_path: Path = CHART_FORMULAS) -> FormulaPlan:
+    """Загружает и компилирует формулы из конфигурации"""
+    with open(json_path, "r", encoding="utf-8") as f:
+        return compile_formulas(json.load(f))
@@ -0,0 +1,192 @@
+# business_logic/chart_table.py
+"""Предрасчитанная таблица арканов для всех дат диапазона.
+
+Файл таблицы состоит из заголовка, списка полей CHART_FIELDS и строк
+фиксированной ширины (один байт на поле) для каждой даты подряд.
+Чтение идет через mmap, поэтому все рабочие процессы используют
+одни и те же страницы файла без копирования в память процесса.
+
+Сборка: python -m business_logic.chart_table [--start ДАТА] [--end ДАТА]
+"""
+
+import argparse
+import mmap
+import os
+import struct
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+
+from business_logic.arcanes_classes import CHART_FIELDS
+from business_logic.batch_engine import compute_charts, stack_charts
+from config.settings import CHART_TABLE
+
+# magic, версия формата, первый день (ordinal), число дней,
+# число полей, длина списка полей в байтах
+_HEADER = struct.Struct("<4sHIIHI")
+_MAGIC = b"NCHT"
+_VERSION = 1
+
+
+class ChartTableError(Exception):
+    pass
+
+
+def build_chart_table(
+    path: Path = CHART_TABLE["path"],
+    start: date = CHART_TABLE["start"],
+    end: date = CHART_TABLE["end"],
+) -> Path:
+    """Рассчитывает арканы для всех дат [start, end] и записывает таблицу.
+
+    Args:
+        path (Path): путь к файлу таблицы
+        start (date): первая дата диапазона
+        end (date): последняя дата диапазона (включительно)
+    Returns:
+        Path: путь к записанному файлу
+    """
+    if end < start:
+        raise ValueError(f"Некорректный диапазон дат {start} - {end}")
+
+    dates = np.arange(
+        np.datetime64(start, "D"),
+        np.datetime64(end, "D") + np.timedelta64(1, "D"),
+    )
+    rows = stack_charts(compute_charts(dates))
+
+    names = "\n".join(CHART_FIELDS).encode("ascii")
+    header = _HEADER.pack(
+        _MAGIC, _VERSION, start.toordinal(), len(dates), len(CHART_FIELDS),
+        len(names)
+    )
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(names)
+        f.write(np.ascontiguousarray(rows).tobytes())
+    # замена атомарна: читатели видят либо старую, либо новую таблицу
+    os.replace(tmp_path, path)
+
+    logger.info(f"Таблица арканов {path} собрана: {start} - {end}")
+    return path
+
+
+class ChartTable:
+    """Чтение предрасчитанных арканов по дате рождения через mmap"""
+
+    def __init__(self, path: Path = CHART_TABLE["path"]) -> None:
+        self._path = path
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _HEADER.size:
+                # mmap пустого файла невозможен, заголовок обрезан
+                logger.error(f"Файл таблицы {path} короче заголовка")
+                raise ChartTableError(f"Поврежден файл таблицы {path}")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._rows = self._map_rows()
+        except Exception:
+            self._mm.close()
+            raise
+
+    def _map_rows(self) -> np.ndarray:
+        """Проверяет заголовок и размер файла, возвращает матрицу строк"""
+        path = self._path
+        magic, version, start, days, fields, names_len = (
+            _HEADER.unpack_from(self._mm, 0)
+        )
+        names_start = _HEADER.size
+        names = bytes(self._mm[names_start: names_start + names_len])
+
+        if (
+            magic != _MAGIC
+            or version != _VERSION
+            or names.decode("ascii", errors="replace").split("\n")
+            != list(CHART_FIELDS)
+        ):
+            logger.error(f"Таблица {path} не соответствует CHART_FIELDS")
+            raise ChartTableError(
+                f"Таблица {path} собрана другой версией программы")
+
+        data_offset = names_start + names_len
+        if len(self._mm) < data_offset + days * fields:
+            logger.error(
+                f"Файл таблицы {path} обрезан: {len(self._mm)} байт"
+                f" вместо {data_offset + days * fields}")
+            raise ChartTableError(f"Поврежден файл таблицы {path}")
+
+        self._start = start
+        self._days = days
+        self._row_size = fields
+        self._data_offset = data_offset
+        # матрица строк поверх mmap, без копирования
+        return np.frombuffer(
+            self._mm, dtype=np.uint8, count=days * fields, offset=data_offset
+        ).reshape(days, fields)
+
+    @property
+    def start(self) -> date:
+        return date.fromordinal(self._start)
+
+    @property
+    def end(self) -> date:
+        return date.fromordinal(self._start + self._days - 1)
+
+    def _index(self, birthday: date) -> int:
+        index = birthday.toordinal() - self._start
+        if not 0 <= index < self._days:
+            logger.error(f"Дата {birthday} вне диапазона таблицы {self._path}")
+            raise ChartTableError(
+                f"Дата {birthday} вне диапазона {self.start} - {self.end}")
+        return index
+
+    def lookup_row(self, birthday: date) -> bytes:
+        """Возвращает строку арканов даты в порядке CHART_FIELDS"""
+        offset = self._data_offset + self._index(birthday) * self._row_size
+        return self._mm[offset: offset + self._row_size]
+
+    def lookup(self, birthday: date) -> dict[str, int]:
+        """Возвращает арканы даты рождения по ключам CHART_FIELDS"""
+        return dict(zip(CHART_FIELDS, self.lookup_row(birthday)))
+
+    def lookup_many(self, birthdays: np.ndarray) -> np.ndarray:
+        """Возвращает матрицу арканов (даты x CHART_FIELDS) для массива дат"""
+        dates = np.asarray(birthdays, dtype="datetime64[D]")
+        # ordinal 719163 соответствует 1970-01-01 (началу datetime64)
+        index = dates.astype(np.int64) + 719163 - self._start
+        if index.size and (index.min() < 0 or index.max() >= self._days):
+            raise ChartTableError(
+                f"Даты вне диапазона {self.start} - {self.end}")
+        return self._rows[index]
+
+    def close(self) -> None:
+        # матрица держит ссылку на буфер mmap и должна быть освобождена
+        del self._rows
+        self._mm.close()
+
+    def __enter__(self) -> "ChartTable":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Сборка таблицы арканов")
+    parser.add_argument("--path", type=Path, default=CHART_TABLE["path"])
+    parser.add_argument(
+        "--start", type=date.fromisoformat, default=CHART_TABLE["start"])
+    parser.add_argument(
+        "--end", type=date.fromisoformat, default=CHART_TABLE["end"])
+    args = parser.parse_args()
+
+    build_chart_table(path=args.path, start=args.start, end=args.end)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+# business_logic/compact_chart.py
+"""Компактное хранение арканов клиента.
+
+CompactChart держит все арканы карты (звезды, миссия, футер и пять
+треугольников) в одном array('B') в порядке CHART_FIELDS и не имеет
+__dict__. Представления star, error, mission_star, footer и triangle()
+повторяют имена атрибутов и результаты to_dict* классов
+arcanes_classes.py, но создаются по требованию и ничего не хранят.
+"""
+
+from array import array
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Dict, Iterable, overload
+
+from loguru import logger
+
+from business_logic.arcanes_classes import (
+    CHART_FIELDS,
+    ERROR_STAR_FIELDS,
+    FOOTER_STAR_FIELDS,
+    MAIN_STAR_FIELDS,
+    MISSION_STAR_FIELDS,
+    TRIANGLE_FIELDS,
+    TRIANGLE_VERTICES,
+    ChartProfile,
+    Client,
+    MainStar,
+    PointerType,
+)
+
+_FIELD_INDEX: Dict[str, int] = {
+    field: idx for idx, field in enumerate(CHART_FIELDS)}
+
+
+def _value(index: int) -> property:
+    getter = itemgetter(index)
+    return property(lambda self: getter(self._values))
+
+
+class _Arcana:
+    """Аркан представления: позиция поля в массиве CompactChart"""
+
+    __slots__ = ("index",)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.index = _FIELD_INDEX[name]
+
+    @overload
+    def __get__(self, view: None, owner: type) -> "_Arcana": ...
+
+    @overload
+    def __get__(self, view: Any, owner: type | None = None) -> int: ...
+
+    def __get__(self, view: Any, owner: type | None = None) -> "int | _Arcana":
+        if view is None:
+            return self
+        return view._values[self.index]
+
+
+class _TriangleArcana(_Arcana):
+    """Аркан треугольника: позиция поля от начала треугольника"""
+
+    __slots__ = ()
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.index = TRIANGLE_FIELDS.index(name)
+
+    @overload
+    def __get__(self, view: None, owner: type) -> "_TriangleArcana": ...
+
+    @overload
+    def __get__(self, view: Any, owner: type | None = None) -> int: ...
+
+    def __get__(
+        self, view: Any, owner: type | None = None
+    ) -> "int | _TriangleArcana":
+        if view is None:
+            return self
+        return view._values[view._offset + self.index]
+
+
+class CompactChart:
+    """Арканы клиента в одном массиве байтов"""
+
+    __slots__ = ("client_info", "_values")
+
+    def __init__(self, client_info: Client, values: Iterable[int]) -> None:
+        self.client_info = client_info
+        self._values = array("B", values)
+        if len(self._values) != len(CHART_FIELDS):
+            logger.error(f"Неверное число арканов {len(self._values)}")
+            raise ValueError(
+                f"Ожидается {len(CHART_FIELDS)} арканов, "
+                f"получено {len(self._values)}"
+            )
+
+    @classmethod
+    def from_profile(cls, profile: ChartProfile) -> "CompactChart":
+        """Упаковывает рассчитанный профиль клиента"""
+        return cls(profile.client_info, profile.values.values())
+
+    @classmethod
+    def from_client(cls, client_info: Client) -> "CompactChart":
+        return cls.from_profile(ChartProfile(client_info=client_info))
+
+    @classmethod
+    def from_row(cls, client_info: Client, row: bytes) -> "CompactChart":
+        """Создает запись из строки ChartTable или batch_engine.stack_charts"""
+        return cls(client_info, bytes(row))
+
+    def to_bytes(self) -> bytes:
+        return self._values.tobytes()
+
+    @property
+    def star(self) -> "CompactMainStar":
+        return CompactMainStar(self)
+
+    @property
+    def error(self) -> "CompactErrorStar":
+        return CompactErrorStar(self)
+
+    @property
+    def mission_star(self) -> "CompactMissionStar":
+        return CompactMissionStar(self)
+
+    @property
+    def footer(self) -> "CompactFooterStar":
+        return CompactFooterStar(self)
+
+    def triangle(self, pointer: PointerType) -> "CompactTriangle":
+        return CompactTriangle(self, pointer)
+
+    def __repr__(self) -> str:
+        return f"CompactChart({self.client_info!r}, {list(self._values)})"
+
+    if TYPE_CHECKING:
+        # арканы CHART_FIELDS добавляются в класс циклом ниже
+        def __getattr__(self, field: str) -> int: ...
+
+
+for _idx, _field in enumerate(CHART_FIELDS):
+    setattr(CompactChart, _field, _value(_idx))
+
+
+class _ChartView:
+    """Представление части CompactChart с именами полей класса звезды"""
+
+    __slots__ = ("_values",)
+    _fields: tuple[str, ...] = ()
+
+    def __init__(self, chart: CompactChart) -> None:
+        self._values = chart._values
+
+    def to_dict(self) -> Dict[str, str]:
+        return {field: str(getattr(self, field)) for field in self._fields}
+
+    def __init_subclass__(cls) -> None:
+        # поля представления должны совпадать с полями класса звезды
+        missing = [
+            field for field in cls._fields
+            if not isinstance(getattr(cls, field, None), _Arcana)
+        ]
+        if missing:
+            logger.error(f"{cls.__name__}: не объявлены арканы {missing}")
+            raise TypeError(f"{cls.__name__}: не объявлены арканы {missing}")
+
+
+class CompactMainStar(_ChartView):
+    __slots__ = ("client_info",)
+    _fields = MAIN_STAR_FIELDS
+
+    personality = _Arcana()
+    spirituality = _Arcana()
+    money = _Arcana()
+    relationship = _Arcana()
+    health = _Arcana()
+
+    def __init__(self, chart: CompactChart) -> None:
+        super().__init__(chart)
+        self.client_info = chart.client_info
+
+    @property
+    def header_text(self) -> str:
+        return MainStar(client_info=self.client_info).header_text
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"header_text": self.header_text, **super().to_dict()}
+
+
+class CompactErrorStar(_ChartView):
+    __slots__ = ()
+    _fields = ERROR_STAR_FIELDS
+
+    err_personality = _Arcana()
+    err_spirituality = _Arcana()
+    err_money = _Arcana()
+    err_relationship = _Arcana()
+    err_health = _Arcana()
+
+
+class CompactMissionStar(_ChartView):
+    __slots__ = ()
+    _fields = MISSION_STAR_FIELDS
+
+    mission = _Arcana()
+    mission_error = _Arcana()
+    mission_full = _Arcana()
+
+
+class CompactFooterStar(_ChartView):
+    __slots__ = ()
+    _fields = FOOTER_STAR_FIELDS
+
+    foot_personality = _Arcana()
+    foot_spirituality = _Arcana()
+    foot_money = _Arcana()
+    foot_relationship = _Arcana()
+    foot_health = _Arcana()
+
+
+class CompactTriangle:
+    """Треугольник CompactChart с атрибутами и to_dict* класса Triangle"""
+
+    __slots__ = ("_values", "_offset", "pointer")
+
+    vertex = _TriangleArcana()
+    left_vertex = _TriangleArcana()
+    right_vertex = _TriangleArcana()
+    inverted_vertex = _TriangleArcana()
+    inverted_left_vertex = _TriangleArcana()
+    inverted_right_vertex = _TriangleArcana()
+    left_middle_vertex = _TriangleArcana()
+    right_middle_vertex = _TriangleArcana()
+
+    def __init__(self, chart: CompactChart, pointer: PointerType) -> None:
+        if pointer not in TRIANGLE_VERTICES:
+            logger.error(f"Недопустимый поинтер {pointer}")
+            raise ValueError(f"Недопустимый поинтер {pointer}")
+
+        self._values = chart._values
+        self._offset = _FIELD_INDEX[f"{pointer}_{TRIANGLE_FIELDS[0]}"]
+        self.pointer = pointer
+
+    @property
+    def vertex_data(self) -> tuple[int, int, int]:
+        return tuple(self._values[self._offset: self._offset + 3])  # type: ignore
+
+    def to_dict_predicted(self) -> Dict[str, str]:
+        pref = self.pointer
+        return {
+            f"{pref}_inverted_left_vertex": str(self.inverted_left_vertex),
+            f"{pref}_inverted_right_vertex": str(self.inverted_right_vertex),
+        }
+
+    def to_dict_inverted(self) -> Dict[str, str]:
+        pref = self.pointer
+        return {
+            f"{pref}_inverted_vertex": str(self.inverted_vertex),
+            f"{pref}_inverted_left_vertex": str(self.inverted_left_vertex),
+            f"{pref}_inverted_right_vertex": str(self.inverted_right_vertex),
+        }
+
+    def to_dict(self) -> Dict[str, str]:
+        return {field: str(getattr(self, field)) for field in TRIANGLE_FIELDS}
@@ -0,0 +1,199 @@
+# business_logic/couple_matrix.py
+"""Звезды пар для всех сочетаний клиентов двух списков и поиск лучших пар.
+
+Звезда пары - combine_couple_star без заголовка: digital_root суммы
+одноименных арканов MainStar. Балл пары считается по таблице
+(поле MainStar x аркан), матрица пар обрабатывается блоками,
+поэтому память не зависит от размеров списков.
+"""
+
+from typing import Iterator, Mapping, NamedTuple
+
+import numpy as np
+from loguru import logger
+
+from business_logic.arcanes_classes import MAIN_STAR_FIELDS, digital_root
+from business_logic.batch_engine import compute_charts, digital_root_array
+from config.settings import COUPLE_MATRIX
+
+# Арканы 0..22 и основание кода звезды
+_BASE = 23
+
+# Баллы аркана по полям: {"relationship": {6: 3.0}, ...}
+ScoreWeights = Mapping[str, Mapping[int, float]]
+
+
+class CoupleMatch(NamedTuple):
+    """Пара клиентов: номера в левом и правом списках и балл пары"""
+
+    left: int
+    right: int
+    score: float
+
+
+def main_stars(birthdays: np.ndarray) -> np.ndarray:
+    """Матрица MainStar (клиенты x MAIN_STAR_FIELDS) для массива дат"""
+    charts = compute_charts(birthdays)
+    return np.stack([charts[field] for field in MAIN_STAR_FIELDS], axis=1)
+
+
+def combine_stars(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Звезды пар для всех сочетаний строк: матрица (N, M, 5)"""
+    summed = left[:, None, :].astype(np.int16) + right[None, :, :]
+    return digital_root_array(summed).astype(np.uint8)
+
+
+def combine_group(
+    stars: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Звезды всех пар группы и общая звезда группы за один проход.
+
+    Args:
+        stars (np.ndarray): матрица MainStar участников (K x 5)
+    Returns:
+        (номера участников пар i < j (P x 2), звезды пар (P x 5),
+         звезда группы - digital_root суммы арканов всех участников)
+    """
+    left, right = np.triu_indices(len(stars), k=1)
+    pairs = np.stack([left, right], axis=1)
+    pair_stars = combine_stars(stars, stars)[left, right]
+    # сумма большой группы (от ~455 участников) выходит за таблицу
+    # digital_root_array, а полей всего пять: считаются скалярно
+    totals = stars.sum(axis=0, dtype=np.int64)
+    group_star = np.array(
+        [digital_root(int(total)) for total in totals], dtype=np.uint8)
+    return pairs, pair_stars, group_star
+
+
+def iter_couple_blocks(
+    left: np.ndarray,
+    right: np.ndarray,
+    block_size: int = COUPLE_MATRIX["block_size"],
+) -> Iterator[tuple[slice, slice, np.ndarray]]:
+    """Обходит матрицу звезд пар блоками не больше block_size x block_size.
+
+    Yields:
+        (строки, столбцы, звезды пар блока) для срезов left и right
+    """
+    for row in range(0, len(left), block_size):
+        rows = slice(row, row + block_size)
+        for col in range(0, len(right), block_size):
+            cols = slice(col, col + block_size)
+            yield rows, cols, combine_stars(left[rows], right[cols])
+
+
+def score_table(weights: ScoreWeights = COUPLE_MATRIX["weights"]) -> np.ndarray:
+    """Таблица баллов (MAIN_STAR_FIELDS x аркан) по настройке весов"""
+    table = np.zeros((len(MAIN_STAR_FIELDS), _BASE), dtype=np.float64)
+    for field, arcanes in weights.items():
+        if field not in MAIN_STAR_FIELDS:
+            logger.error(f"Неизвестное поле весов пары {field}")
+            raise ValueError(f"Неизвестное поле {field}")
+        for arcane, score in arcanes.items():
+            if not 0 <= arcane < _BASE:
+                logger.error(f"Аркан {arcane} вне 0..{_BASE - 1} в весах {field}")
+                raise ValueError(f"Недопустимый аркан {arcane} в весах {field}")
+            table[MAIN_STAR_FIELDS.index(field), arcane] = score
+    return table
+
+
+def score_couples(combined: np.ndarray, table: np.ndarray) -> np.ndarray:
+    """Баллы пар: сумма баллов арканов звезды пары по таблице"""
+    fields = np.arange(len(MAIN_STAR_FIELDS))
+    return table[fields, combined].sum(axis=-1)
+
+
+def _unique_stars(stars: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Различные звезды списка и номера клиентов, сгруппированные по ним.
+
+    Returns:
+        (звезды, начала групп, номера клиентов по возрастанию в группе)
+    """
+    codes = np.zeros(len(stars), dtype=np.int64)
+    for column in range(stars.shape[1]):
+        codes = codes * _BASE + stars[:, column]
+    unique_codes, first, inverse = np.unique(
+        codes, return_index=True, return_inverse=True)
+    members = np.argsort(inverse, kind="stable")
+    starts = np.zeros(len(unique_codes) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(inverse), out=starts[1:])
+    return stars[first], starts, members
+
+
+def _top_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Номера k наибольших баллов без полной сортировки"""
+    if k >= len(scores):
+        return np.arange(len(scores))
+    return np.argpartition(-scores, k - 1)[:k]
+
+
+def top_couples(
+    left_birthdays: np.ndarray,
+    right_birthdays: np.ndarray,
+    k: int = 10,
+    weights: ScoreWeights = COUPLE_MATRIX["weights"],
+    block_size: int = COUPLE_MATRIX["block_size"],
+) -> list[CoupleMatch]:
+    """Находит k пар (левый клиент, правый клиент) с наибольшим баллом.
+
+    Балл зависит только от звезд клиентов, а различных MainStar не
+    больше нескольких тысяч, поэтому блоками обходится матрица
+    различных звезд, а клиенты подставляются только в лучшие пары.
+    При равных баллах порядок пар не гарантирован.
+
+    Args:
+        left_birthdays (np.ndarray): даты рождения первого списка
+        right_birthdays (np.ndarray): даты рождения второго списка
+        k (int): количество пар в результате
+        weights (ScoreWeights): баллы арканов звезды пары по полям
+        block_size (int): размер блока матрицы пар
+    Returns:
+        list[CoupleMatch]: пары по убыванию балла
+    """
+    if k <= 0:
+        return []
+
+    table = score_table(weights)
+    left, left_starts, left_members = _unique_stars(main_stars(left_birthdays))
+    right, right_starts, right_members = _unique_stars(
+        main_stars(right_birthdays))
+    left_counts = np.diff(left_starts)
+    right_counts = np.diff(right_starts)
+
+    # лучшие пары звезд: каждой соответствует хотя бы одна пара клиентов
+    best_scores = np.empty(0, dtype=np.float64)
+    best_pairs = np.empty((0, 2), dtype=np.int64)
+    for rows, cols, combined in iter_couple_blocks(left, right, block_size):
+        scores = score_couples(combined, table).ravel()
+        top = _top_indices(scores, k)
+        row_idx, col_idx = np.divmod(top, combined.shape[1])
+        best_scores = np.concatenate([best_scores, scores[top]])
+        best_pairs = np.concatenate([
+            best_pairs,
+            np.stack([row_idx + rows.start, col_idx + cols.start], axis=1),
+        ])
+        keep = _top_indices(best_scores, k)
+        best_scores, best_pairs = best_scores[keep], best_pairs[keep]
+
+    # подстановка клиентов в пары звезд по убыванию балла
+    result: list[CoupleMatch] = []
+    for idx in np.argsort(-best_scores, kind="stable"):
+        star_left, star_right = best_pairs[idx]
+        left_ids = left_members[left_starts[star_left]: left_starts[star_left + 1]]
+        right_ids = right_members[
+            right_starts[star_right]: right_starts[star_right + 1]]
+        need = min(
+            k - len(result),
+            int(left_counts[star_left]) * int(right_counts[star_right]),
+        )
+        row_idx, col_idx = np.divmod(
+            np.arange(0, need, dtype=np.int64), len(right_ids))
+        score = float(best_scores[idx])
+        result.extend(
+            CoupleMatch(int(i), int(j), score)
+            for i, j in zip(left_ids[row_idx], right_ids[col_idx])
+        )
+        if len(result) >= k:
+            break
+
+    return result
@@ -0,0 +1,176 @@
+# business_logic/forecast.py
+"""Прогноз по шкале отчета predict: аркан каждого возраста и года.
+
+Шкала - 80 арканов по ключам DIAL_KEYS, которые отрисовываются по кругу
+с шагом angle_step из config/pages/dial.json. Полный круг шкалы -
+CIRCLE_YEARS (100) лет жизни, одна позиция управляет
+CIRCLE_YEARS / slots годами (1.25 года при slots = 360 / angle_step):
+возраст age попадает в позицию age * slots // CIRCLE_YEARS % slots,
+после полного круга шкала повторяется.
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+import numpy as np
+from loguru import logger
+
+from business_logic.arcanes_classes import DIAL_KEYS, ChartProfile, get_full_dial
+from business_logic.batch_engine import compute_charts, compute_dials, split_birthdays
+from config.settings import PREDICT
+
+# Значение прогноза для лет до рождения в пакетном расчете
+NO_FORECAST = -1
+
+# Лет жизни на полный круг шкалы
+CIRCLE_YEARS = 100
+
+
+@dataclass(frozen=True)
+class DialGeometry:
+    """Геометрия шкалы: угол первой позиции и шаг между позициями"""
+
+    start_angle: float
+    angle_step: float
+
+    @property
+    def slots(self) -> int:
+        return round(360 / self.angle_step)
+
+    @property
+    def years_per_slot(self) -> float:
+        """Лет жизни на одну позицию шкалы"""
+        return CIRCLE_YEARS / self.slots
+
+    def age_slot(self, age: int) -> int:
+        """Позиция шкалы для возраста age (полных лет)"""
+        return int(age * self.slots // CIRCLE_YEARS) % self.slots
+
+    def slot_angle(self, slot: int) -> float:
+        """Угол позиции шкалы, как при отрисовке build_dial_context"""
+        return self.start_angle + slot * self.angle_step
+
+
+@lru_cache(maxsize=None)
+def load_dial_geometry(json_path: Path = PREDICT["json"][1]) -> DialGeometry:
+    """Читает геометрию шкалы из конфигурации страницы dial.json"""
+    with open(json_path, "r", encoding="utf-8") as f:
+        geometry = json.load(f)["geometry"]
+
+    result = DialGeometry(
+        start_angle=geometry["start_angle"], angle_step=geometry["angle_step"]
+    )
+    if result.slots != len(DIAL_KEYS):
+        logger.error(f"Шкала {json_path}: {result.slots} позиций")
+        raise ValueError(
+            f"Шкала {json_path} не совпадает с DIAL_KEYS ({len(DIAL_KEYS)})")
+    return result
+
+
+def age_to_slot(age: int, geometry: DialGeometry | None = None) -> int:
+    """Позиция шкалы, которая управляет возрастом age (полных лет)"""
+    if age < 0:
+        logger.error(f"Отрицательный возраст {age}")
+        raise ValueError(f"Отрицательный возраст {age}")
+    geometry = geometry or load_dial_geometry()
+    return geometry.age_slot(age)
+
+
+class Forecast(NamedTuple):
+    """Аркан шкалы, управляющий одним годом жизни клиента"""
+
+    year: int
+    age: int
+    slot: int
+    key: str
+    arcana: int
+    angle: float
+
+
+def forecast_for_age(profile: ChartProfile, age: int) -> Forecast:
+    """Аркан, управляющий возрастом age клиента"""
+    geometry = load_dial_geometry()
+    slot = age_to_slot(age, geometry)
+    ring = get_full_dial(profile)
+    key = DIAL_KEYS[slot]
+    return Forecast(
+        year=profile.client_info.birthday.year + age,
+        age=age,
+        slot=slot,
+        key=key,
+        arcana=int(ring[key]),
+        angle=geometry.slot_angle(slot),
+    )
+
+
+def iter_forecast(
+    profile: ChartProfile, start_year: int, end_year: int
+) -> Iterator[Forecast]:
+    """Лениво выдает прогноз клиента по годам [start_year, end_year].
+
+    Возраст года - число полных лет, исполняющихся в этом году.
+    Годы до рождения пропускаются. Шкала строится один раз.
+    """
+    geometry = load_dial_geometry()
+    ring = get_full_dial(profile)
+    birth_year = profile.client_info.birthday.year
+
+    for year in range(max(start_year, birth_year), end_year + 1):
+        age = year - birth_year
+        slot = geometry.age_slot(age)
+        key = DIAL_KEYS[slot]
+        yield Forecast(
+            year, age, slot, key, int(ring[key]), geometry.slot_angle(slot))
+
+
+def iter_roster_forecast(
+    profiles: Iterable[ChartProfile], start_year: int, end_year: int
+) -> Iterator[tuple[ChartProfile, Forecast]]:
+    """Лениво выдает прогнозы по годам для каждого клиента списка"""
+    for profile in profiles:
+        for forecast in iter_forecast(profile, start_year, end_year):
+            yield profile, forecast
+
+
+def forecast_batch(birthdays: np.ndarray, years: np.ndarray) -> np.ndarray:
+    """Векторный прогноз: арканы клиентов (строки) по годам (столбцы).
+
+    Шкалы всех клиентов считаются одной операцией compute_dials.
+    Для лет до рождения возвращается NO_FORECAST.
+
+    Args:
+        birthdays (np.ndarray): даты рождения клиентов
+        years (np.ndarray): годы прогноза
+    Returns:
+        np.ndarray: матрица (клиенты x годы) типа int16
+    """
+    geometry = load_dial_geometry()
+    rings = compute_dials(compute_charts(birthdays))
+    _, _, birth_year = split_birthdays(birthdays)
+
+    ages = np.asarray(years, dtype=np.int64)[None, :] - birth_year[:, None]
+    slots = ages * geometry.slots // CIRCLE_YEARS % geometry.slots
+    result = np.take_along_axis(rings, slots, axis=1).astype(np.int16)
+    result[ages < 0] = NO_FORECAST
+    return result
+
+
+def iter_forecast_batches(
+    birthdays: np.ndarray, years: np.ndarray, chunk_size: int = 100_000
+) -> Iterator[tuple[slice, np.ndarray]]:
+    """Лениво выдает пакетный прогноз частями по chunk_size клиентов"""
+    for start in range(0, len(birthdays), chunk_size):
+        rows = slice(start, start + chunk_size)
+        yield rows, forecast_batch(birthdays[rows], years)
+
+
+def governing_arcana(profile: ChartProfile, on_date: date) -> Forecast:
+    """Аркан, управляющий годом жизни клиента на дату on_date"""
+    birthday = profile.client_info.birthday
+    age = on_date.year - birthday.year - (
+        (on_date.month, on_date.day) < (birthday.month, birthday.day))
+    return forecast_for_age(profile, age)
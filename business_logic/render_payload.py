@@ -0,0 +1,35 @@
+# business_logic/render_payload.py
+from typing import Iterator, Mapping, Sequence
+
+
+class RenderPayload(Mapping[str, int | str]):
+    """Данные страницы отчета: ключ элемента -> аркан.
+
+    Значения хранятся в общей последовательности (например, в строке
+    арканов ChartProfile.row), а страница задает только индекс
+    ключ -> позиция. Промежуточные словари не создаются, а числа
+    превращаются в текст только при отрисовке размещенных элементов.
+    """
+
+    __slots__ = ("_values", "_index")
+
+    def __init__(
+        self, values: Sequence[int | str], index: Mapping[str, int]
+    ) -> None:
+        self._values = values
+        self._index = index
+
+    def __getitem__(self, key: str) -> int | str:
+        return self._values[self._index[key]]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return f"RenderPayload({dict(self)!r})"
@@ -0,0 +1,143 @@
+# business_logic/reverse_index.py
+"""Обратный поиск: даты рождения по набору арканов.
+
+Для каждого поля CHART_FIELDS (звезды, миссия, вершины треугольников)
+хранится список дат диапазона, сгруппированный по значению аркана.
+Запрос задает любое подмножество полей; незаданные поля и значение "*"
+считаются подстановочными. Арканы считаются тем же движком
+batch_engine, что и в arcanes_classes.py.
+"""
+
+from datetime import date
+from typing import Iterable
+
+import numpy as np
+from loguru import logger
+
+from business_logic.arcanes_classes import CHART_FIELDS, CHART_INDEX
+from business_logic.batch_engine import compute_charts, stack_charts
+from config.settings import CHART_TABLE
+
+# Подстановочное значение поля в запросе
+WILDCARD = "*"
+
+# Значение поля в запросе: аркан, набор допустимых арканов или "*"
+PatternValue = int | Iterable[int] | str | None
+
+# Все значения uint8: таблицы допустимых значений по 256 элементов
+_VALUES = 256
+
+
+class ReverseIndex:
+    """Обратный индекс арканов по всем датам диапазона [start, end].
+
+    Для каждого поля даты (номера дней от start) отсортированы по
+    значению аркана, а внутри значения - по возрастанию. Запрос берет
+    самый короткий список среди заданных полей и проверяет остальные
+    поля по матрице арканов.
+    """
+
+    def __init__(
+        self,
+        start: date = CHART_TABLE["start"],
+        end: date = CHART_TABLE["end"],
+    ) -> None:
+        if end < start:
+            raise ValueError(f"Некорректный диапазон дат {start} - {end}")
+
+        dates = np.arange(
+            np.datetime64(start, "D"),
+            np.datetime64(end, "D") + np.timedelta64(1, "D"),
+        )
+        self._start = dates[0]
+        self._rows = stack_charts(compute_charts(dates))
+
+        # списки дат по полям: порядок дней и границы групп значений
+        self._order = np.argsort(self._rows, axis=0, kind="stable").T.copy()
+        self._bounds = np.zeros((len(CHART_FIELDS), _VALUES + 1), dtype=np.int64)
+        for idx in range(len(CHART_FIELDS)):
+            counts = np.bincount(self._rows[:, idx], minlength=_VALUES)
+            np.cumsum(counts, out=self._bounds[idx, 1:])
+
+        logger.info(f"Обратный индекс арканов собран: {start} - {end}")
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def start(self) -> date:
+        return self._start.item()
+
+    @property
+    def end(self) -> date:
+        return (self._start + np.timedelta64(len(self._rows) - 1, "D")).item()
+
+    def _allowed(self, field: str, value: PatternValue) -> np.ndarray | None:
+        """Таблица допустимых значений поля или None для подстановки"""
+        if field not in CHART_INDEX:
+            logger.error(f"Неизвестное поле запроса {field}")
+            raise ValueError(f"Неизвестное поле {field}")
+
+        if value is None or value == WILDCARD:
+            return None
+
+        values = [value] if isinstance(value, int) else list(value)
+        allowed = np.zeros(_VALUES, dtype=bool)
+        for number in values:
+            if not isinstance(number, int) or not 0 <= number < _VALUES:
+                logger.error(f"Некорректное значение {number} поля {field}")
+                raise ValueError(f"Некорректное значение {number} поля {field}")
+            allowed[number] = True
+        return allowed
+
+    def _posting(self, column: int, allowed: np.ndarray) -> np.ndarray:
+        """Номера дней с допустимыми значениями поля по возрастанию"""
+        bounds = self._bounds[column]
+        parts = [
+            self._order[column, bounds[value]: bounds[value + 1]]
+            for value in np.flatnonzero(allowed)
+        ]
+        if len(parts) == 1:
+            return parts[0]
+        return np.sort(np.concatenate(parts)) if parts else np.empty(0, np.int64)
+
+    def query_days(self, **pattern: PatternValue) -> np.ndarray:
+        """Номера дней от start, подходящих под все поля запроса"""
+        conditions = []
+        for field, value in pattern.items():
+            allowed = self._allowed(field, value)
+            if allowed is not None:
+                conditions.append((CHART_INDEX[field], allowed))
+
+        if not conditions:
+            return np.arange(len(self._rows))
+
+        # начинаем с самого короткого списка дат
+        def size(condition: tuple[int, np.ndarray]) -> int:
+            column, allowed = condition
+            counts = np.diff(self._bounds[column])
+            return int(counts[allowed].sum())
+
+        conditions.sort(key=size)
+        column, allowed = conditions[0]
+        days = self._posting(column, allowed)
+        for column, allowed in conditions[1:]:
+            if not days.size:
+                break
+            days = days[allowed[self._rows[days, column]]]
+        return days
+
+    def query_dates(self, **pattern: PatternValue) -> np.ndarray:
+        """Подходящие даты в виде отсортированного массива datetime64[D]"""
+        return self._start + self.query_days(**pattern).astype("timedelta64[D]")
+
+    def query(self, **pattern: PatternValue) -> list[date]:
+        """Подходящие даты рождения по возрастанию.
+
+        Пример: index.query(personality=5, money=(3, 4), mission="*")
+        """
+        return self.query_dates(**pattern).tolist()
+
+    def count(self, **pattern: PatternValue) -> int:
+        """Количество дат, подходящих под запрос"""
+        return len(self.query_days(**pattern))
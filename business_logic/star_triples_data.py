@@ -59,28 +59,28 @@ fullstar_id = {
     4: "relationship",
     5: "health",
     6: "mission",
-    7: "mission_err",
-    8: "mission_all",
-    9: "pat_male_line_err",
-    10: "mat_male_line_err",
-    11: "pat_female_line_err",
-    12: "doom_err",
-    13: "mat_female_line_err",
-    14: "personality_inv_vertex",
-    15: "personality_inv_mat_vertex",
-    16: "personality_inv_pat_vertex",
-    17: "spirituality_inv_vertex",
-    18: "spirituality_inv_mat_vertex",
-    19: "spirituality_inv_pat_vertex",
-    20: "money_inv_vertex",
-    21: "money_inv_mat_vertex",
-    22: "money_inv_pat_vertex",
-    23: "relationship_inv_vertex",
-    24: "relationship_inv_mat_vertex",
-    25: "relationship_inv_pat_vertex",
-    26: "health_inv_vertex",
-    27: "health_inv_mat_vertex",
-    28: "health_inv_pat_vertex",
+    7: "mission_error",
+    8: "mission_full",
+    9: "err_personality",
+    10: "err_spirituality",
+    11: "err_money",
+    12: "err_relationship",
+    13: "err_health",
+    14: "personality_inverted_vertex",
+    15: "personality_inverted_right_vertex",
+    16: "personality_inverted_left_vertex",
+    17: "spirituality_inverted_vertex",
+    18: "spirituality_inverted_right_vertex",
+    19: "spirituality_inverted_left_vertex",
+    20: "money_inverted_vertex",
+    21: "money_inverted_right_vertex",
+    22: "money_inverted_left_vertex",
+    23: "relationship_inverted_vertex",
+    24: "relationship_inverted_right_vertex",
+    25: "relationship_inverted_left_vertex",
+    26: "health_inverted_vertex",
+    27: "health_inverted_right_vertex",
+    28: "health_inverted_left_vertex",
 }
 
 
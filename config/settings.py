@@ -1,3 +1,4 @@
+from datetime import date
 from pathlib import Path
 
 # Logs
@@ -37,6 +38,62 @@ PITHAGORIAN_TABLE = {
 }
 OUTPUT_PATH = Path("output")
 
+# Профили качества шаблонов (utils/template_profiles.py): ширина варианта
+# в пикселях и качество JPEG, None - исходный шаблон без обработки
+QUALITY_PROFILES = {
+    "print": None,
+    "screen": {"width": 1240, "quality": 80},
+    "preview": {"width": 620, "quality": 60},
+}
+PROFILES_PATH = Path("templates/profiles")
+
+# Все страницы сценария в одном файле (src/main_reports.collect_bundle_report)
+# вместо отдельных файлов по отчетам
+REPORT_BUNDLE = False
+
+# Кэш изображений шаблонов (utils/image_registry.py): предел суммы байтов
+TEMPLATE_CACHE = {
+    "max_bytes": 32 * 2**20,
+}
+
+# Шрифты отчетов: семейство для set_font -> файл TTF
+FONTS = {
+    "bebas_regular": Path("report_storage/fonts/BebasNeue-Regular.ttf"),
+    "roboto_bold": Path("report_storage/fonts/Roboto Mono Bold for Powerline.ttf"),
+    "roboto_medium": Path(
+        "report_storage/fonts/Roboto Mono Medium for Powerline.ttf"),
+    "roboto_regular": Path("report_storage/fonts/Roboto Mono for Powerline.ttf"),
+    "roboto_light": Path(
+        "report_storage/fonts/Roboto Mono Light for Powerline.ttf"),
+}
+
+# Предрасчитанная таблица арканов по датам рождения
+CHART_TABLE = {
+    "path": Path("data/chart_table.bin"),
+    "start": date(1900, 1, 1),
+    "end": date(2100, 12, 31),
+}
+
+# Формулы арканов карты и шкалы predict (business_logic/chart_formulas.py)
+CHART_FORMULAS = Path("config/chart_formulas.json")
+
+# Кэш арканов по дате рождения (business_logic/chart_cache.py)
+CHART_CACHE = {
+    "maxsize": 100_000,
+    "enabled": True,
+}
+
+# Подбор пар (business_logic/couple_matrix.py): баллы за арканы
+# звезды пары по полям MainStar и размер блока матрицы пар
+COUPLE_MATRIX = {
+    "weights": {
+        "relationship": {6: 3.0, 3: 2.0, 21: 1.0},
+        "personality": {6: 1.0},
+        "health": {6: 1.0, 21: 1.0},
+    },
+    "block_size": 1024,
+}
+
 """
 Размеры страницы A4:
 В миллиметрах: 210 мм × 297 мм .
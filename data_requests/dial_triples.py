@@ -0,0 +1,89 @@
+"""Поиск комбинаций triples_combinations на шкале отчета predict.
+
+Шкала count_dial_data замкнута в круг из 80 арканов, поэтому окна из
+трех соседних арканов начинаются в каждой позиции, последние окна
+захватывают начало шкалы. Коды всех окон считаются одной операцией
+для всех клиентов по трем сдвинутым срезам замкнутой шкалы,
+совпадения берутся из той же таблицы match_table, что и для Полной
+звезды.
+"""
+
+from typing import Dict, List, Mapping, NamedTuple, Sequence
+
+import numpy as np
+
+from business_logic.arcanes_classes import DIAL_KEYS
+from business_logic.batch_engine import compute_charts, compute_dials
+from data_requests.triples_index import (
+    COMBINATION_KEYS,
+    expand_matches,
+    triple_codes,
+)
+
+# Длина окна - тройка арканов
+_WINDOW = 3
+
+
+class DialMatches(NamedTuple):
+    """Совпадения по окнам шкал: строка клиента, позиция начала окна
+    и номер комбинации в COMBINATION_KEYS"""
+
+    rows: np.ndarray
+    slots: np.ndarray
+    key_ids: np.ndarray
+
+
+def window_codes(rings: np.ndarray) -> np.ndarray:
+    """Коды троек всех окон шкал: матрица (клиенты x позиции)"""
+    rings = np.asarray(rings, dtype=np.int64)
+    # продолжение круга: окна в конце шкалы захватывают ее начало
+    closed = np.concatenate([rings, rings[:, : _WINDOW - 1]], axis=1)
+    slots = rings.shape[1]
+    return triple_codes(
+        closed[:, :slots], closed[:, 1: slots + 1], closed[:, 2: slots + 2])
+
+
+def scan_dials(rings: np.ndarray) -> DialMatches:
+    """Находит комбинации во всех окнах шкал сразу для списка клиентов.
+
+    Args:
+        rings (np.ndarray): шкалы (клиенты x 80), например compute_dials
+    Returns:
+        DialMatches: совпадения по строкам, затем по позициям окон
+    """
+    codes = window_codes(rings)
+    windows, key_ids = expand_matches(codes.ravel())
+    rows, slots = np.divmod(windows, codes.shape[1])
+    return DialMatches(rows=rows, slots=slots, key_ids=key_ids)
+
+
+def scan_roster(birthdays: np.ndarray) -> DialMatches:
+    """Комбинации на шкалах клиентов по датам рождения"""
+    return scan_dials(compute_dials(compute_charts(birthdays)))
+
+
+def create_dial_triples_dict(
+    ring: Mapping[str, int | str] | Sequence[int],
+) -> Dict[str, List[str]]:
+    """Создает словарь - ключи: комбинации арканов, найденные на шкале,
+    значения - ключи DIAL_KEYS позиций, с которых начинаются окна
+
+    Args:
+        ring (Mapping | Sequence): шкала get_full_dial (ключи DIAL_KEYS)
+                                   или 80 арканов в порядке DIAL_KEYS
+    Returns:
+        Dict[str, List[str]]: словарь комбинация - позиции шкалы
+    """
+    if isinstance(ring, Mapping):
+        ring = [int(ring[key]) for key in DIAL_KEYS]
+    matches = scan_dials(np.asarray(ring)[None, :])
+
+    dial_triples: Dict[str, List[str]] = {}
+    order = np.lexsort((matches.slots, matches.key_ids))
+    for key_id, slot in zip(
+        matches.key_ids[order].tolist(), matches.slots[order].tolist()
+    ):
+        dial_triples.setdefault(COMBINATION_KEYS[key_id], []).append(
+            DIAL_KEYS[slot])
+
+    return dial_triples
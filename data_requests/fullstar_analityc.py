@@ -1,8 +1,10 @@
-from typing import Dict, List
+from typing import Dict, List, Mapping
 from data_requests.triple_request import fill_star_triples, create_triples_dict
 
 
-def get_fullstar_analytic(fullstar_content: Dict[str, str]) -> Dict | None:
+def get_fullstar_analytic(
+    fullstar_content: Mapping[str, int | str],
+) -> Dict | None:
     # формируем заполненные тройки арканов
     triples_lst: List = fill_star_triples(content_dict=fullstar_content)
     # получаем словарь с ключами - тройками арканов для страницы аналитики
@@ -2,36 +2,81 @@ from business_logic.star_triples_data import fullstar_triples, Triple
 from business_logic.star_triples_data import fullstar_id
 from business_logic.star_triples_data import triples_combinations
 
+from dataclasses import replace
 from loguru import logger
-from utils.color_utils import repr_data
+from utils.transform_utils import repr_data
 
-from typing import List, Dict
+from typing import List, Dict, Mapping, Tuple
 
 
-def fill_star_triples(content_dict: Dict[str, str]) -> List[Triple]:
+# Индекс комбинация -> номера комбинаций в triples_combinations
+CombinationIndex = Dict[Tuple[int, ...], Tuple[int, ...]]
+
+
+def compile_combinations(
+    combinations: tuple = triples_combinations,
+) -> Tuple[CombinationIndex, CombinationIndex]:
+    """Компилирует комбинации арканов в хеш-индексы для поиска троек.
+
+    Тройка (a, b, c) совпадает с комбинацией из трех арканов, если равна
+    ей или ее развороту, и с комбинацией из двух арканов, если (a, b)
+    или (b, c) равны ей или ее развороту (см. are_tuples_identical).
+
+    Args:
+        combinations (tuple): комбинации из двух или трех арканов
+    Returns:
+        tuple: индекс троек и индекс пар
+    """
+    triples: Dict[Tuple[int, ...], List[int]] = {}
+    pairs: Dict[Tuple[int, ...], List[int]] = {}
+    for idx, combination in enumerate(combinations):
+        index = triples if len(combination) == 3 else pairs
+        for key in {tuple(combination), tuple(combination[::-1])}:
+            index.setdefault(key, []).append(idx)
+
+    return (
+        {key: tuple(value) for key, value in triples.items()},
+        {key: tuple(value) for key, value in pairs.items()},
+    )
+
+
+_TRIPLES_INDEX, _PAIRS_INDEX = compile_combinations()
+
+
+def match_combinations(values: Tuple[int, int, int]) -> List[int]:
+    """Возвращает номера комбинаций triples_combinations,
+    совпадающих с тройкой арканов, по возрастанию"""
+    matches = set(_TRIPLES_INDEX.get(values, ()))
+    matches.update(_PAIRS_INDEX.get(values[:2], ()))
+    matches.update(_PAIRS_INDEX.get(values[1:], ()))
+    return sorted(matches)
+
+
+def fill_star_triples(content_dict: Mapping[str, int | str]) -> List[Triple]:
     """Заполняет тройки в звезде соответствующими арканами
     Args:
-        content_dict (dict): арканы полной звезды
+        content_dict (Mapping): арканы полной звезды
 
     Returns:
-        List: список заполненных троек арканами
+        List: список новых заполненных троек арканами
+              (общие тройки fullstar_triples не изменяются)
     """
 
     fullstar_triples_value: List[Triple] = []
     for triple in fullstar_triples:
         first, second, third = triple.pos
-        triple.values = (
+        values = (
             arcane_from_number(first, content_dict),
             arcane_from_number(second, content_dict),
             arcane_from_number(third, content_dict),
         )
-        fullstar_triples_value.append(triple)
+        fullstar_triples_value.append(replace(triple, values=values))
     logger.debug(f"Заполненные тройки {repr_data(fullstar_triples_value)}")
 
     return fullstar_triples_value
 
 
-def arcane_from_number(key: int, content_dict: Dict[str, str]) -> int:
+def arcane_from_number(key: int, content_dict: Mapping[str, int | str]) -> int:
     """Возвращает значение аркана по номеру его позиции в словаре fullstar_dict
     Args:
         key (int): номер позиции аркана
@@ -41,7 +86,7 @@ def arcane_from_number(key: int, content_dict: Dict[str, str]) -> int:
         int: значение аркана
     """
     name: str | None = fullstar_id.get(key)
-    arcane: str = content_dict.get(name, "") if name else ""
+    arcane: int | str = content_dict.get(name, "") if name else ""
 
     return int(arcane)
 
@@ -60,14 +105,18 @@ def create_triples_dict(
     Returns:
         Dict[str, List[tuple]]: словарь комбинация - подсказка
     """
-    triples_dict = {}
-    for combination in triples_combinations:
-        for item in fullstar_triples_value:
-            triple: tuple | None = item.values
-
-            if triple and are_tuples_identical(combination, triple):
-                key: str = "-".join([str(n) for n in combination])
-                triples_dict.setdefault(key, []).append(item.name)
+    # имена троек для каждой совпавшей комбинации в порядке троек
+    matched: Dict[int, List[str]] = {}
+    for item in fullstar_triples_value:
+        if not item.values:
+            continue
+        for idx in match_combinations(item.values):
+            matched.setdefault(idx, []).append(item.name)
+
+    triples_dict: Dict[str, List[str]] = {}
+    for idx in sorted(matched):
+        key: str = "-".join([str(n) for n in triples_combinations[idx]])
+        triples_dict.setdefault(key, []).extend(matched[idx])
 
     return triples_dict
 
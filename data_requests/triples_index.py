@@ -0,0 +1,185 @@
+from functools import lru_cache
+from typing import Dict, Tuple
+
+import numpy as np
+
+from business_logic.batch_engine import compute_charts
+from business_logic.star_triples_data import fullstar_id, fullstar_triples
+from business_logic.star_triples_data import triples_combinations
+from data_requests.triple_request import match_combinations
+
+# Основание кодирования тройки в одно число: арканы 0..22
+_BASE = 23
+
+# Ключ индекса: комбинация "18-6-6" и название тройки (None - любая)
+IndexKey = Tuple[str, str | None]
+
+# Уникальные ключи комбинаций ("18-11-11" встречается в списке дважды)
+COMBINATION_KEYS: Tuple[str, ...] = tuple(
+    dict.fromkeys("-".join(str(n) for n in c) for c in triples_combinations)
+)
+TRIPLE_NAMES: Tuple[str, ...] = tuple(
+    dict.fromkeys(triple.name for triple in fullstar_triples)
+)
+
+
+def combination_key(combination: str | tuple) -> str:
+    """Ключ комбинации в формате create_triples_dict: "18-6-6" """
+    if isinstance(combination, str):
+        return combination
+    return "-".join(str(n) for n in combination)
+
+
+@lru_cache(maxsize=1)
+def match_table() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Совпадающие комбинации для каждого кода тройки a*23*23+b*23+c
+    в виде CSR: количество, начало и номера в COMBINATION_KEYS"""
+    key_ids = {key: idx for idx, key in enumerate(COMBINATION_KEYS)}
+    counts, flat = [], []
+    for a in range(_BASE):
+        for b in range(_BASE):
+            for c in range(_BASE):
+                matched = sorted({
+                    key_ids[combination_key(triples_combinations[idx])]
+                    for idx in match_combinations((a, b, c))
+                })
+                counts.append(len(matched))
+                flat.extend(matched)
+
+    counts_array = np.array(counts, dtype=np.int64)
+    starts = np.cumsum(counts_array) - counts_array
+    return counts_array, starts, np.array(flat, dtype=np.int64)
+
+
+def triple_codes(
+    first: np.ndarray, second: np.ndarray, third: np.ndarray
+) -> np.ndarray:
+    """Код тройки арканов a*23*23+b*23+c для строк match_table"""
+    return (first.astype(np.int64) * _BASE + second) * _BASE + third
+
+
+def expand_matches(codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Совпавшие комбинации для массива кодов троек.
+
+    Returns:
+        (номера кодов, повторенные по числу совпадений,
+         номера комбинаций в COMBINATION_KEYS)
+    """
+    counts_table, starts_table, keys_table = match_table()
+    counts = counts_table[codes]
+    rows = np.repeat(np.arange(len(codes)), counts)
+    offsets = np.arange(len(rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return rows, keys_table[starts_table[codes][rows] + offsets]
+
+
+def _sorted_unique(values: np.ndarray) -> np.ndarray:
+    values = np.sort(values)
+    keep = np.empty(len(values), dtype=bool)
+    keep[:1] = True
+    np.not_equal(values[1:], values[:-1], out=keep[1:])
+    return values[keep]
+
+
+class TriplesIndex:
+    """Обратный индекс комбинаций арканов Полной звезды по всем клиентам.
+
+    Для каждой комбинации triples_combinations и каждого названия тройки
+    fullstar_triples хранит отсортированный массив id клиентов,
+    у которых эта комбинация найдена. Клиенты добавляются порциями,
+    запрос - чтение готового массива из словаря.
+    """
+
+    def __init__(self) -> None:
+        self._ids: Dict[IndexKey, np.ndarray] = {}
+        self._clients = 0
+
+    def __len__(self) -> int:
+        return self._clients
+
+    def add_clients(self, client_ids: np.ndarray, birthdays: np.ndarray) -> None:
+        """Добавляет клиентов по датам рождения"""
+        self.add_charts(client_ids, compute_charts(birthdays))
+
+    def add_charts(
+        self, client_ids: np.ndarray, charts: Dict[str, np.ndarray]
+    ) -> None:
+        """Добавляет клиентов с уже рассчитанными арканами
+        (результат compute_charts)"""
+        ids = np.asarray(client_ids, dtype=np.int64)
+
+        found_keys, found_names, found_ids = [], [], []
+        for triple in fullstar_triples:
+            codes = triple_codes(
+                *(charts[fullstar_id[pos]] for pos in triple.pos))
+
+            # каждый клиент повторяется по числу совпавших комбинаций
+            rows, key_ids = expand_matches(codes)
+            found_keys.append(key_ids)
+            found_names.append(
+                np.full(len(rows), TRIPLE_NAMES.index(triple.name)))
+            found_ids.append(ids[rows])
+
+        keys = np.concatenate(found_keys)
+        names = np.concatenate(found_names)
+        members = np.concatenate(found_ids)
+
+        self._merge(keys, names, members)
+        self._merge(keys, None, members)
+        self._clients += len(ids)
+
+    def _merge(
+        self, keys: np.ndarray, names: np.ndarray | None, members: np.ndarray
+    ) -> None:
+        """Объединяет найденные пары (ключ, id) с индексом"""
+        groups = keys if names is None else keys * len(TRIPLE_NAMES) + names
+        order = np.argsort(groups, kind="stable")
+        groups, members = groups[order], members[order]
+
+        bounds = np.flatnonzero(np.diff(groups)) + 1
+        for start, end in zip(
+            np.concatenate(([0], bounds)), np.concatenate((bounds, [len(groups)]))
+        ):
+            if start == end:
+                continue
+            group = int(groups[start])
+            if names is None:
+                index_key: IndexKey = (COMBINATION_KEYS[group], None)
+            else:
+                key_id, name_id = divmod(group, len(TRIPLE_NAMES))
+                index_key = (COMBINATION_KEYS[key_id], TRIPLE_NAMES[name_id])
+
+            new_ids = members[start:end]
+            known = self._ids.get(index_key)
+            if known is not None:
+                new_ids = np.concatenate((known, new_ids))
+            ids = _sorted_unique(new_ids)
+            # query отдает массив без копии, поэтому он только для чтения
+            ids.setflags(write=False)
+            self._ids[index_key] = ids
+
+    def query(
+        self, combination: str | tuple, triple_name: str | None = None
+    ) -> np.ndarray:
+        """Возвращает отсортированные id клиентов с комбинацией
+
+        Args:
+            combination (str | tuple): комбинация, например "18-6-6"
+                                       или (18, 6, 6)
+            triple_name (str | None): название тройки fullstar_triples,
+                                      например "Треугольник Личность";
+                                      None - в любой тройке
+        Returns:
+            np.ndarray: id клиентов (только для чтения)
+        """
+        found = self._ids.get((combination_key(combination), triple_name))
+        if found is None:
+            return np.empty(0, dtype=np.int64)
+
+        return found
+
+    def counts(self) -> Dict[str, int]:
+        """Количество клиентов по каждой найденной комбинации"""
+        return {
+            key: len(ids) for (key, name), ids in self._ids.items()
+            if name is None
+        }
@@ -75,9 +75,11 @@ def enter_data() -> Scenario:
     print("1. Один взрослый (по умолчанию)")
     print("2. Один ребенок")
     print("3. Отношения в паре")
+    print("5. Группа / семья")
     print("11. Adult")
     print("22. Child")
     print("33. Couple")
+    print("55. Group")
     print("4. Выход")
 
     choice = input(
@@ -102,6 +104,16 @@ def enter_data() -> Scenario:
             client2 = input_client(is_adult=True)
             result = Scenario(scenario="couple", clients=[client1, client2])
 
+        case "5":
+            count = input("Количество участников (не меньше 2): ").strip()
+            while not count.isdigit() or int(count) < 2:
+                count = input("Количество участников (не меньше 2): ").strip()
+            clients = []
+            for idx in range(1, int(count) + 1):
+                print(f"\n--- Ввод данных для участника {idx} ---")
+                clients.append(input_client())
+            result = Scenario(scenario="group", clients=clients)
+
         case "11":
             birthday = datetime.strptime("7.12.1963", "%d.%m.%Y").date()
             result = Scenario(
@@ -130,6 +142,20 @@ def enter_data() -> Scenario:
             )
             return result
 
+        case "55":
+            birthday1 = datetime.strptime("7.12.1963", "%d.%m.%Y").date()
+            birthday2 = datetime.strptime("23.7.1982", "%d.%m.%Y").date()
+            birthday3 = datetime.strptime("16.02.2019", "%d.%m.%Y").date()
+            result = Scenario(
+                scenario="group",
+                clients=[
+                    Client(name="John", birthday=birthday1, gender="F"),
+                    Client(name="Jul", birthday=birthday2, gender="M"),
+                    Client(name="Jeck", birthday=birthday3, gender="M"),
+                ],
+            )
+            return result
+
         case _:
             raise ExitError("Выход из программы")
 
@@ -3,11 +3,15 @@
 from loguru import logger
 
 from business_logic.arcanes_classes import Scenario
+from business_logic.chart_cache import chart_cache
+from config.settings import REPORT_BUNDLE
 from input_module.input_data import enter_data
 from src.main_reports import (
     collect_adult_report,
+    collect_bundle_report,
     collect_child_report,
     collect_couple_report,
+    collect_group_report,
 )
 
 
@@ -16,6 +20,9 @@ def main() -> None:
     logger.debug(f"{scenario=}")
 
     match scenario.scenario:
+        case _ if REPORT_BUNDLE:
+            report = collect_bundle_report(scenario)
+
         case "adult":
             report = collect_adult_report(scenario.clients[0])
 
@@ -25,7 +32,11 @@ def main() -> None:
         case "couple":
             report = collect_couple_report(scenario)
 
+        case "group":
+            report = collect_group_report(scenario)
+
     logger.debug(f"{report}")
+    logger.debug(f"Кэш арканов: {chart_cache.stats()}")
     logger.info("Программа успешно завершила работу.")
 
 
@@ -2,15 +2,30 @@ from pathlib import Path
 
 from loguru import logger
 
-from business_logic.arcanes_classes import Client, Scenario
+from business_logic.arcanes_classes import (
+    TRIANGLES_NAMES,
+    ChartProfile,
+    Client,
+    Scenario,
+)
+from utils.pdf_creator import Page
+from utils.template_profiles import DEFAULT_PROFILE, ProfileType
 
 from .reports_collection import (
     collect_predict_report,
     collect_triangles_adult,
     collect_triangles_child,
+    couple_page,
+    create_bundle_report,
     create_couple_report,
     create_fullstar_report,
+    create_group_report,
     create_pythagorian_table,
+    fullstar_page,
+    group_pages,
+    predict_page,
+    pythagorian_page,
+    triangle_page,
 )
 
 
@@ -18,32 +33,41 @@ class ReportGenerationError(Exception):
     pass
 
 
-def _has_report(report: Path | list[Path] | None) -> None:
+def _has_report(report: Path | bytes | list[Path] | None) -> None:
     if not report:
         logger.error(f"Не создан отчет {report}")
         raise ReportGenerationError(f"Ошибка при генерации отчета {report}")
 
 
-def collect_adult_report(client_info: Client) -> list[Path]:
+def collect_adult_report(
+    client_info: Client,
+    profile: ChartProfile | None = None,
+    quality: ProfileType = DEFAULT_PROFILE,
+) -> list[Path]:
     """Собирает блок отчетов для одного взрослого клиента
     и возвращает список сформированных файлов отчетов.
+    Арканы клиента рассчитываются один раз (profile) для всех отчетов,
+    шаблоны берутся в варианте профиля качества quality.
     """
 
+    profile = profile or ChartProfile(client_info=client_info)
     adult_report = []
 
-    fullstar_report = create_fullstar_report(client_info=client_info)
+    fullstar_report = create_fullstar_report(profile=profile, quality=quality)
     _has_report(report=fullstar_report)
     adult_report.append(fullstar_report)
 
-    triangle_reports = collect_triangles_adult(client_info=client_info)
+    triangle_reports = collect_triangles_adult(
+        profile=profile, quality=quality)
     _has_report(report=triangle_reports)
     adult_report.append(triangle_reports)
 
-    predict_report = collect_predict_report(client_info=client_info)
+    predict_report = collect_predict_report(profile=profile, quality=quality)
     _has_report(report=predict_report)
     adult_report.append(predict_report)
 
-    pythagorian_report = create_pythagorian_table(client_info=client_info)
+    pythagorian_report = create_pythagorian_table(
+        profile=profile, quality=quality)
     _has_report(report=pythagorian_report)
     adult_report.append(pythagorian_report)
 
@@ -52,20 +76,26 @@ def collect_adult_report(client_info: Client) -> list[Path]:
     return adult_report
 
 
-def collect_child_report(client_info: Client) -> list[Path]:
+def collect_child_report(
+    client_info: Client,
+    profile: ChartProfile | None = None,
+    quality: ProfileType = DEFAULT_PROFILE,
+) -> list[Path]:
     """Собирает блок отчетов для ребенка
     и возвращает список сформированных файлов отчетов.
     """
 
+    profile = profile or ChartProfile(client_info=client_info)
     child_report = []
 
     triangle_reports = collect_triangles_child(
-        client_info=client_info, pointers=["personality", "money"]
+        profile=profile, pointers=["personality", "money"], quality=quality
     )
     _has_report(report=triangle_reports)
     child_report.append(triangle_reports)
 
-    pythagorian_report = create_pythagorian_table(client_info=client_info)
+    pythagorian_report = create_pythagorian_table(
+        profile=profile, quality=quality)
     _has_report(report=pythagorian_report)
     child_report.append(pythagorian_report)
 
@@ -74,21 +104,141 @@ def collect_child_report(client_info: Client) -> list[Path]:
     return child_report
 
 
-def collect_couple_report(scenario: Scenario) -> list[list[Path]]:
+def collect_couple_report(
+    scenario: Scenario, quality: ProfileType = DEFAULT_PROFILE
+) -> list[list[Path]]:
     """Собирает блок отчетов для пары
     и возвращает список сформированных файлов отчетов.
     """
 
+    profiles = [ChartProfile(client_info=client) for client in scenario.clients]
+
     couple_report = []
-    for client_info in scenario.clients:
-        client_report = collect_adult_report(client_info=client_info)
+    for profile in profiles:
+        client_report = collect_adult_report(
+            client_info=profile.client_info,
+            profile=profile,
+            quality=quality,
+        )
         _has_report(report=client_report)
         couple_report.append(client_report)
 
-    couple_relation_report = create_couple_report(scenario=scenario)
+    couple_relation_report = create_couple_report(
+        profiles=profiles, quality=quality)
     _has_report(report=couple_relation_report)
     couple_report.append(couple_relation_report)
 
     logger.debug("Все отчеты на пару созданы")
 
     return couple_report
+
+
+def collect_group_report(
+    scenario: Scenario, quality: ProfileType = DEFAULT_PROFILE
+) -> list[list[Path] | Path]:
+    """Собирает блок отчетов для группы (семьи) из K клиентов:
+    отчеты каждого участника и общий отчет группы.
+    """
+
+    if len(scenario.clients) < 2:
+        logger.error(f"В группе меньше двух клиентов: {scenario.clients}")
+        raise ReportGenerationError(
+            "Для отчета группы нужно не меньше двух клиентов")
+
+    profiles = [ChartProfile(client_info=client) for client in scenario.clients]
+
+    group_report: list[list[Path] | Path] = []
+    for profile in profiles:
+        client_report = collect_adult_report(
+            client_info=profile.client_info,
+            profile=profile,
+            quality=quality,
+        )
+        _has_report(report=client_report)
+        group_report.append(client_report)
+
+    group_relation_report = create_group_report(
+        profiles=profiles, quality=quality)
+    _has_report(report=group_relation_report)
+    group_report.append(group_relation_report)
+
+    logger.debug("Все отчеты на группу созданы")
+
+    return group_report
+
+
+def _adult_pages(profile: ChartProfile) -> list[Page]:
+    """Страницы отчетов взрослого в порядке collect_adult_report"""
+    return [
+        fullstar_page(profile),
+        *(triangle_page(profile, pointer) for pointer in TRIANGLES_NAMES),
+        predict_page(profile),
+        pythagorian_page(profile),
+    ]
+
+
+def _child_pages(profile: ChartProfile) -> list[Page]:
+    """Страницы отчетов ребенка в порядке collect_child_report"""
+    return [
+        triangle_page(profile, "personality"),
+        triangle_page(profile, "money"),
+        pythagorian_page(profile),
+    ]
+
+
+def collect_bundle_report(
+    scenario: Scenario,
+    quality: ProfileType = DEFAULT_PROFILE,
+    as_bytes: bool = False,
+) -> Path | bytes:
+    """Собирает все страницы сценария в один документ вместо отдельных
+    файлов collect_*_report: шрифты и шаблоны встраиваются один раз.
+
+    Args:
+        scenario (Scenario): сценарий и клиенты
+        quality (ProfileType): профиль качества шаблонов
+        as_bytes (bool): вернуть содержимое PDF без записи файла
+    Returns:
+        Path | bytes: путь к файлу отчета или содержимое PDF
+    """
+    profiles = [ChartProfile(client_info=client) for client in scenario.clients]
+
+    pages: list[Page] = []
+    match scenario.scenario:
+        case "adult":
+            pages = _adult_pages(profiles[0])
+
+        case "child":
+            pages = _child_pages(profiles[0])
+
+        case "couple":
+            for profile in profiles:
+                pages.extend(_adult_pages(profile))
+            pages.append(couple_page(profiles))
+
+        case "group":
+            if len(profiles) < 2:
+                logger.error(
+                    f"В группе меньше двух клиентов: {scenario.clients}")
+                raise ReportGenerationError(
+                    "Для отчета группы нужно не меньше двух клиентов")
+            for profile in profiles:
+                pages.extend(_adult_pages(profile))
+            pages.extend(group_pages(profiles))
+
+        case _:
+            logger.error(f"Неизвестный сценарий {scenario.scenario}")
+            raise ReportGenerationError(
+                f"Неизвестный сценарий {scenario.scenario}")
+
+    report = create_bundle_report(
+        name=profiles[0].client_info.name,
+        pages=pages,
+        quality=quality,
+        as_bytes=as_bytes,
+    )
+    _has_report(report=report)
+
+    logger.debug(f"Отчет сценария {scenario.scenario}: {len(pages)} страниц")
+
+    return report
@@ -1,22 +1,20 @@
 from pathlib import Path
 
+import numpy as np
 from loguru import logger
 
 from business_logic.arcanes_classes import (
+    MAIN_STAR_FIELDS,
     TRIANGLES_NAMES,
-    Client,
-    ErrorStar,
-    FooterStar,
-    MainStar,
-    MissionStar,
+    ChartProfile,
     PointerType,
-    PythagorianTable,
-    Scenario,
-    Triangle,
     combine_couple_star,
     get_full_dial,
+    get_fullstar,
     get_inner_star,
+    get_triangle,
 )
+from business_logic.couple_matrix import combine_group
 from config.settings import (
     COUPLE,
     FULLSTAR,
@@ -25,13 +23,19 @@ from config.settings import (
     PREDICT,
     TRIANGLES,
 )
-from utils.pdf_creator import generate_pdf
+from utils.pdf_creator import (
+    Page,
+    generate_multipage_pdf,
+    generate_pdf,
+    render_multipage_pdf,
+)
 from utils.render_context_builder import (
     build_dial_context,
     build_pythagorian_context,
     build_render_context,
     load_config,
 )
+from utils.template_profiles import DEFAULT_PROFILE, ProfileType
 from utils.transform_utils import repr_data
 
 
@@ -39,62 +43,148 @@ class DataCheckError(Exception):
     pass
 
 
-def create_fullstar_report(
-    client_info: Client, pointers: list[PointerType] = TRIANGLES_NAMES
-) -> Path:
-    mainstar = MainStar(client_info=client_info)
-    errorstar = ErrorStar(star=mainstar)
-    missionstar = MissionStar(star=mainstar, error=errorstar)
-    footerstar = FooterStar(client_info=client_info)
-    fullstar: dict = {
-        **mainstar.to_dict(),
-        **missionstar.to_dict(),
-        **errorstar.to_dict(),
-        **footerstar.to_dict(),
-    }
-
-    for pointer in pointers:
-        triangle_dict = Triangle(
-            star=mainstar, err=errorstar, pointer=pointer
-        ).to_dict_inverted()
-        fullstar = fullstar | triangle_dict  # main.py
+def fullstar_page(
+    profile: ChartProfile, pointers: list[PointerType] = TRIANGLES_NAMES
+) -> Page:
+    """Страница полной звезды: контекст и шаблон"""
+    fullstar = get_fullstar(profile, pointers)
 
     json_path = FULLSTAR.get("json", Path("."))
     config = load_config(json_path=json_path)
     context: dict[str, dict] = build_render_context(config, fullstar)
 
+    return context, FULLSTAR.get("jpg", Path("."))
+
+
+def triangle_page(profile: ChartProfile, pointer: PointerType) -> Page:
+    """Страница треугольника pointer: контекст и шаблон"""
+    triangle = get_triangle(profile, pointer)
+
+    json_path = TRIANGLES.get("json", Path("."))
+    config = load_config(json_path=json_path)
+    context: dict[str, dict] = build_render_context(config, triangle)
+
+    return context, TRIANGLES.get(pointer, Path("."))
+
+
+def predict_page(profile: ChartProfile) -> Page:
+    """Страница прогноза: внутренняя звезда и шкала"""
+    inner_star = get_inner_star(profile)
+    full_dial = get_full_dial(profile)
+
+    json_path = PREDICT.get("json", Path("."))
+    config = load_config(json_path=json_path[0])
+    context_star: dict[str, dict] = build_render_context(config, inner_star)
+
+    config = load_config(json_path=json_path[1])
+    context_dial: dict[str, dict] = build_dial_context(config, full_dial)
+    context = context_star | context_dial
+
+    return context, PREDICT.get("jpg", Path("."))
+
+
+def pythagorian_page(profile: ChartProfile) -> Page:
+    """Страница таблицы Пифагора: контекст и шаблон"""
+    pythagorian_table = profile.pythagorian_table.to_payload()
+
+    json_path = PITHAGORIAN_TABLE.get("json", Path("."))
+    config = load_config(json_path=json_path)
+    context: dict[str, dict] = build_pythagorian_context(
+        config, pythagorian_table)
+
+    logger.debug(f"{pythagorian_table=}")
+    logger.debug(f"pythagorian{context=}")
+
+    return context, PITHAGORIAN_TABLE.get("jpg", Path("."))
+
+
+def couple_page(profiles: list[ChartProfile]) -> Page:
+    """Страница звезды пары первых двух клиентов"""
+    couple_dict = combine_couple_star(
+        star1=profiles[0].mainstar, star2=profiles[1].mainstar
+    )
+
+    logger.debug(f"{couple_dict=}")
+
+    json_path = COUPLE.get("json", Path("."))
+    config = load_config(json_path=json_path)
+    context: dict[str, dict] = build_render_context(config, couple_dict)
+
+    return context, COUPLE.get("jpg", Path("."))
+
+
+def group_pages(profiles: list[ChartProfile]) -> list[Page]:
+    """Страницы группы: звезда всей группы и звезды всех пар участников.
+    Арканы участников берутся из уже рассчитанных профилей.
+    """
+    names = [profile.client_info.name for profile in profiles]
+    stars = np.array(
+        [
+            [profile.values[field] for field in MAIN_STAR_FIELDS]
+            for profile in profiles
+        ],
+        dtype=np.uint8,
+    )
+    pairs, pair_stars, group_star = combine_group(stars)
+
+    group_dicts: list[dict[str, int | str]] = [
+        dict(zip(MAIN_STAR_FIELDS, group_star.tolist()))
+        | {"header_text": " + ".join(names)}
+    ]
+    for (left, right), star in zip(pairs.tolist(), pair_stars.tolist()):
+        group_dicts.append(
+            dict(zip(MAIN_STAR_FIELDS, star))
+            | {"header_text": f"{names[left]} + {names[right]}"}
+        )
+
+    logger.debug(f"{group_dicts=}")
+
+    json_path = COUPLE.get("json", Path("."))
+    config = load_config(json_path=json_path)
+    template_path = COUPLE.get("jpg", Path("."))
+    return [
+        (build_render_context(config, group_dict), template_path)
+        for group_dict in group_dicts
+    ]
+
+
+def create_fullstar_report(
+    profile: ChartProfile,
+    pointers: list[PointerType] = TRIANGLES_NAMES,
+    quality: ProfileType = DEFAULT_PROFILE,
+) -> Path:
+    client_info = profile.client_info
+    context, template_path = fullstar_page(profile, pointers)
+
     fullstar_path: Path = OUTPUT_PATH / f"{client_info.name}_fullstar.pdf"
-    template_path = FULLSTAR.get("jpg", Path("."))
 
     # TODO: реализовать функцию создания текстовых страниц описания звезды
     result: Path = generate_pdf(
-        output_path=fullstar_path, template=template_path, page_data=context
+        output_path=fullstar_path,
+        template=template_path,
+        page_data=context,
+        profile=quality,
     )
 
     return result
 
 
 def collect_triangles_adult(
-    client_info: Client, pointers: list[PointerType] = TRIANGLES_NAMES
+    profile: ChartProfile,
+    pointers: list[PointerType] = TRIANGLES_NAMES,
+    quality: ProfileType = DEFAULT_PROFILE,
 ) -> list[Path]:
-    mainstar = MainStar(client_info=client_info)
-    errorstar = ErrorStar(star=mainstar)
+    client_info = profile.client_info
 
-    result_list = [Path, ...]
+    result_list: list[Path] = []
     for pointer in pointers:
-        triangle: dict = Triangle(
-            star=mainstar, err=errorstar, pointer=pointer
-        ).to_dict()
+        context, template_path = triangle_page(profile, pointer)
 
         triangle_path: Path = OUTPUT_PATH / f"{client_info.name}_{pointer}.pdf"
 
-        json_path = TRIANGLES.get("json", Path("."))
-        config = load_config(json_path=json_path)
-        context: dict[str, dict] = build_render_context(config, triangle)
-        template_path: Path = TRIANGLES.get(pointer, Path("."))
-
         result = generate_pdf(
-            triangle_path, template=template_path, page_data=context)
+            triangle_path, template=template_path, page_data=context,
+            profile=quality)
 
         result_list.append(result)
 
@@ -104,97 +194,119 @@ def collect_triangles_adult(
 
 
 def collect_triangles_child(
-    client_info: Client, pointers: list[PointerType] = ["personality", "money"]
+    profile: ChartProfile,
+    pointers: list[PointerType] = ["personality", "money"],
+    quality: ProfileType = DEFAULT_PROFILE,
 ) -> list[Path]:
     # NOTE::будет использовано для выбора детского словаря
     is_child: bool = True
 
-    mainstar = MainStar(client_info=client_info)
-    errorstar = ErrorStar(star=mainstar)
+    client_info = profile.client_info
 
-    result_list = [Path, ...]
+    result_list: list[Path] = []
     for pointer in pointers:
-        triangle: dict = Triangle(
-            star=mainstar, err=errorstar, pointer=pointer
-        ).to_dict()
+        context, template_path = triangle_page(profile, pointer)
 
         triangle_path: Path = OUTPUT_PATH / f"{client_info.name}_{pointer}.pdf"
 
-        json_path = TRIANGLES.get("json", Path("."))
-        config = load_config(json_path=json_path)
-        context: dict[str, dict] = build_render_context(config, triangle)
-        template_path: Path = TRIANGLES.get(pointer, Path("."))
-
         result = generate_pdf(
-            triangle_path, template=template_path, page_data=context)
+            triangle_path, template=template_path, page_data=context,
+            profile=quality)
 
         result_list.append(result)
     # TODO: создать функцию создания текстовых страниц детских треугольников
     return result_list
 
 
-def collect_predict_report(client_info: Client) -> Path:
-    inner_star = get_inner_star(client_info)
-    full_dial = get_full_dial(client_info)
-
-    json_path = PREDICT.get("json", Path("."))
-    config = load_config(json_path=json_path[0])
-    context_star: dict[str, dict] = build_render_context(config, inner_star)
-
-    config = load_config(json_path=json_path[1])
-    context_dial: dict[str, dict] = build_dial_context(config, full_dial)
-    context = context_star | context_dial
+def collect_predict_report(
+    profile: ChartProfile, quality: ProfileType = DEFAULT_PROFILE
+) -> Path:
+    client_info = profile.client_info
+    context, template_path = predict_page(profile)
 
     predict_path: Path = OUTPUT_PATH / f"{client_info.name}_predict.pdf"
-    template_path = PREDICT.get("jpg", Path("."))
     result: Path = generate_pdf(
-        output_path=predict_path, template=template_path, page_data=context
+        output_path=predict_path,
+        template=template_path,
+        page_data=context,
+        profile=quality,
     )
     # TODO: создать функцию создания текстовых страниц predict
     return result
 
 
-def create_couple_report(scenario: Scenario) -> Path:
-    client_info1 = scenario.clients[0]
-    client_info2 = scenario.clients[1]
-
-    star1 = MainStar(client_info=client_info1)
-    star2 = MainStar(client_info=client_info2)
-
-    couple_dict = combine_couple_star(star1=star1, star2=star2)
-
-    logger.debug(f"{couple_dict=}")
-
-    json_path = COUPLE.get("json", Path("."))
-    config = load_config(json_path=json_path)
-    context: dict[str, dict] = build_render_context(config, couple_dict)
+def create_couple_report(
+    profiles: list[ChartProfile], quality: ProfileType = DEFAULT_PROFILE
+) -> Path:
+    client_info1 = profiles[0].client_info
+    context, template_path = couple_page(profiles)
 
     couple_path: Path = OUTPUT_PATH / f"{client_info1.name}_couple.pdf"
-    template_path = COUPLE.get("jpg", Path("."))
 
     # TODO: реализовать функцию создания текстовых страниц описания пары
     result: Path = generate_pdf(
-        output_path=couple_path, template=template_path, page_data=context
+        output_path=couple_path,
+        template=template_path,
+        page_data=context,
+        profile=quality,
     )
     return result
 
 
-def create_pythagorian_table(client_info: Client) -> Path:
-    pythagorian_table = PythagorianTable(client_info).to_dict()
+def create_group_report(
+    profiles: list[ChartProfile], quality: ProfileType = DEFAULT_PROFILE
+) -> Path:
+    """Отчет группы: звезда всей группы и звезды всех пар участников
+    в одном файле.
+    """
+    client_info = profiles[0].client_info
+    pages = group_pages(profiles)
+
+    group_path: Path = OUTPUT_PATH / f"{client_info.name}_group.pdf"
+    result: Path = generate_multipage_pdf(
+        output_path=group_path, pages=pages, profile=quality)
+    return result
 
-    json_path = PITHAGORIAN_TABLE.get("json", Path("."))
-    config = load_config(json_path=json_path)
-    context: dict[str, dict] = build_pythagorian_context(
-        config, pythagorian_table)
 
-    logger.debug(f"{pythagorian_table=}")
-    logger.debug(f"pythagorian{context=}")
+def create_pythagorian_table(
+    profile: ChartProfile, quality: ProfileType = DEFAULT_PROFILE
+) -> Path:
+    client_info = profile.client_info
+    context, template_path = pythagorian_page(profile)
 
     pythagorian_path: Path = OUTPUT_PATH / \
         f"{client_info.name}_pythagorian.pdf"
-    template_path = PITHAGORIAN_TABLE.get("jpg", Path("."))
     result: Path = generate_pdf(
-        output_path=pythagorian_path, template=template_path, page_data=context
+        output_path=pythagorian_path,
+        template=template_path,
+        page_data=context,
+        profile=quality,
     )
     # TODO: создать функцию создания текстовых страниц predict
     return result
+
+
+def create_bundle_report(
+    name: str,
+    pages: list[Page],
+    quality: ProfileType = DEFAULT_PROFILE,
+    as_bytes: bool = False,
+) -> Path | bytes:
+    """Все страницы сценария в одном документе: шрифты и шаблоны
+    встраиваются в него один раз.
+
+    Args:
+        name (str): имя клиента для имени файла отчета
+        pages (list): пары (page_data, шаблон) в порядке страниц
+        quality (ProfileType): профиль качества шаблонов
+        as_bytes (bool): вернуть содержимое PDF без записи файла
+    Returns:
+        Path | bytes: путь к файлу отчета или содержимое PDF
+    """
+    if as_bytes:
+        return render_multipage_pdf(pages=pages, profile=quality)
+
+    bundle_path: Path = OUTPUT_PATH / f"{name}_bundle.pdf"
+    result: Path = generate_multipage_pdf(
+        output_path=bundle_path, pages=pages, profile=quality)
+    return result
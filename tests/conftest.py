@@ -0,0 +1,10 @@
+import pytest
+
+from business_logic.chart_cache import chart_cache
+
+
+@pytest.fixture(autouse=True)
+def no_chart_cache():
+    """Тесты проверяют расчет арканов, а не общий кэш процесса"""
+    with chart_cache.disabled():
+        yield
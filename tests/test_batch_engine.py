@@ -0,0 +1,116 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from business_logic.arcanes_classes import (
+    CHART_FIELDS,
+    DIAL_KEYS,
+    TRIANGLE_FIELDS,
+    TRIANGLES_NAMES,
+    ChartProfile,
+    Client,
+    ErrorStar,
+    FooterStar,
+    MainStar,
+    MissionStar,
+    PythagorianTable,
+    Triangle,
+    get_full_dial,
+)
+from business_logic.batch_engine import (
+    compute_charts,
+    compute_dials,
+    compute_pythagorian,
+    split_birthdays,
+)
+
+
+def scalar_chart(birthday: date) -> dict[str, int]:
+    """Карта клиента, рассчитанная эталонными скалярными классами"""
+    client = Client(name="Тест", birthday=birthday, gender="M")
+    star = MainStar(client_info=client)
+    err = ErrorStar(star=star)
+    objects = [star, err, MissionStar(star=star, error=err),
+               FooterStar(client_info=client)]
+
+    chart = {}
+    for field in CHART_FIELDS:
+        for obj in objects:
+            if hasattr(obj, field):
+                chart[field] = getattr(obj, field)
+                break
+    for pointer in TRIANGLES_NAMES:
+        triangle = Triangle(star=star, err=err, pointer=pointer)
+        for field in TRIANGLE_FIELDS:
+            chart[f"{pointer}_{field}"] = getattr(triangle, field)
+    return chart
+
+
+@pytest.fixture(scope="module")
+def sample_dates() -> list[date]:
+    start, end = date(1900, 1, 1), date(2100, 12, 31)
+    days = (end - start).days
+    return [start + timedelta(days=n) for n in range(0, days + 1, 5)] + [end]
+
+
+def test_split_birthdays():
+    day, month, year = split_birthdays(
+        np.array(["1963-12-07", "2000-02-29"], dtype="datetime64[D]")
+    )
+    assert day.tolist() == [7, 29]
+    assert month.tolist() == [12, 2]
+    assert year.tolist() == [1963, 2000]
+
+
+def test_compute_charts_matches_scalar_classes(sample_dates):
+    charts = compute_charts(np.array(sample_dates, dtype="datetime64[D]"))
+
+    assert set(charts) == set(CHART_FIELDS)
+    for idx, birthday in enumerate(sample_dates):
+        expected = scalar_chart(birthday)
+        actual = {field: int(charts[field][idx]) for field in CHART_FIELDS}
+        assert actual == expected, birthday
+
+
+def test_compute_charts_accepts_date_objects():
+    charts = compute_charts([date(1990, 5, 15)])
+    assert charts["personality"].tolist() == [15]
+    assert charts["money"].tolist() == [19]
+
+
+def test_compute_dials_matches_full_dial(sample_dates):
+    dates = sample_dates[::10]
+    dials = compute_dials(compute_charts(np.array(dates)))
+
+    assert dials.shape == (len(dates), len(DIAL_KEYS))
+    for idx, birthday in enumerate(dates):
+        profile = ChartProfile(Client(name="Тест", birthday=birthday,
+                                      gender="M"))
+        assert get_full_dial(profile) == dict(
+            zip(DIAL_KEYS, dials[idx].tolist()))
+
+
+def test_compute_pythagorian_matches_table():
+    # даты по обе стороны 2000 года и однозначные/двузначные дни
+    birthdays = [date(1960, 1, 1) + timedelta(days=n * 3) for n in range(6000)]
+    result = compute_pythagorian(np.array(birthdays))
+
+    for idx, birthday in enumerate(birthdays):
+        table = PythagorianTable(Client(name="Тест", birthday=birthday, gender="M"))
+        numbers = [table.number_1, table.number_2, table.number_3,
+                   table.number_4, table.number_5]
+        assert [int(result[f"number_{n}"][idx]) for n in range(1, 6)] == numbers
+        assert tuple(result["digit_counts"][idx].tolist()) == table.digit_counts
+        for name, value in table.line_sums.items():
+            assert result[name][idx] == value
+
+
+def test_pythagorian_line_sums():
+    table = PythagorianTable(Client(name="Тест", birthday=date(1963, 12, 7), gender="M"))
+    extended = table.to_extended_dict()
+    counts = [extended[str(d)] for d in range(1, 10)]
+
+    assert sum(counts) == extended["row_1"] + extended["row_2"] + extended["row_3"]
+    assert extended["column_2"] == counts[1] + counts[4] + counts[7]
+    assert extended["anti_diagonal"] == counts[2] + counts[4] + counts[6]
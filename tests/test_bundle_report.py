@@ -0,0 +1,66 @@
+import re
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from business_logic.arcanes_classes import Client, Scenario
+from src import main_reports, reports_collection
+from utils import template_profiles
+
+
+@pytest.fixture(autouse=True)
+def output_path(monkeypatch, tmp_path) -> Path:
+    monkeypatch.setattr(reports_collection, "OUTPUT_PATH", tmp_path)
+    # варианты шаблонов профилей строятся вне репозитория
+    monkeypatch.setattr(
+        template_profiles, "PROFILES_PATH", tmp_path / "profiles")
+    return tmp_path
+
+
+def _files(report) -> list[Path]:
+    if isinstance(report, list):
+        return [path for item in report for path in _files(item)]
+    return [report]
+
+
+def test_adult_bundle_shares_fonts_and_templates():
+    client = Client(name="John", birthday=date(1963, 12, 7), gender="M")
+    scenario = Scenario(scenario="adult", clients=[client])
+
+    files = _files(main_reports.collect_adult_report(client))
+    bundle = main_reports.collect_bundle_report(scenario, as_bytes=True)
+
+    assert isinstance(bundle, bytes)
+    assert len(files) == 8
+    assert len(re.findall(rb"/Type /Page\b", bundle)) == 8
+    # каждый шаблон и каждый шрифт встроены один раз
+    assert len(re.findall(rb"/Subtype /Image", bundle)) == 8
+    fonts = sum(
+        len(re.findall(rb"/FontFile2", path.read_bytes())) for path in files)
+    assert len(re.findall(rb"/FontFile2", bundle)) < fonts
+    assert len(bundle) < sum(path.stat().st_size for path in files)
+
+
+def test_bundle_written_to_output(output_path):
+    scenario = Scenario(
+        scenario="child",
+        clients=[Client(name="Jeck", birthday=date(2019, 2, 16), gender="M")],
+    )
+
+    report = main_reports.collect_bundle_report(scenario, quality="preview")
+
+    assert isinstance(report, Path)
+    assert report == output_path / "Jeck_bundle.pdf"
+    # два треугольника и таблица Пифагора
+    assert len(re.findall(rb"/Type /Page\b", report.read_bytes())) == 3
+
+
+def test_bundle_unknown_scenario():
+    scenario = Scenario(
+        scenario="family",  # type: ignore
+        clients=[Client(name="Jeck", birthday=date(2019, 2, 16), gender="M")],
+    )
+
+    with pytest.raises(main_reports.ReportGenerationError):
+        main_reports.collect_bundle_report(scenario, as_bytes=True)
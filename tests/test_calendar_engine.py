@@ -0,0 +1,80 @@
+import csv
+import json
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from business_logic.arcanes_classes import Client, MainStar, digital_root
+from business_logic.calendar_engine import (
+    iter_calendar,
+    period_dates,
+    write_calendar,
+)
+
+BIRTHDAYS = [date(1940, 3, 1) + timedelta(days=n * 211) for n in range(40)]
+
+
+def _expected(birthday: date, day: date) -> tuple[int, int, int]:
+    star = MainStar(Client(name="Тест", birthday=birthday, gender="M"))
+    personal_year = digital_root(
+        star.personality + star.spirituality + digital_root(day.year))
+    personal_month = digital_root(personal_year + day.month)
+    personal_day = digital_root(personal_month + day.day)
+    return personal_year, personal_month, personal_day
+
+
+def test_daily_calendar_matches_main_star():
+    blocks = list(iter_calendar(
+        np.arange(len(BIRTHDAYS)), np.array(BIRTHDAYS),
+        date(2024, 12, 25), date(2025, 2, 3), chunk_size=16))
+
+    assert [len(block.client_ids) for block in blocks] == [16, 16, 8]
+    for block in blocks:
+        assert block.personal_day is not None
+        for row, client_id in enumerate(block.client_ids.tolist()):
+            for col, day in enumerate(block.dates.tolist()):
+                assert (
+                    block.personal_year[row, col],
+                    block.personal_month[row, col],
+                    block.personal_day[row, col],
+                ) == _expected(BIRTHDAYS[client_id], day)
+
+
+def test_monthly_periods():
+    dates = period_dates(date(2024, 11, 15), date(2025, 2, 1), "month")
+    assert dates.tolist() == [
+        date(2024, 11, 1), date(2024, 12, 1), date(2025, 1, 1), date(2025, 2, 1)]
+    with pytest.raises(ValueError):
+        period_dates(date(2025, 1, 1), date(2024, 1, 1))
+
+
+@pytest.mark.parametrize("period", ["day", "month"])
+def test_write_calendar_csv_and_jsonl(tmp_path, period):
+    ids = np.arange(100, 100 + len(BIRTHDAYS))
+    start, end = date(2025, 1, 30), date(2025, 3, 2)
+
+    def blocks():
+        return iter_calendar(
+            ids, np.array(BIRTHDAYS), start, end, period, chunk_size=7)
+
+    csv_rows = write_calendar(tmp_path / "calendar.csv", blocks(), "csv")
+    jsonl_rows = write_calendar(tmp_path / "calendar.jsonl", blocks(), "jsonl")
+
+    with open(tmp_path / "calendar.csv", encoding="utf-8") as f:
+        records = list(csv.DictReader(f))
+    with open(tmp_path / "calendar.jsonl", encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+
+    assert csv_rows == jsonl_rows == len(records) == len(lines)
+    for record, line in zip(records, lines):
+        birthday = BIRTHDAYS[int(record["client_id"]) - 100]
+        day = date.fromisoformat(record["date"])
+        expected = _expected(birthday, day)
+        assert int(record["personal_year"]) == line["personal_year"] == expected[0]
+        assert int(record["personal_month"]) == line["personal_month"] == expected[1]
+        if period == "day":
+            assert int(record["personal_day"]) == line["personal_day"] == expected[2]
+        else:
+            assert "personal_day" not in line
+        assert line["client_id"] == int(record["client_id"])
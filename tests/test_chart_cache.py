@@ -0,0 +1,72 @@
+import threading
+from datetime import date
+
+import pytest
+
+from business_logic.arcanes_classes import ChartProfile, Client, get_fullstar
+from business_logic.chart_cache import ChartCache, chart_cache
+
+
+def test_lru_eviction_and_stats():
+    cache: ChartCache[int] = ChartCache(maxsize=2)
+    d1, d2, d3 = date(2000, 1, 1), date(2000, 1, 2), date(2000, 1, 3)
+
+    assert cache.get(d1, lambda: 1) == 1
+    assert cache.get(d2, lambda: 2) == 2
+    assert cache.get(d1, lambda: -1) == 1  # d1 становится свежим
+    assert cache.get(d3, lambda: 3) == 3  # вытесняет d2
+    assert cache.get(d2, lambda: 22) == 22
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions) == (1, 4, 2)
+    assert stats.size == 2
+    assert stats.hit_rate == pytest.approx(0.2)
+
+
+def test_disabled_cache_always_computes():
+    cache: ChartCache[int] = ChartCache(maxsize=10)
+    with cache.disabled():
+        assert cache.get(date(2000, 1, 1), lambda: 1) == 1
+        assert cache.get(date(2000, 1, 1), lambda: 2) == 2
+    assert cache.stats().size == 0
+    assert cache.enabled
+
+
+def test_cache_is_thread_safe():
+    cache: ChartCache[int] = ChartCache(maxsize=50)
+    dates = [date(2000, 1, day) for day in range(1, 32)]
+
+    def worker():
+        for _ in range(200):
+            for birthday in dates:
+                assert cache.get(birthday, lambda b=birthday: b.day) \
+                    == birthday.day
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert stats.hits + stats.misses == 8 * 200 * len(dates)
+    assert stats.size == len(dates)
+
+
+def test_profiles_share_values_by_birthday():
+    chart_cache.clear()
+    birthday = date(1963, 12, 7)
+    chart_cache.configure(enabled=True)
+    try:
+        first = ChartProfile(Client(name="John", birthday=birthday,
+                                    gender="M"))
+        second = ChartProfile(Client(name="Jul", birthday=birthday,
+                                     gender="F"))
+
+        assert first.values is second.values
+        assert get_fullstar(first)["header_text"] == "John 07.12.63"
+        assert get_fullstar(second)["header_text"] == "Jul 07.12.63"
+        assert chart_cache.stats().hits == 1
+    finally:
+        chart_cache.configure(enabled=False)
+        chart_cache.clear()
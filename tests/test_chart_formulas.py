@@ -0,0 +1,63 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from business_logic.arcanes_classes import (
+    CHART_FIELDS,
+    DIAL_KEYS,
+    ChartProfile,
+    Client,
+    get_full_dial,
+)
+from business_logic.batch_engine import compute_charts, compute_dials
+from business_logic.chart_formulas import compile_formulas, load_plan
+
+BIRTHDAYS = [date(1900, 1, 1) + timedelta(days=n * 17) for n in range(4300)]
+
+
+def test_plan_matches_chart_classes():
+    plan = load_plan()
+    assert list(plan.outputs) == list(CHART_FIELDS) + list(DIAL_KEYS)
+
+    for birthday in BIRTHDAYS[::7]:
+        profile = ChartProfile(Client(name="Тест", birthday=birthday, gender="M"))
+        expected = dict(profile.values) | dict(get_full_dial(profile))
+        assert plan.evaluate(birthday) == expected
+
+
+def test_batch_plan_matches_batch_engine():
+    plan = load_plan()
+    birthdays = np.array(BIRTHDAYS)
+
+    result = plan.evaluate_batch(birthdays)
+    charts = compute_charts(birthdays)
+    dials = compute_dials(charts)
+
+    for field in CHART_FIELDS:
+        assert np.array_equal(result[field], charts[field])
+    for idx, key in enumerate(DIAL_KEYS):
+        assert np.array_equal(result[key], dials[:, idx])
+
+
+def test_common_subexpressions_computed_once():
+    plan = load_plan()
+    # вершины треугольников и основная шкала ссылаются на уже
+    # рассчитанные позиции, совпадающие суммы не повторяются
+    assert len(plan.steps) < len(plan.outputs)
+    assert plan.outputs["personality_vertex"] == plan.outputs["personality"]
+    assert plan.outputs["main_3"] == plan.outputs["err_personality"]
+    assert len({(s.arcanes_number, s.terms) for s in plan.steps}) == len(plan.steps)
+
+
+@pytest.mark.parametrize(
+    "formulas",
+    [
+        {"a": {"sum": ["b"]}, "b": {"sum": ["a"]}},
+        {"a": {"sum": ["unknown"]}},
+    ],
+)
+def test_invalid_formulas(formulas):
+    spec = {"inputs": {"day": 31, "month": 12, "year": 9999}, "formulas": formulas}
+    with pytest.raises(ValueError):
+        compile_formulas(spec)
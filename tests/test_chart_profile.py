@@ -0,0 +1,162 @@
+from collections import Counter
+from datetime import date
+from functools import cached_property
+from pathlib import Path
+
+import pytest
+
+from business_logic import arcanes_classes
+from business_logic.arcanes_classes import Client, Scenario
+from src import main_reports, reports_collection
+
+CHART_CLASSES = (
+    arcanes_classes.MainStar,
+    arcanes_classes.ErrorStar,
+    arcanes_classes.MissionStar,
+    arcanes_classes.FooterStar,
+    arcanes_classes.TriangleSet,
+    arcanes_classes.PythagorianTable,
+)
+
+
+@pytest.fixture
+def computations(monkeypatch) -> Counter:
+    """Считает вычисления каждого значения арканов"""
+    counter: Counter = Counter()
+
+    def counted(cls, name, func):
+        def wrapper(self):
+            counter[(cls.__name__, getattr(self, "pointer", ""), name)] += 1
+            return func(self)
+
+        prop = cached_property(wrapper)
+        prop.__set_name__(cls, name)
+        return prop
+
+    for cls in CHART_CLASSES:
+        for name, attr in list(vars(cls).items()):
+            if isinstance(attr, cached_property):
+                monkeypatch.setattr(cls, name, counted(cls, name, attr.func))
+
+    return counter
+
+
+@pytest.fixture(autouse=True)
+def no_pdf(mocker):
+    mocker.patch.object(
+        reports_collection, "render_multipage_pdf", return_value=b"%PDF")
+    mocker.patch.object(
+        reports_collection,
+        "generate_multipage_pdf",
+        side_effect=lambda output_path, **kwargs: Path(output_path),
+    )
+    return mocker.patch.object(
+        reports_collection,
+        "generate_pdf",
+        side_effect=lambda output_path, **kwargs: Path(output_path),
+    )
+
+
+def test_adult_bundle_computes_each_value_once(computations):
+    client = Client(name="John", birthday=date(1963, 12, 7), gender="M")
+
+    main_reports.collect_adult_report(client_info=client)
+
+    assert computations
+    assert set(computations.values()) == {1}
+    # все треугольники и звезды действительно участвовали в отчетах
+    assert ("TriangleSet", "", "rows") in computations
+    assert ("FooterStar", "", "foot_health") in computations
+
+
+def test_couple_bundle_computes_each_value_once_per_client(computations):
+    scenario = Scenario(
+        scenario="couple",
+        clients=[
+            Client(name="John", birthday=date(1963, 12, 7), gender="F"),
+            Client(name="Jul", birthday=date(1982, 7, 23), gender="M"),
+        ],
+    )
+
+    main_reports.collect_couple_report(scenario)
+
+    assert computations
+    assert set(computations.values()) == {2}
+
+
+def test_group_bundle_computes_each_value_once_per_client(computations):
+    scenario = Scenario(
+        scenario="group",
+        clients=[
+            Client(name="John", birthday=date(1963, 12, 7), gender="F"),
+            Client(name="Jul", birthday=date(1982, 7, 23), gender="M"),
+            Client(name="Jeck", birthday=date(2019, 2, 16), gender="M"),
+        ],
+    )
+
+    main_reports.collect_group_report(scenario)
+
+    assert computations
+    assert set(computations.values()) == {3}
+
+
+def test_group_report_pages(mocker):
+    clients = [
+        Client(name="John", birthday=date(1963, 12, 7), gender="F"),
+        Client(name="Jul", birthday=date(1982, 7, 23), gender="M"),
+        Client(name="Jeck", birthday=date(2019, 2, 16), gender="M"),
+    ]
+    profiles = [arcanes_classes.ChartProfile(client) for client in clients]
+    build = mocker.spy(reports_collection, "build_render_context")
+
+    reports_collection.create_group_report(profiles)
+
+    payloads = [call.args[1] for call in build.call_args_list]
+    # звезда группы и три пары
+    assert len(payloads) == 4
+    assert payloads[0]["header_text"] == "John + Jul + Jeck"
+    pairs = [(0, 1), (0, 2), (1, 2)]
+    for (left, right), payload in zip(pairs, payloads[1:]):
+        expected = arcanes_classes.combine_couple_star(
+            profiles[left].mainstar, profiles[right].mainstar)
+        assert payload == expected
+    for field in arcanes_classes.MAIN_STAR_FIELDS:
+        total = sum(profile.values[field] for profile in profiles)
+        assert payloads[0][field] == arcanes_classes.digital_root(total)
+
+
+def test_triangle_reports_list_only_paths():
+    profile = arcanes_classes.ChartProfile(
+        Client(name="John", birthday=date(1963, 12, 7), gender="M"))
+
+    adult = reports_collection.collect_triangles_adult(profile)
+    child = reports_collection.collect_triangles_child(profile)
+
+    assert adult == [Path(f"output/John_{name}.pdf")
+                     for name in arcanes_classes.TRIANGLES_NAMES]
+    assert child == [Path("output/John_personality.pdf"),
+                     Path("output/John_money.pdf")]
+
+
+def test_couple_single_document_computes_each_value_once_per_client(
+    computations,
+):
+    scenario = Scenario(
+        scenario="couple",
+        clients=[
+            Client(name="John", birthday=date(1963, 12, 7), gender="F"),
+            Client(name="Jul", birthday=date(1982, 7, 23), gender="M"),
+        ],
+    )
+    generate = reports_collection.generate_multipage_pdf
+
+    report = main_reports.collect_bundle_report(scenario, quality="screen")
+
+    assert report == Path("output/John_bundle.pdf")
+    assert set(computations.values()) == {2}
+    # по 8 страниц на клиента и звезда пары
+    pages = generate.call_args.kwargs["pages"]
+    assert len(pages) == 17
+    assert generate.call_args.kwargs["profile"] == "screen"
+
+    assert main_reports.collect_bundle_report(scenario, as_bytes=True) == b"%PDF"
@@ -0,0 +1,64 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from business_logic.arcanes_classes import CHART_FIELDS
+from business_logic.batch_engine import compute_charts
+from business_logic.chart_table import (
+    ChartTable,
+    ChartTableError,
+    build_chart_table,
+)
+
+
+@pytest.fixture
+def table_path(tmp_path):
+    return build_chart_table(
+        tmp_path / "chart_table.bin", start=date(1999, 12, 1),
+        end=date(2000, 3, 31)
+    )
+
+
+def test_lookup_matches_batch_engine(table_path):
+    dates = np.arange(
+        np.datetime64("1999-12-01"), np.datetime64("2000-04-01"))
+    charts = compute_charts(dates)
+
+    with ChartTable(table_path) as table:
+        assert table.start == date(1999, 12, 1)
+        assert table.end == date(2000, 3, 31)
+        for idx, birthday in enumerate(dates.tolist()):
+            expected = {field: int(charts[field][idx])
+                        for field in CHART_FIELDS}
+            assert table.lookup(birthday) == expected
+
+        many = table.lookup_many(dates[::7])
+        assert many.shape == (len(dates[::7]), len(CHART_FIELDS))
+        assert many[:, 0].tolist() == charts["personality"][::7].tolist()
+
+
+def test_lookup_out_of_range(table_path):
+    with ChartTable(table_path) as table:
+        with pytest.raises(ChartTableError):
+            table.lookup(date(1999, 11, 30))
+        with pytest.raises(ChartTableError):
+            table.lookup_many(np.array(["2000-04-01"], dtype="datetime64[D]"))
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "broken.bin"
+    path.write_bytes(b"NOPE" + bytes(64))
+    with pytest.raises(ChartTableError):
+        ChartTable(path)
+
+
+def test_rejects_empty_and_truncated_files(tmp_path, table_path):
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    truncated = tmp_path / "truncated.bin"
+    truncated.write_bytes(table_path.read_bytes()[:-1])
+
+    for path in (empty, truncated):
+        with pytest.raises(ChartTableError):
+            ChartTable(path)
@@ -0,0 +1,57 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from business_logic.arcanes_classes import (
+    CHART_FIELDS,
+    TRIANGLES_NAMES,
+    ChartProfile,
+    Client,
+    Triangle,
+)
+from business_logic.batch_engine import compute_charts, stack_charts
+from business_logic.compact_chart import CompactChart
+
+
+@pytest.mark.parametrize(
+    "birthday", [date(1963, 12, 7), date(2000, 1, 1), date(1999, 9, 29)]
+)
+def test_compact_chart_matches_classes(birthday):
+    client = Client(name="Иван", birthday=birthday, gender="M")
+    profile = ChartProfile(client_info=client)
+    chart = CompactChart.from_profile(profile)
+
+    assert not hasattr(chart, "__dict__")
+    assert chart.star.to_dict() == profile.mainstar.to_dict()
+    assert chart.error.to_dict() == profile.errorstar.to_dict()
+    assert chart.mission_star.to_dict() == profile.missionstar.to_dict()
+    assert chart.footer.to_dict() == profile.footerstar.to_dict()
+    assert chart.star.health == profile.mainstar.health
+    for pointer in TRIANGLES_NAMES:
+        compact = chart.triangle(pointer)
+        triangle = Triangle(
+            star=profile.mainstar, err=profile.errorstar, pointer=pointer)
+        assert compact.vertex_data == triangle.vertex_data
+        assert compact.left_middle_vertex == triangle.left_middle_vertex
+        assert compact.to_dict() == triangle.to_dict()
+        assert compact.to_dict_inverted() == triangle.to_dict_inverted()
+        assert compact.to_dict_predicted() == triangle.to_dict_predicted()
+
+
+def test_compact_chart_from_batch_row():
+    client = Client(name="Иван", birthday=date(1990, 5, 15), gender="M")
+    row = stack_charts(compute_charts(np.array([client.birthday])))[0]
+
+    chart = CompactChart.from_row(client, row.tobytes())
+
+    assert chart.to_bytes() == CompactChart.from_client(client).to_bytes()
+    assert len(chart.to_bytes()) == len(CHART_FIELDS)
+
+
+def test_compact_chart_validation():
+    client = Client(name="Иван", birthday=date(1990, 5, 15), gender="M")
+    with pytest.raises(ValueError):
+        CompactChart(client, [1, 2, 3])
+    with pytest.raises(ValueError):
+        CompactChart.from_client(client).triangle("invalid")  # type: ignore
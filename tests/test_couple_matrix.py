@@ -0,0 +1,82 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from business_logic.arcanes_classes import (
+    Client,
+    MainStar,
+    combine_couple_star,
+    digital_root,
+)
+from business_logic.couple_matrix import (
+    combine_group,
+    combine_stars,
+    main_stars,
+    score_couples,
+    score_table,
+    top_couples,
+)
+
+WEIGHTS = {"relationship": {6: 3.0, 3: 2.0}, "money": {7: 1.5}}
+
+
+def _birthdays(start: date, step: int, count: int) -> np.ndarray:
+    return np.array([start + timedelta(days=n * step) for n in range(count)])
+
+
+def test_combine_stars_matches_combine_couple_star():
+    left = _birthdays(date(1970, 3, 1), 37, 12)
+    right = _birthdays(date(1988, 7, 9), 53, 9)
+    combined = combine_stars(main_stars(left), main_stars(right))
+
+    for i, first in enumerate(left):
+        for j, second in enumerate(right):
+            expected = combine_couple_star(
+                MainStar(Client("А", first, "M")),
+                MainStar(Client("Б", second, "F")),
+            )
+            expected.pop("header_text")
+            assert combined[i, j].tolist() == list(expected.values())
+
+
+def test_top_couples_matches_full_matrix():
+    left = _birthdays(date(1960, 1, 5), 11, 400)
+    right = _birthdays(date(1975, 2, 14), 7, 300)
+    scores = score_couples(
+        combine_stars(main_stars(left), main_stars(right)), score_table(WEIGHTS))
+
+    k = 50
+    matches = top_couples(left, right, k=k, weights=WEIGHTS, block_size=64)
+
+    assert len(matches) == k
+    assert len({(m.left, m.right) for m in matches}) == k
+    assert [m.score for m in matches] == sorted(scores.ravel())[::-1][:k]
+    for match in matches:
+        assert scores[match.left, match.right] == match.score
+
+
+def test_top_couples_k_larger_than_matrix():
+    left = _birthdays(date(1990, 1, 1), 1, 3)
+    right = _birthdays(date(1991, 1, 1), 1, 4)
+    assert len(top_couples(left, right, k=100, weights=WEIGHTS)) == 12
+
+
+@pytest.mark.parametrize(
+    "weights",
+    [{"relationship": {23: 1.0}}, {"money": {-1: 1.0}}, {"karma": {6: 1.0}}],
+)
+def test_score_table_validation(weights):
+    with pytest.raises(ValueError):
+        score_table(weights)
+
+
+def test_combine_group_large_group():
+    # сумма 22 * 600 больше таблицы digital_root_array
+    stars = np.full((600, 5), 22, dtype=np.uint8)
+
+    pairs, pair_stars, group_star = combine_group(stars)
+
+    assert len(pairs) == 600 * 599 // 2
+    assert (pair_stars == digital_root(44)).all()
+    assert group_star.tolist() == [digital_root(22 * 600)] * 5
@@ -0,0 +1,56 @@
+from datetime import date, timedelta
+
+import numpy as np
+
+from business_logic.arcanes_classes import (
+    DIAL_KEYS,
+    ChartProfile,
+    Client,
+    get_full_dial,
+)
+from business_logic.star_triples_data import triples_combinations
+from data_requests.dial_triples import create_dial_triples_dict, scan_roster
+from data_requests.triple_request import are_tuples_identical
+from data_requests.triples_index import COMBINATION_KEYS, combination_key
+
+
+def _reference(ring: list[int]) -> dict[str, list[str]]:
+    """Перебор всех окон и комбинаций по are_tuples_identical"""
+    result: dict[str, list[str]] = {}
+    for combination in dict.fromkeys(triples_combinations):
+        key = combination_key(combination)
+        for slot in range(len(ring)):
+            window = tuple(ring[(slot + n) % len(ring)] for n in range(3))
+            if are_tuples_identical(combination, window):
+                result.setdefault(key, []).append(DIAL_KEYS[slot])
+    return result
+
+
+def test_dial_triples_match_reference():
+    birthdays = [date(1950, 1, 1) + timedelta(days=n * 41) for n in range(200)]
+    matches = scan_roster(np.array(birthdays))
+
+    for row, birthday in enumerate(birthdays):
+        profile = ChartProfile(Client(name="Тест", birthday=birthday, gender="M"))
+        dial = get_full_dial(profile)
+        expected = _reference([int(dial[key]) for key in DIAL_KEYS])
+
+        found = create_dial_triples_dict(dial)
+        assert {key: sorted(v) for key, v in found.items()} == {
+            key: sorted(v) for key, v in expected.items()}
+
+        mask = matches.rows == row
+        batch: dict[str, list[str]] = {}
+        for key_id, slot in zip(matches.key_ids[mask], matches.slots[mask]):
+            batch.setdefault(COMBINATION_KEYS[key_id], []).append(DIAL_KEYS[slot])
+        assert {key: sorted(v) for key, v in batch.items()} == {
+            key: sorted(v) for key, v in expected.items()}
+
+
+def test_window_wraps_around_dial():
+    ring = [1] * 80
+    ring[78], ring[79], ring[0] = 18, 6, 6
+
+    found = create_dial_triples_dict(ring)
+
+    assert "inner_main_20_middle" in found["18-6-6"]
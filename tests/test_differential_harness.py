@@ -0,0 +1,39 @@
+from datetime import date
+
+import pytest
+
+from utils import differential_harness
+from utils.differential_harness import ENGINES, run_harness
+
+
+def test_all_engines_match_reference():
+    reports = run_harness(date(1999, 11, 1), date(2000, 3, 1))
+
+    assert [report.engine for report in reports] == list(ENGINES)
+    for report in reports:
+        assert report.fields
+        assert report.ok, report.mismatches
+
+
+def test_reports_first_mismatches(monkeypatch):
+    def broken(birthdays):
+        result = differential_harness._batch_engine(birthdays)
+        result["health"] = result["health"].copy()
+        result["health"][3:] += 1
+        return result
+
+    monkeypatch.setitem(ENGINES, "broken", broken)
+    (report,) = run_harness(
+        date(2001, 1, 1), date(2001, 1, 31), engines=["broken"],
+        scenarios=["adult"], max_mismatches=2)
+
+    assert not report.ok
+    assert list(report.counts) == ["health"]
+    assert report.counts["health"] == 28
+    assert [m.birthday for m in report.mismatches["health"]] == [
+        date(2001, 1, 4), date(2001, 1, 5)]
+
+
+def test_unknown_scenario():
+    with pytest.raises(ValueError):
+        run_harness(date(2001, 1, 1), date(2001, 1, 2), scenarios=["family"])
@@ -0,0 +1,50 @@
+import pytest
+
+from business_logic.arcanes_classes import (
+    digital_root,
+    reduction_table,
+    simple_digital_root,
+)
+
+
+def string_digital_root(num: int, arcanes_number: int = 22) -> int:
+    """Исходная строковая реализация, эталон для сравнения"""
+    number = num
+    while number > arcanes_number:
+        number = sum(int(d) for d in str(number))
+    return number
+
+
+@pytest.mark.parametrize("arcanes_number", [9, 10, 20, 22, 33, 100])
+def test_digital_root_matches_string_version(arcanes_number):
+    for num in range(-5, 50_000):
+        assert digital_root(num, arcanes_number) == string_digital_root(
+            num, arcanes_number
+        )
+
+
+@pytest.mark.parametrize("num", [10**12 + 7, 99_999_999, 123_456_789_012_345])
+def test_digital_root_big_numbers(num):
+    assert digital_root(num) == string_digital_root(num)
+    assert digital_root(num, arcanes_number=9) == string_digital_root(num, 9)
+    assert simple_digital_root(num) == sum(int(d) for d in str(num))
+
+
+def test_simple_digital_root():
+    for num in range(0, 30_000):
+        assert simple_digital_root(num) == sum(int(d) for d in str(num))
+
+    with pytest.raises(ValueError):
+        simple_digital_root(-1)
+
+
+def test_reduction_table_is_shared():
+    assert reduction_table(22) is reduction_table(22)
+    assert reduction_table(9)[1990] == 1
+
+
+def test_digital_root_without_root():
+    # строковый алгоритм зацикливается на однозначных числах больше предела
+    assert digital_root(23, arcanes_number=5) == 5
+    with pytest.raises(ValueError):
+        digital_root(7, arcanes_number=5)
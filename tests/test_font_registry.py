@@ -0,0 +1,105 @@
+import re
+from datetime import datetime, timezone
+
+import fpdf
+import pytest
+from fontTools import ttLib
+from fpdf.fonts import TTFFont
+
+from config.settings import FONTS
+from utils import font_registry, fpdf_compat
+from utils.pdf_utility import CustomPDF
+
+TEXT = "John + Jul 12-7"
+
+
+def _document(pdf: CustomPDF, families=("bebas_regular", "roboto_bold")) -> bytes:
+    pdf.set_creation_date(datetime(2020, 1, 1, tzinfo=timezone.utc))
+    pdf.add_page()
+    for family in families:
+        pdf.set_font(family, size=20)
+        pdf.text(20, 40, TEXT)
+    return bytes(pdf.output())
+
+
+class AddFontPDF(CustomPDF):
+    """Прежний CustomPDF: все шрифты через add_font в каждом документе"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        for family, path in FONTS.items():
+            self.add_font(family, "", str(path))
+
+
+def test_only_used_fonts_embedded():
+    legacy = _document(AddFontPDF())
+    output = _document(CustomPDF())
+
+    assert len(re.findall(rb"/FontFile2", legacy)) == len(FONTS)
+    assert len(re.findall(rb"/FontFile2", output)) == 2
+    assert len(output) < len(legacy)
+    # повторные документы используют шрифты, урезанные предыдущим выводом
+    assert _document(CustomPDF()) == output
+
+
+def test_slim_font_keeps_glyphs_and_metrics():
+    for family, path in FONTS.items():
+        original = ttLib.TTFont(path)
+        slim = ttLib.TTFont(font_registry._document_font(family, 1).ttfont.reader.file)
+
+        assert "fpgm" not in slim and "GPOS" not in slim
+        # номера глифов сохраняются, отброшены только глифы без символов
+        glyph_order = slim.getGlyphOrder()
+        assert original.getGlyphOrder()[: len(glyph_order)] == glyph_order
+        for char in map(ord, TEXT):
+            glyph = original.getBestCmap()[char]
+            assert slim.getBestCmap()[char] == glyph
+            assert slim["hmtx"][glyph] == original["hmtx"][glyph]
+            assert slim["glyf"][glyph].getCoordinates(slim["glyf"])[0] == (
+                original["glyf"][glyph].getCoordinates(original["glyf"])[0])
+
+
+def test_fonts_parsed_once_per_process(mocker):
+    font_registry.clear_fonts()
+    parse = mocker.spy(TTFFont, "__init__")
+
+    for _ in range(3):
+        _document(CustomPDF(), families=tuple(FONTS))
+
+    assert parse.call_count == len(FONTS)
+
+
+def test_document_fonts_do_not_share_widths():
+    font = font_registry._document_font("roboto_bold", 1)
+    parsed = font_registry._parsed_font("roboto_bold")
+
+    font.cw[0x10FFFF]
+    assert 0x10FFFF not in parsed.cw
+
+
+def test_parsed_font_releases_file():
+    font_registry.clear_fonts()
+    parsed = font_registry._parsed_font("roboto_bold")
+
+    assert not hasattr(parsed, "ttfont")
+    assert _document(CustomPDF(), families=("roboto_bold",))
+
+
+def test_changed_font_slots_fail_loudly(mocker):
+    font_registry.clear_fonts()
+    mocker.patch.object(TTFFont, "__slots__", TTFFont.__slots__ + ("kerning",))
+
+    with pytest.raises(font_registry.FontRegistryError):
+        font_registry._parsed_font("roboto_bold")
+
+
+def test_unsupported_fpdf_falls_back_to_add_font(mocker):
+    fpdf_compat.fpdf_internals_supported.cache_clear()
+    mocker.patch.object(fpdf, "__version__", "2.9.0")
+    document_font = mocker.spy(font_registry, "_document_font")
+
+    output = _document(CustomPDF())
+    fpdf_compat.fpdf_internals_supported.cache_clear()
+
+    assert not document_font.called
+    assert len(re.findall(rb"/FontFile2", output)) == 2
@@ -0,0 +1,63 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from business_logic.arcanes_classes import ChartProfile, Client, get_full_dial
+from business_logic.forecast import (
+    NO_FORECAST,
+    age_to_slot,
+    forecast_batch,
+    forecast_for_age,
+    governing_arcana,
+    iter_forecast,
+    iter_forecast_batches,
+    load_dial_geometry,
+)
+
+
+def _profile(birthday: date) -> ChartProfile:
+    return ChartProfile(Client(name="John", birthday=birthday, gender="M"))
+
+
+def test_geometry_matches_dial():
+    geometry = load_dial_geometry()
+    assert geometry.slots == 80
+    assert geometry.years_per_slot == 1.25
+    assert geometry.slot_angle(0) == geometry.start_angle
+    assert age_to_slot(5) == 4
+    assert age_to_slot(85) == 68
+    assert age_to_slot(100) == 0
+    with pytest.raises(ValueError):
+        age_to_slot(-1)
+
+
+def test_iter_forecast_follows_dial():
+    profile = _profile(date(1963, 12, 7))
+    ring = list(get_full_dial(profile).values())
+
+    timeline = list(iter_forecast(profile, 1950, 2063))
+
+    assert timeline[0].year == 1963 and timeline[0].age == 0
+    assert [f.year for f in timeline] == list(range(1963, 2064))
+    for forecast in timeline:
+        assert forecast.slot == forecast.age * 80 // 100 % 80
+        assert forecast.arcana == ring[forecast.slot]
+    assert forecast_for_age(profile, 42) == timeline[42]
+    assert governing_arcana(profile, date(2005, 12, 6)).age == 41
+
+
+def test_forecast_batch_matches_profiles():
+    birthdays = [date(1930, 1, 1) + timedelta(days=n * 97) for n in range(300)]
+    years = np.arange(1925, 2040)
+
+    batch = forecast_batch(np.array(birthdays), years)
+    chunks = np.concatenate(
+        [part for _, part in iter_forecast_batches(np.array(birthdays), years, 64)])
+
+    assert np.array_equal(batch, chunks)
+    for row, birthday in enumerate(birthdays):
+        expected = np.full(len(years), NO_FORECAST)
+        for forecast in iter_forecast(_profile(birthday), 1925, 2039):
+            expected[forecast.year - 1925] = forecast.arcana
+        assert batch[row].tolist() == expected.tolist()
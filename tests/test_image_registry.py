@@ -0,0 +1,79 @@
+from datetime import datetime, timezone
+
+import fpdf
+import pytest
+from fpdf import FPDF
+from fpdf import image_parsing
+
+from config.settings import PITHAGORIAN_TABLE, TRIANGLES
+from utils import fpdf_compat, image_registry
+from utils.image_registry import ImageRegistryError, register_image, template_paths
+from utils.pdf_utility import CustomPDF
+
+TEMPLATES = [TRIANGLES["money"], TRIANGLES["health"], TRIANGLES["money"]]
+
+
+def _document(pdf: FPDF, image) -> bytes:
+    pdf.set_creation_date(datetime(2020, 1, 1, tzinfo=timezone.utc))
+    for template in TEMPLATES:
+        pdf.add_page()
+        pdf.image(image(pdf, template), x=0, y=0, w=pdf.w)
+    return bytes(pdf.output())
+
+
+def test_registered_images_match_file_images():
+    from_file = _document(FPDF(), lambda pdf, template: str(template))
+    from_cache = _document(FPDF(), register_image)
+
+    assert from_cache == from_file
+    # повторный документ получает те же номера изображений
+    assert _document(FPDF(), register_image) == from_file
+
+
+def test_templates_read_once_per_process(mocker):
+    image_registry.clear_images()
+    load = mocker.spy(image_parsing, "load_image")
+
+    for _ in range(3):
+        pdf = CustomPDF()
+        for template in TEMPLATES:
+            pdf.create_image_page(page_data={}, template=str(template))
+        pdf.output()
+
+    assert load.call_count == 2
+
+
+def test_cache_bounded_by_bytes(mocker):
+    image_registry.clear_images()
+    mocker.patch.dict(image_registry.TEMPLATE_CACHE, {"max_bytes": 3 * 2**19})
+
+    image_registry.preload_templates(
+        [TRIANGLES["money"], TRIANGLES["health"], TRIANGLES["personality"]])
+    assert list(image_registry._IMAGES) == [
+        str(TRIANGLES["health"]), str(TRIANGLES["personality"])]
+
+    # шаблон больше предела остается единственным
+    image_registry.preload_templates([PITHAGORIAN_TABLE["jpg"]])
+    assert list(image_registry._IMAGES) == [str(PITHAGORIAN_TABLE["jpg"])]
+    image_registry.clear_images()
+
+
+def test_template_paths_and_missing_template():
+    assert PITHAGORIAN_TABLE["jpg"] in set(template_paths())
+    assert all(path.exists() for path in template_paths())
+
+    with pytest.raises(ImageRegistryError):
+        register_image(FPDF(), "templates/missing.jpg")
+
+
+def test_unsupported_fpdf_reads_template_file(mocker):
+    fpdf_compat.fpdf_internals_supported.cache_clear()
+    mocker.patch.object(fpdf, "__version__", "2.9.0")
+    parsed_image = mocker.spy(image_registry, "_parsed_image")
+
+    from_file = _document(FPDF(), lambda pdf, template: str(template))
+    fallback = _document(FPDF(), register_image)
+    fpdf_compat.fpdf_internals_supported.cache_clear()
+
+    assert not parsed_image.called
+    assert fallback == from_file
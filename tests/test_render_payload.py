@@ -0,0 +1,97 @@
+import tracemalloc
+from datetime import date
+
+import pytest
+
+from business_logic.arcanes_classes import (
+    TRIANGLES_NAMES,
+    ChartProfile,
+    Client,
+    get_fullstar,
+    get_inner_star,
+    get_triangle,
+)
+from utils.render_context_builder import build_render_context
+from utils.transform_utils import format_pythagorian_cell
+
+
+@pytest.fixture
+def profile() -> ChartProfile:
+    profile = ChartProfile(
+        Client(name="John", birthday=date(1963, 12, 7), gender="M"))
+    # арканы считаются один раз на блок отчетов и не входят в замер
+    profile.row
+    for pointer in TRIANGLES_NAMES:
+        profile.triangles[pointer]
+    profile.pythagorian_table.digit_counts
+    return profile
+
+
+def dict_pages(profile: ChartProfile) -> list[dict]:
+    """Данные страниц в виде словарей строк (прежний способ)"""
+    fullstar = {
+        **profile.mainstar.to_dict(),
+        **profile.missionstar.to_dict(),
+        **profile.errorstar.to_dict(),
+        **profile.footerstar.to_dict(),
+    }
+    fullstar = fullstar | profile.triangles.to_dict_inverted()
+
+    inner_star = {**profile.mainstar.to_dict(), **profile.errorstar.to_dict()}
+    del inner_star["header_text"]
+    inner_star = inner_star | profile.triangles.to_dict_inverted()
+
+    triangles = [profile.triangles.to_dict(p) for p in TRIANGLES_NAMES]
+    return [fullstar, inner_star, *triangles,
+            profile.pythagorian_table.to_dict()]
+
+
+def payload_pages(profile: ChartProfile) -> list:
+    triangles = [get_triangle(profile, p) for p in TRIANGLES_NAMES]
+    return [get_fullstar(profile), get_inner_star(profile), *triangles,
+            profile.pythagorian_table.to_payload()]
+
+
+def retained_bytes(build, profile: ChartProfile) -> int:
+    build(profile)  # прогрев кэшей индексов страниц
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        pages = build(profile)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert pages
+    return after - before
+
+
+def test_payloads_match_string_dicts(profile):
+    for payload, old in zip(payload_pages(profile), dict_pages(profile)):
+        if "1" in old:  # таблица Пифагора хранит количество цифр
+            assert {
+                key: format_pythagorian_cell(int(key), count)
+                for key, count in payload.items()
+            } == old
+            continue
+        assert {key: str(value) for key, value in payload.items()} == old
+
+
+def test_payloads_allocate_less_than_string_dicts(profile):
+    old_size = retained_bytes(dict_pages, profile)
+    new_size = retained_bytes(payload_pages, profile)
+
+    assert new_size * 3 < old_size
+
+
+def test_render_context_formats_only_placed_elements(profile):
+    config = {
+        "elements": {
+            "personality": {"font": {"name": "f", "size": 100},
+                            "color": "#FFFFFF", "position": [10, 20]},
+        }
+    }
+
+    context = build_render_context(config, get_fullstar(profile))
+
+    assert list(context) == ["personality"]
+    assert context["personality"]["text"] == "7"
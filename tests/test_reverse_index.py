@@ -0,0 +1,63 @@
+from datetime import date, timedelta
+
+import pytest
+
+from business_logic.arcanes_classes import ChartProfile, Client
+from business_logic.reverse_index import ReverseIndex
+
+START, END = date(1985, 1, 1), date(1994, 12, 31)
+
+
+@pytest.fixture(scope="module")
+def index():
+    return ReverseIndex(START, END)
+
+
+@pytest.fixture(scope="module")
+def charts():
+    days = (END - START).days + 1
+    result = {}
+    for n in range(days):
+        birthday = START + timedelta(days=n)
+        result[birthday] = ChartProfile(Client("Тест", birthday, "M")).values
+    return result
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        {"personality": 5},
+        {"personality": 5, "money": 5, "mission": "*"},
+        {"relationship": (3, 4), "health": None},
+        {"spirituality": 11, "money_vertex": 7, "err_health": (1, 2, 3)},
+        {"mission": 22, "personality_inverted_vertex": 9},
+        {"personality": 0},
+    ],
+)
+def test_query_matches_profiles(index, charts, pattern):
+    def matches(values):
+        for field, value in pattern.items():
+            if value is None or value == "*":
+                continue
+            allowed = (value,) if isinstance(value, int) else value
+            if values[field] not in allowed:
+                return False
+        return True
+
+    expected = [birthday for birthday, values in charts.items() if matches(values)]
+    assert index.query(**pattern) == expected
+    assert index.count(**pattern) == len(expected)
+
+
+def test_wildcard_query_returns_all_dates(index):
+    result = index.query(personality="*")
+    assert len(result) == len(index)
+    assert result[0] == index.start == START
+    assert result[-1] == index.end == END
+
+
+def test_invalid_pattern(index):
+    with pytest.raises(ValueError):
+        index.query(unknown=5)
+    with pytest.raises(ValueError):
+        index.query(personality="5")
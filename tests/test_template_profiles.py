@@ -0,0 +1,96 @@
+import os
+from datetime import date
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from business_logic.arcanes_classes import Client
+from config.settings import COUPLE, QUALITY_PROFILES, TRIANGLES
+from src import main_reports, reports_collection
+from utils import pdf_creator, template_profiles
+from utils.template_profiles import TemplateProfileError, build_variant
+
+
+@pytest.fixture(autouse=True)
+def profiles_path(monkeypatch, tmp_path) -> Path:
+    path = tmp_path / "profiles"
+    monkeypatch.setattr(template_profiles, "PROFILES_PATH", path)
+    return path
+
+
+def test_variants_downsampled_and_recompressed(profiles_path):
+    template = TRIANGLES["money"]
+
+    assert build_variant(template, "print") == template
+    sizes = {}
+    for profile in ("screen", "preview"):
+        path = build_variant(template, profile)
+        assert path == profiles_path / profile / template.name
+        with Image.open(path) as image:
+            assert image.format == "JPEG"
+            assert image.width == QUALITY_PROFILES[profile]["width"]
+            # пропорции шаблона сохраняются
+            assert image.height == round(3368 * image.width / 2380)
+        sizes[profile] = path.stat().st_size
+
+    assert template.stat().st_size > sizes["screen"] > sizes["preview"]
+
+
+def test_variant_rebuilt_only_when_stale():
+    template = TRIANGLES["health"]
+    path = build_variant(template, "preview")
+    built = path.stat().st_mtime_ns
+
+    assert build_variant(template, "preview").stat().st_mtime_ns == built
+
+    os.utime(path, (0, 0))
+    assert build_variant(template, "preview").stat().st_mtime_ns != 0
+
+
+def test_failed_rebuild_keeps_previous_variant(mocker, profiles_path):
+    template = TRIANGLES["money"]
+    path = build_variant(template, "preview")
+    previous = path.read_bytes()
+
+    mocker.patch.object(Image.Image, "save", side_effect=OSError("disk full"))
+    with pytest.raises(TemplateProfileError):
+        build_variant(template, "preview", force=True)
+
+    assert path.read_bytes() == previous
+    assert list(path.parent.iterdir()) == [path]
+
+
+def test_unknown_profile():
+    with pytest.raises(TemplateProfileError):
+        build_variant(TRIANGLES["money"], "poster")  # type: ignore
+
+
+def test_generate_pdf_embeds_profile_variant(tmp_path):
+    sizes = {}
+    for profile in ("print", "screen", "preview"):
+        path = pdf_creator.generate_pdf(
+            tmp_path / f"{profile}.pdf",
+            page_data={},
+            template=COUPLE["jpg"],
+            profile=profile,
+        )
+        sizes[profile] = path.stat().st_size
+
+    assert sizes["print"] > COUPLE["jpg"].stat().st_size
+    assert sizes["print"] > sizes["screen"] > sizes["preview"]
+
+
+def test_quality_passed_to_every_report(mocker):
+    generate = mocker.patch.object(
+        reports_collection,
+        "generate_pdf",
+        side_effect=lambda output_path, **kwargs: Path(output_path),
+    )
+    client = Client(name="John", birthday=date(1963, 12, 7), gender="M")
+
+    main_reports.collect_adult_report(client_info=client, quality="preview")
+
+    assert generate.call_count == 8
+    assert {call.kwargs["profile"] for call in generate.call_args_list} == {
+        "preview"}
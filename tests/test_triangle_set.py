@@ -0,0 +1,40 @@
+from datetime import date, timedelta
+
+import pytest
+
+from business_logic.arcanes_classes import (
+    TRIANGLE_FIELDS,
+    TRIANGLES_NAMES,
+    Client,
+    ErrorStar,
+    MainStar,
+    Triangle,
+    TriangleSet,
+)
+
+
+def test_triangle_set_matches_triangles():
+    start = date(1950, 1, 1)
+    for n in range(0, 36_500, 37):
+        star = MainStar(Client("Тест", start + timedelta(days=n), "M"))
+        err = ErrorStar(star=star)
+        triangles = TriangleSet(star=star, err=err)
+
+        inverted, predicted = {}, {}
+        for pointer in TRIANGLES_NAMES:
+            triangle = Triangle(star=star, err=err, pointer=pointer)
+            row = triangles[pointer]
+            assert row == tuple(getattr(triangle, f) for f in TRIANGLE_FIELDS)
+            assert triangles.to_dict(pointer) == triangle.to_dict()
+            inverted |= triangle.to_dict_inverted()
+            predicted |= triangle.to_dict_predicted()
+
+        assert triangles.to_dict_inverted() == inverted
+        assert triangles.to_dict_predicted() == predicted
+
+
+def test_triangle_set_invalid_pointer():
+    star = MainStar(Client("Тест", date(2000, 1, 1), "M"))
+    triangles = TriangleSet(star=star, err=ErrorStar(star=star))
+    with pytest.raises(ValueError):
+        triangles["invalid"]  # type: ignore
@@ -0,0 +1,64 @@
+import random
+from datetime import date, timedelta
+
+from business_logic.arcanes_classes import ChartProfile, Client, get_fullstar
+from business_logic.star_triples_data import (
+    Triple,
+    fullstar_triples,
+    triples_combinations,
+)
+from data_requests.fullstar_analityc import get_fullstar_analytic
+from data_requests.triple_request import (
+    are_tuples_identical,
+    create_triples_dict,
+    fill_star_triples,
+)
+
+
+def brute_force_triples_dict(triples: list[Triple]) -> dict[str, list[str]]:
+    """Прежний перебор всех комбинаций для всех троек"""
+    result: dict[str, list[str]] = {}
+    for combination in triples_combinations:
+        for item in triples:
+            if item.values and are_tuples_identical(combination, item.values):
+                key = "-".join(str(n) for n in combination)
+                result.setdefault(key, []).append(item.name)
+    return result
+
+
+def test_compiled_matcher_matches_brute_force():
+    rng = random.Random(7)
+    pool = sorted({n for combination in triples_combinations
+                   for n in combination})
+    for _ in range(2000):
+        triples = [
+            Triple(t.pos, t.name,
+                   tuple(rng.choice(pool) for _ in range(3)))  # type: ignore
+            for t in fullstar_triples
+        ]
+        assert create_triples_dict(triples) == brute_force_triples_dict(
+            triples)
+
+
+def test_fullstar_analytic_for_real_charts():
+    start = date(1950, 1, 1)
+    for n in range(0, 20_000, 97):
+        profile = ChartProfile(
+            Client(name="Тест", birthday=start + timedelta(days=n),
+                   gender="M"))
+        fullstar = get_fullstar(profile)
+
+        triples = fill_star_triples(fullstar)
+        assert get_fullstar_analytic(fullstar) == brute_force_triples_dict(
+            triples)
+
+
+def test_fill_star_triples_keeps_shared_triples_intact():
+    profile = ChartProfile(
+        Client(name="Тест", birthday=date(1963, 12, 7), gender="M"))
+
+    triples = fill_star_triples(get_fullstar(profile))
+
+    assert all(t.values is None for t in fullstar_triples)
+    assert triples[0].values == (7, 12, 19)
+    assert triples[0] is not fullstar_triples[0]
@@ -0,0 +1,48 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from business_logic.arcanes_classes import ChartProfile, Client, get_fullstar
+from data_requests.fullstar_analityc import get_fullstar_analytic
+from data_requests.triples_index import TriplesIndex
+
+
+def test_index_matches_fullstar_analytic():
+    start = date(1940, 1, 1)
+    birthdays = [start + timedelta(days=n * 13) for n in range(1500)]
+    client_ids = np.arange(100, 100 + len(birthdays))
+
+    index = TriplesIndex()
+    # добавление порциями равно построению за один раз
+    index.add_clients(client_ids[:700], np.array(birthdays[:700]))
+    index.add_clients(client_ids[700:], np.array(birthdays[700:]))
+
+    expected: dict[tuple, set] = {}
+    for client_id, birthday in zip(client_ids.tolist(), birthdays):
+        fullstar = get_fullstar(ChartProfile(Client("Тест", birthday, "M")))
+        for key, names in (get_fullstar_analytic(fullstar) or {}).items():
+            for name in names:
+                expected.setdefault((key, name), set()).add(client_id)
+            expected.setdefault((key, None), set()).add(client_id)
+
+    assert expected
+    for (key, name), ids in expected.items():
+        assert index.query(key, name).tolist() == sorted(ids)
+    assert sum(index.counts().values()) == sum(
+        len(ids) for (_, name), ids in expected.items() if name is None)
+    assert len(index) == len(birthdays)
+
+
+def test_query_formats():
+    index = TriplesIndex()
+    index.add_clients(np.array([1]), np.array([date(1963, 12, 7)]))
+
+    assert index.query((3, 6, 9)).tolist() == [1]
+    assert index.query("3-6-9", "Треугольник Отношения").tolist() == [1]
+    assert index.query("18-6-6").size == 0
+
+    # результат нельзя изменить, не повредив индекс
+    with pytest.raises(ValueError):
+        index.query((3, 6, 9))[0] = 2
+    assert index.query((3, 6, 9)).tolist() == [1]
@@ -0,0 +1,368 @@
+# utils/differential_harness.py
+"""Сверка быстрых движков арканов с эталонными классами arcanes_classes.py.
+
+Для каждой даты диапазона эталон считается исходными классами
+MainStar, ErrorStar, MissionStar, FooterStar, Triangle (отдельно для
+каждого поинтера), PythagorianTable и combine_couple_star, шкала
+predict - по их текстовым словарям to_dict*, как до ChartProfile.values
+и числовой get_full_dial. Каждый движок считается своим путем.
+Расхождения собираются по полям: первые даты, ожидаемое и полученное
+значение.
+
+Запуск: python -m utils.differential_harness [--start ДАТА] [--end ДАТА]
+        [--engine ИМЯ ...] [--scenario adult|child|couple|group ...]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+from loguru import logger
+
+from business_logic.arcanes_classes import (
+    CHART_FIELDS,
+    DIAL_KEYS,
+    DIAL_MAIN_FIELDS,
+    MAIN_STAR_FIELDS,
+    PYTHAGORIAN_LINES,
+    TRIANGLES_NAMES,
+    Client,
+    ErrorStar,
+    FooterStar,
+    MainStar,
+    MissionStar,
+    PythagorianTable,
+    Triangle,
+    combine_couple_star,
+    digital_root,
+)
+from business_logic.batch_engine import (
+    compute_charts,
+    compute_dials,
+    compute_pythagorian,
+    stack_charts,
+)
+from business_logic.chart_formulas import load_plan
+from business_logic.chart_table import ChartTable, build_chart_table
+from business_logic.compact_chart import CompactChart
+from business_logic.couple_matrix import combine_group, combine_stars, main_stars
+from config.settings import CHART_TABLE
+
+# Сдвиг дат партнеров: пара - (дата, дата + сдвиг),
+# группа - (дата, дата + сдвиг, дата + 2 * сдвиг)
+PARTNER_SHIFT = timedelta(days=4567)
+
+PYTHAGORIAN_FIELDS: Tuple[str, ...] = (
+    tuple(f"number_{idx}" for idx in range(1, 6))
+    + tuple(f"pythagorian_{digit}" for digit in range(1, 10))
+    + tuple(PYTHAGORIAN_LINES)
+)
+COUPLE_FIELDS: Tuple[str, ...] = tuple(f"couple_{f}" for f in MAIN_STAR_FIELDS)
+GROUP_FIELDS: Tuple[str, ...] = tuple(f"group_{f}" for f in MAIN_STAR_FIELDS)
+
+# Поля, которые используют отчеты каждого сценария
+SCENARIO_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "adult": CHART_FIELDS + DIAL_KEYS + PYTHAGORIAN_FIELDS,
+    "child": tuple(
+        name for name in CHART_FIELDS
+        if name.startswith(("personality_", "money_"))
+    ) + PYTHAGORIAN_FIELDS,
+    "couple": COUPLE_FIELDS,
+    "group": COUPLE_FIELDS + GROUP_FIELDS,
+}
+
+# Движок: массив дат рождения -> значения по полям
+Engine = Callable[[np.ndarray], Dict[str, np.ndarray]]
+
+
+def _client(birthday: date) -> Client:
+    return Client(name="Тест", birthday=birthday, gender="M")
+
+
+def _reference_chart(star: MainStar, err: ErrorStar) -> Dict[str, str]:
+    """Арканы карты по ключам CHART_FIELDS из to_dict* классов звезд
+    и треугольника каждого поинтера"""
+    chart = {
+        **star.to_dict(),
+        **err.to_dict(),
+        **MissionStar(star=star, error=err).to_dict(),
+        **FooterStar(client_info=star.client_info).to_dict(),
+    }
+    del chart["header_text"]
+    for pointer in TRIANGLES_NAMES:
+        triangle = Triangle(star=star, err=err, pointer=pointer)
+        chart.update(
+            (f"{pointer}_{name}", value)
+            for name, value in triangle.to_dict().items()
+        )
+    return chart
+
+
+def _reference_dial(chart: Dict[str, str]) -> Dict[str, str]:
+    """Текстовая шкала predict: основные арканы и три промежуточных
+    между соседними, как в исходных get_full_dial и count_dial_data"""
+    main = [chart[name] for name in DIAL_MAIN_FIELDS]
+    dial: Dict[str, str] = {}
+    for idx, current in enumerate(main):
+        following = main[(idx + 1) % len(main)]
+        middle = digital_root(int(current) + int(following))
+        key = f"main_{idx + 1}"
+        dial[key] = current
+        dial[f"inner_{key}_left"] = str(digital_root(int(current) + middle))
+        dial[f"inner_{key}_middle"] = str(middle)
+        dial[f"inner_{key}_right"] = str(digital_root(int(following) + middle))
+    return dial
+
+
+def reference_values(birthdays: List[date]) -> Dict[str, np.ndarray]:
+    """Значения всех полей, рассчитанные эталонными классами"""
+    columns: Dict[str, List[int]] = {}
+
+    def put(name: str, value: int | str) -> None:
+        columns.setdefault(name, []).append(int(value))
+
+    for birthday in birthdays:
+        stars = [
+            MainStar(_client(birthday + PARTNER_SHIFT * n))
+            for n in range(3)
+        ]
+
+        chart = _reference_chart(stars[0], ErrorStar(star=stars[0]))
+        for name in CHART_FIELDS:
+            put(name, chart[name])
+        for name, value in _reference_dial(chart).items():
+            put(name, value)
+
+        table = PythagorianTable(client_info=stars[0].client_info)
+        for idx in range(1, 6):
+            put(f"number_{idx}", getattr(table, f"number_{idx}"))
+        for digit, count in enumerate(table.digit_counts, start=1):
+            put(f"pythagorian_{digit}", count)
+        for name, value in table.line_sums.items():
+            put(name, value)
+
+        couple = combine_couple_star(stars[0], stars[1])
+        for name in MAIN_STAR_FIELDS:
+            put(f"couple_{name}", couple[name])
+            put(
+                f"group_{name}",
+                digital_root(sum(getattr(star, name) for star in stars)),
+            )
+
+    return {name: np.array(values) for name, values in columns.items()}
+
+
+def _partners(birthdays: np.ndarray, shift: int) -> np.ndarray:
+    return birthdays + np.timedelta64(PARTNER_SHIFT.days * shift, "D")
+
+
+def _batch_engine(birthdays: np.ndarray) -> Dict[str, np.ndarray]:
+    charts = compute_charts(birthdays)
+    dials = compute_dials(charts)
+    pythagorian = compute_pythagorian(birthdays)
+
+    result = dict(charts)
+    result.update({key: dials[:, idx] for idx, key in enumerate(DIAL_KEYS)})
+    result.update({
+        name: values for name, values in pythagorian.items()
+        if name != "digit_counts"
+    })
+    for digit in range(1, 10):
+        result[f"pythagorian_{digit}"] = pythagorian["digit_counts"][:, digit - 1]
+    return result
+
+
+def _formula_plan(birthdays: np.ndarray) -> Dict[str, np.ndarray]:
+    return load_plan().evaluate_batch(birthdays)
+
+
+def _formula_plan_scalar(birthdays: np.ndarray) -> Dict[str, np.ndarray]:
+    plan = load_plan()
+    rows = [plan.evaluate(birthday) for birthday in birthdays.tolist()]
+    return {name: np.array([row[name] for row in rows]) for name in plan.outputs}
+
+
+def _chart_table(birthdays: np.ndarray) -> Dict[str, np.ndarray]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = build_chart_table(
+            Path(tmp_dir) / "chart_table.bin",
+            start=birthdays.min().item(),
+            end=birthdays.max().item(),
+        )
+        with ChartTable(path) as table:
+            rows = np.array(table.lookup_many(birthdays))
+    return {name: rows[:, idx] for idx, name in enumerate(CHART_FIELDS)}
+
+
+def _compact_chart(birthdays: np.ndarray) -> Dict[str, np.ndarray]:
+    rows = stack_charts(compute_charts(birthdays))
+    charts = [
+        CompactChart.from_row(_client(birthday), row.tobytes())
+        for birthday, row in zip(birthdays.tolist(), rows)
+    ]
+    return {
+        name: np.array([getattr(chart, name) for chart in charts])
+        for name in CHART_FIELDS
+    }
+
+
+def _couple_matrix(birthdays: np.ndarray) -> Dict[str, np.ndarray]:
+    stars = [main_stars(_partners(birthdays, n)) for n in range(3)]
+
+    # пары (i, i) из блоков матрицы combine_stars
+    couples = np.empty_like(stars[0])
+    for start in range(0, len(birthdays), 256):
+        block = slice(start, start + 256)
+        combined = combine_stars(stars[0][block], stars[1][block])
+        diagonal = np.arange(combined.shape[0])
+        couples[block] = combined[diagonal, diagonal]
+
+    groups = np.array([
+        combine_group(np.stack([star[idx] for star in stars]))[2]
+        for idx in range(len(birthdays))
+    ])
+
+    result = {
+        f"couple_{name}": couples[:, idx]
+        for idx, name in enumerate(MAIN_STAR_FIELDS)
+    }
+    result.update({
+        f"group_{name}": groups[:, idx]
+        for idx, name in enumerate(MAIN_STAR_FIELDS)
+    })
+    return result
+
+
+ENGINES: Dict[str, Engine] = {
+    "batch_engine": _batch_engine,
+    "formula_plan": _formula_plan,
+    "formula_plan_scalar": _formula_plan_scalar,
+    "chart_table": _chart_table,
+    "compact_chart": _compact_chart,
+    "couple_matrix": _couple_matrix,
+}
+
+
+@dataclass
+class Mismatch:
+    birthday: date
+    expected: int
+    actual: int
+
+
+@dataclass
+class EngineReport:
+    """Результат сверки движка: проверенные поля и первые расхождения"""
+
+    engine: str
+    fields: int = 0
+    seconds: float = 0.0
+    mismatches: Dict[str, List[Mismatch]] = field(default_factory=dict)
+    # количество расхождений по полям
+    counts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.counts
+
+
+def run_harness(
+    start: date = CHART_TABLE["start"],
+    end: date = CHART_TABLE["end"],
+    engines: List[str] | None = None,
+    scenarios: List[str] | None = None,
+    max_mismatches: int = 5,
+) -> List[EngineReport]:
+    """Сверяет движки с эталоном для всех дат [start, end].
+
+    Args:
+        start (date): первая дата диапазона
+        end (date): последняя дата диапазона (включительно)
+        engines (list | None): имена движков ENGINES, None - все
+        scenarios (list | None): сценарии SCENARIO_FIELDS, None - все
+        max_mismatches (int): сколько первых расхождений хранить по полю
+    Returns:
+        list[EngineReport]: отчеты по движкам
+    """
+    engines = engines or list(ENGINES)
+    scenarios = scenarios or list(SCENARIO_FIELDS)
+    unknown = set(engines) - set(ENGINES) | set(scenarios) - set(SCENARIO_FIELDS)
+    if unknown:
+        logger.error(f"Неизвестные движки или сценарии: {unknown}")
+        raise ValueError(f"Неизвестные движки или сценарии: {unknown}")
+
+    checked = tuple(dict.fromkeys(
+        name for scenario in scenarios for name in SCENARIO_FIELDS[scenario]))
+    dates = [start + timedelta(days=n) for n in range((end - start).days + 1)]
+    birthdays = np.array(dates, dtype="datetime64[D]")
+
+    began = time.perf_counter()
+    expected = reference_values(dates)
+    logger.info(
+        f"Эталон {start} - {end}: {time.perf_counter() - began:.1f} с")
+
+    reports = []
+    for name in engines:
+        report = EngineReport(engine=name)
+        began = time.perf_counter()
+        actual = ENGINES[name](birthdays)
+        report.seconds = time.perf_counter() - began
+
+        for field_name in checked:
+            if field_name not in actual:
+                continue
+            report.fields += 1
+            values = np.asarray(actual[field_name]).astype(np.int64)
+            wrong = np.flatnonzero(values != expected[field_name])
+            if wrong.size:
+                report.counts[field_name] = int(wrong.size)
+                report.mismatches[field_name] = [
+                    Mismatch(dates[idx], int(expected[field_name][idx]),
+                             int(values[idx]))
+                    for idx in wrong[:max_mismatches]
+                ]
+        reports.append(report)
+
+    return reports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Сверка быстрых движков арканов с эталонными классами")
+    parser.add_argument(
+        "--start", type=date.fromisoformat, default=CHART_TABLE["start"])
+    parser.add_argument(
+        "--end", type=date.fromisoformat, default=CHART_TABLE["end"])
+    parser.add_argument("--engine", action="append", choices=list(ENGINES))
+    parser.add_argument(
+        "--scenario", action="append", choices=list(SCENARIO_FIELDS))
+    parser.add_argument("--max-mismatches", type=int, default=5)
+    args = parser.parse_args()
+
+    began = time.perf_counter()
+    reports = run_harness(
+        args.start, args.end, args.engine, args.scenario, args.max_mismatches)
+
+    for report in reports:
+        status = "OK" if report.ok else "РАСХОЖДЕНИЯ"
+        print(f"{report.engine:<20} {status:<12} полей: {report.fields:>3}"
+              f"  {report.seconds:6.2f} с")
+        for field_name, mismatches in report.mismatches.items():
+            print(f"    {field_name}: {report.counts[field_name]} дат")
+            for mismatch in mismatches:
+                print(f"        {mismatch.birthday}: ожидалось"
+                      f" {mismatch.expected}, получено {mismatch.actual}")
+    print(f"Всего: {time.perf_counter() - began:.1f} с")
+
+    if not all(report.ok for report in reports):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
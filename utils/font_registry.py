@@ -0,0 +1,166 @@
+# utils/font_registry.py
+"""Общий для процесса реестр шрифтов отчетов.
+
+fpdf разбирает TTF (таблицы, cmap, ширины символов) в TTFFont при
+каждом add_font, а generate_pdf создает новый документ на каждый файл.
+Реестр разбирает каждый шрифт один раз и выдает документам копии
+TTFFont: общие только неизменяемые данные (cmap, имена, метрики), а
+номер шрифта в документе, ширины символов cw (fpdf дописывает в них
+отсутствующие символы), glyph_ids, карта подмножества глифов,
+описание шрифта и объект TTFont, который fpdf урезает до
+подмножества при выводе, у каждой копии свои.
+
+Копии собираются по внутреннему устройству TTFFont fpdf2 2.8.3
+(__slots__, конструктор, SubsetMap). С другой версией fpdf2 реестр
+не используется, шрифты добавляются обычным add_font (fpdf_compat),
+а если в проверенной версии набор __slots__ отличается от описанного
+здесь, реестр выдает ошибку, а не собирает неполную копию.
+Разобранный шрифт не держит файл открытым: его объект TTFont
+закрывается после разбора, документы читают облегченный файл из памяти.
+
+В документ встраивается облегченный файл шрифта: без хинтинга и таблиц
+OpenType-раскладки (на страницах только цифры, имена, тире и "+"),
+номера глифов сохраняются, поэтому метрики исходного файла верны.
+fpdf при выводе все равно оставляет только использованные глифы, и
+размер файла отчета облегчение уменьшает мало (~2.6 КБ); основная
+экономия (~17 КБ) - от встраивания только использованных шрифтов.
+Облегчение окупается временем вывода: fpdf урезает меньший файл на
+7-30 мс быстрее на отчет, а само облегчение занимает ~0.6 с один раз
+на процесс (benchmarks/bench_report_fonts.py).
+"""
+
+import copy
+import threading
+from io import BytesIO
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, Iterable
+
+from fontTools import subset, ttLib
+from fpdf import FPDF
+from fpdf.enums import TextEmphasis
+from fpdf.fonts import SubsetMap, TTFFont
+from loguru import logger
+
+from config.settings import FONTS
+from utils.fpdf_compat import fpdf_internals_supported
+
+# Поля TTFFont: общие для всех копий, свои у каждого документа и
+# поле, которое fpdf заполняет сам при первом shaping текста
+_SHARED_SLOTS = (
+    "type", "name", "sp", "ss", "up", "ut", "ttffile", "fontkey",
+    "emphasis", "scale", "cmap",
+)
+_DOCUMENT_SLOTS = (
+    "i", "desc", "glyph_ids", "cw", "subset", "ttfont", "missing_glyphs")
+_LAZY_SLOTS = ("hbfont",)
+
+# Разобранные шрифты и байты файлов по семейству
+_PARSED: Dict[str, TTFFont] = {}
+_FILES: Dict[str, bytes] = {}
+_LOCK = threading.Lock()
+
+
+class FontRegistryError(Exception):
+    pass
+
+
+def _slim_font(path: Path) -> bytes:
+    """Файл шрифта без хинтинга и таблиц раскладки с прежними номерами глифов"""
+    font = ttLib.TTFont(path, recalcTimestamp=False, fontNumber=0)
+    options = subset.Options(
+        hinting=False,
+        retain_gids=True,
+        glyph_names=True,
+        notdef_outline=True,
+        recommended_glyphs=True,
+        layout_features=[],
+        name_IDs=[1, 2, 3, 4, 6],
+    )
+    options.drop_tables += ["GDEF", "GPOS", "GSUB", "kern", "FFTM", "gasp"]
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=font.getBestCmap().keys())
+    subsetter.subset(font)
+
+    output = BytesIO()
+    font.save(output)
+    return output.getvalue()
+
+
+def _check_slots() -> None:
+    """Проверяет, что копия TTFFont заполнит все поля этой версии fpdf"""
+    known = set(_SHARED_SLOTS + _DOCUMENT_SLOTS + _LAZY_SLOTS)
+    slots = set(TTFFont.__slots__)
+    if slots != known:
+        logger.error(
+            f"Поля TTFFont изменились: новые {sorted(slots - known)},"
+            f" отсутствуют {sorted(known - slots)}"
+        )
+        raise FontRegistryError("Реестр шрифтов не поддерживает этот TTFFont")
+
+
+def _parsed_font(family: str) -> TTFFont:
+    """Разобранный шрифт семейства, один на процесс"""
+    font = _PARSED.get(family)
+    if font is not None:
+        return font
+
+    with _LOCK:
+        if family not in _PARSED:
+            _check_slots()
+            path: Path | None = FONTS.get(family)
+            if path is None:
+                logger.error(f"Шрифт {family} не описан в FONTS")
+                raise FontRegistryError(f"Неизвестный шрифт {family}")
+            _FILES[family] = _slim_font(path)
+            # документ-заглушка: TTFFont берет из него только номер шрифта
+            font = TTFFont(
+                SimpleNamespace(fonts={}), path, family, TextEmphasis.NONE)
+            # у копий свой ttfont, файл и таблицы разбора не нужны
+            font.ttfont.close()
+            del font.ttfont
+            _PARSED[family] = font
+            logger.debug(f"Шрифт {family} разобран из {path}")
+        return _PARSED[family]
+
+
+def _document_font(family: str, index: int) -> TTFFont:
+    """Копия разобранного шрифта для одного документа"""
+    parsed = _parsed_font(family)
+
+    font = object.__new__(TTFFont)
+    for slot in _SHARED_SLOTS:
+        setattr(font, slot, getattr(parsed, slot))
+
+    font.i = index
+    # fpdf дописывает в cw ширины отсутствующих символов
+    font.cw = copy.copy(parsed.cw)
+    font.glyph_ids = dict(parsed.glyph_ids)
+    # fpdf задает описанию имя шрифта и номер объекта документа
+    font.desc = copy.copy(parsed.desc)
+    # fpdf урезает ttfont при выводе документа, поэтому объект свой
+    font.ttfont = ttLib.TTFont(
+        BytesIO(_FILES[family]), recalcTimestamp=False, fontNumber=0, lazy=True
+    )
+    font.missing_glyphs = []
+    font.subset = SubsetMap(font)
+    return font
+
+
+def register_fonts(pdf: FPDF, families: Iterable[str]) -> None:
+    """Добавляет в документ шрифты семейств без повторного разбора TTF.
+    Уже добавленные семейства и шрифты не из FONTS пропускаются."""
+    for family in families:
+        if family in pdf.fonts or family not in FONTS:
+            continue
+        if fpdf_internals_supported():
+            pdf.fonts[family] = _document_font(family, len(pdf.fonts) + 1)
+        else:
+            pdf.add_font(family, "", str(FONTS[family]))
+
+
+def clear_fonts() -> None:
+    """Очищает реестр (например, после замены файлов шрифтов)"""
+    with _LOCK:
+        _PARSED.clear()
+        _FILES.clear()
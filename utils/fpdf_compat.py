@@ -0,0 +1,35 @@
+# utils/fpdf_compat.py
+"""Проверка версии fpdf2 для реестров шрифтов и шаблонов.
+
+font_registry и image_registry повторяют внутреннее устройство fpdf2
+2.8.x (fpdf 2.8.3: TTFFont.__slots__, SubsetMap, записи
+image_cache.images с ключами "i", "usages", "iccp_i"). Изменение этого
+устройства в другой версии не вызовет ошибку, а испортит PDF, поэтому
+с непроверенной версией реестры не используются и документы строятся
+обычными add_font и image с путем к файлу.
+"""
+
+from functools import lru_cache
+
+import fpdf
+from loguru import logger
+
+# Проверенная ветка fpdf2
+FPDF_SUPPORTED = (2, 8)
+
+
+@lru_cache(maxsize=None)
+def fpdf_internals_supported() -> bool:
+    """True, если установленная версия fpdf2 из ветки FPDF_SUPPORTED"""
+    try:
+        version = tuple(int(part) for part in fpdf.__version__.split(".")[:2])
+    except ValueError:
+        version = ()
+
+    if version != FPDF_SUPPORTED:
+        logger.warning(
+            f"fpdf2 {fpdf.__version__} не проверен с реестрами шрифтов и"
+            f" шаблонов (ветка {FPDF_SUPPORTED}): используются add_font и image"
+        )
+        return False
+    return True
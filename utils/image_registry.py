@@ -0,0 +1,119 @@
+# utils/image_registry.py
+"""Общий для процесса кэш изображений шаблонов отчетов.
+
+FPDF.image с путем к файлу в каждом новом документе заново читает
+JPEG шаблона с диска (0.4 - 3.7 МБ) и разбирает его заголовок.
+Реестр читает каждый шаблон один раз и хранит разобранное описание
+RasterImageInfo вместе с байтами файла. Документу передается копия
+описания со своим номером изображения и счетчиком использований,
+а байты JPEG общие: fpdf только копирует их в поток вывода.
+
+Размер кэша ограничен суммой байтов изображений (TEMPLATE_CACHE),
+при превышении вытесняются давно не использованные шаблоны.
+
+register_image повторяет учет изображений preload_image из
+fpdf/image_parsing.py fpdf2 2.8.3: запись image_cache.images[имя] с
+номером "i", счетчиком "usages" и номером ICC-профиля "iccp_i".
+С другой версией fpdf2 кэш не используется, и FPDF.image читает
+файл шаблона сам (fpdf_compat).
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from fpdf import FPDF
+from fpdf.image_datastructures import RasterImageInfo
+from fpdf.image_parsing import get_img_info
+from loguru import logger
+
+from config import settings
+from config.settings import TEMPLATE_CACHE
+from utils.fpdf_compat import fpdf_internals_supported
+
+# Разобранные шаблоны по пути, от давно использованных к недавним
+_IMAGES: OrderedDict[str, RasterImageInfo] = OrderedDict()
+_SIZE = 0
+_LOCK = threading.Lock()
+
+
+class ImageRegistryError(Exception):
+    pass
+
+
+def template_paths() -> Iterator[Path]:
+    """Пути шаблонов отчетов (*.jpg) из настроек config/settings.py"""
+    for value in vars(settings).values():
+        if isinstance(value, dict):
+            for path in value.values():
+                if isinstance(path, Path) and path.suffix == ".jpg":
+                    yield path
+
+
+def _parsed_image(name: str) -> RasterImageInfo:
+    """Разобранный шаблон, читается с диска один раз"""
+    global _SIZE
+
+    with _LOCK:
+        info = _IMAGES.get(name)
+        if info is not None:
+            _IMAGES.move_to_end(name)
+            return info
+
+        try:
+            info = RasterImageInfo(get_img_info(name))
+        except (OSError, ValueError) as error:
+            logger.error(f"Шаблон {name} не удалось прочитать: {error}")
+            raise ImageRegistryError(f"Ошибка чтения шаблона {name}") from error
+
+        _IMAGES[name] = info
+        _SIZE += len(info["data"])
+        # последний добавленный шаблон остается, даже если он больше лимита
+        while _SIZE > TEMPLATE_CACHE["max_bytes"] and len(_IMAGES) > 1:
+            evicted, old = _IMAGES.popitem(last=False)
+            _SIZE -= len(old["data"])
+            logger.debug(f"Шаблон {evicted} вытеснен из кэша")
+        logger.debug(f"Шаблон {name} прочитан, в кэше {_SIZE / 2**20:.1f} МБ")
+        return info
+
+
+def register_image(pdf: FPDF, template: Path | str) -> str:
+    """Добавляет шаблон в кэш изображений документа без чтения файла.
+
+    Returns:
+        str: имя изображения для FPDF.image
+    """
+    name = str(template)
+    images = pdf.image_cache.images
+    if name in images or not fpdf_internals_supported():
+        return name
+
+    parsed = _parsed_image(name)
+    info = RasterImageInfo(parsed)
+    info["i"] = len(images) + 1
+    # FPDF.image увеличивает счетчик при каждом размещении
+    info["usages"] = 0
+    info["iccp_i"] = None
+    iccp = info.pop("iccp", None)
+    if iccp:
+        profiles = pdf.image_cache.icc_profiles
+        info["iccp_i"] = profiles.setdefault(iccp, len(profiles))
+    info["iccp"] = None
+    images[name] = info
+    return name
+
+
+def preload_templates(paths: Iterable[Path] | None = None) -> None:
+    """Заранее читает шаблоны (по умолчанию все из настроек)"""
+    for path in paths if paths is not None else template_paths():
+        _parsed_image(str(path))
+
+
+def clear_images() -> None:
+    """Очищает кэш (например, после замены файлов шаблонов)"""
+    global _SIZE
+
+    with _LOCK:
+        _IMAGES.clear()
+        _SIZE = 0
@@ -4,6 +4,11 @@ from loguru import logger
 
 from report_storage.report_classes import TextPageData
 from utils.pdf_utility import CustomPDF
+from utils.template_profiles import DEFAULT_PROFILE, ProfileType, template_for
+
+
+# Страница отчета: (page_data, шаблон)
+Page = tuple[dict[str, dict], Path]
 
 
 class ReportCreatingError(Exception):
@@ -15,11 +20,14 @@ def generate_pdf(
     page_data: dict[str, dict],
     template: Path,
     text_data: TextPageData | None = None,
+    profile: ProfileType = DEFAULT_PROFILE,
 ) -> Path:
-    """Создает файлы отчетов в формате pdf"""
+    """Создает файлы отчетов в формате pdf.
+    Шаблон берется в варианте профиля качества profile."""
     pdf = CustomPDF()
 
-    pdf.create_image_page(page_data=page_data, template=str(template))
+    pdf.create_image_page(
+        page_data=page_data, template=str(template_for(template, profile)))
 
     if text_data:
         pdf.create_text_pages(text_data)
@@ -30,3 +38,48 @@ def generate_pdf(
 
     logger.error(f"Отчет {output_path.name} не удалось создать")
     raise ReportCreatingError(f"Ошибка создания отчета {output_path.name}")
+
+
+def _multipage_document(pages: list[Page], profile: ProfileType) -> CustomPDF:
+    """Документ из страниц с шаблонами: каждый шрифт и каждый шаблон
+    встраиваются в него один раз, сколько бы страниц их ни использовали"""
+    pdf = CustomPDF()
+
+    for page_data, template in pages:
+        pdf.create_image_page(
+            page_data=page_data, template=str(template_for(template, profile)))
+    return pdf
+
+
+def generate_multipage_pdf(
+    output_path: Path,
+    pages: list[Page],
+    profile: ProfileType = DEFAULT_PROFILE,
+) -> Path:
+    """Создает один файл отчета из нескольких страниц с шаблонами.
+
+    Args:
+        output_path (Path): путь к файлу отчета
+        pages (list): пары (page_data, шаблон) в порядке страниц
+        profile (ProfileType): профиль качества шаблонов
+    """
+    pdf = _multipage_document(pages, profile)
+
+    pdf.output(str(output_path))
+    if output_path.exists():
+        return output_path
+
+    logger.error(f"Отчет {output_path.name} не удалось создать")
+    raise ReportCreatingError(f"Ошибка создания отчета {output_path.name}")
+
+
+def render_multipage_pdf(
+    pages: list[Page],
+    profile: ProfileType = DEFAULT_PROFILE,
+) -> bytes:
+    """Содержимое PDF из нескольких страниц с шаблонами без записи файла"""
+    if not pages:
+        logger.error("Нет страниц для отчета")
+        raise ReportCreatingError("Нет страниц для отчета")
+
+    return bytes(_multipage_document(pages, profile).output())
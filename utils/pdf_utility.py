@@ -1,6 +1,8 @@
 from fpdf import FPDF
 
 from report_storage.report_classes import TextPageData
+from utils.font_registry import register_fonts
+from utils.image_registry import register_image
 
 
 # Класс PDF
@@ -10,37 +12,13 @@ class CustomPDF(FPDF):
         super().__init__(orientation="P", unit="mm", format="a4")
         self._needs_background = False
         self._background_color = (0, 0, 0)
-        # добавление пользовательских шрифтов
-        self.add_font(
-            "bebas_regular",
-            "",
-            "report_storage/fonts/BebasNeue-Regular.ttf",
-            uni=True,
-        )
-        self.add_font(
-            "roboto_bold",
-            "",
-            "report_storage/fonts/Roboto Mono Bold for Powerline.ttf",
-            uni=True,
-        )
-        self.add_font(
-            "roboto_medium",
-            "",
-            "report_storage/fonts/Roboto Mono Medium for Powerline.ttf",
-            uni=True,
-        )
-        self.add_font(
-            "roboto_regular",
-            "",
-            "report_storage/fonts/Roboto Mono for Powerline.ttf",
-            uni=True,
-        )
-        self.add_font(
-            "roboto_light",
-            "",
-            "report_storage/fonts/Roboto Mono Light for Powerline.ttf",
-            uni=True,
-        )
+
+    def set_font(self, family=None, style="", size=0):
+        # шрифты отчетов добавляются в документ при первом использовании,
+        # поэтому встраиваются только шрифты из конфигурации страниц
+        if family:
+            register_fonts(self, [family.lower()])
+        super().set_font(family, style, size)
 
     def add_page(self, orientation="P", format="mm", same=False):
         super().add_page(orientation="P", format="a4")
@@ -54,7 +32,8 @@ class CustomPDF(FPDF):
     def create_image_page(self, page_data: dict[str, dict], template: str):
         self._needs_background = False
         self.add_page()
-        self.image(template, x=0, y=0, w=self.w)
+        # шаблон берется из общего кэша, файл читается один раз на процесс
+        self.image(register_image(self, template), x=0, y=0, w=self.w)
 
         for _, element in page_data.items():
             text = element["text"]
@@ -3,11 +3,12 @@
 import json
 import math
 from pathlib import Path
+from typing import Mapping
 
 from glom import glom
 
 from config.settings import SCALE_PX_MM
-from utils.transform_utils import hex_to_rgb
+from utils.transform_utils import format_pythagorian_cell, hex_to_rgb
 
 
 def scale_position(
@@ -51,10 +52,11 @@ def load_config(json_path: Path) -> dict:
 
 
 def build_render_context(
-    config: dict, user_data: dict[str, str], scale: float = SCALE_PX_MM
+    config: dict, user_data: Mapping[str, int | str], scale: float = SCALE_PX_MM
 ) -> dict[str, dict]:
     """
     Build final data structure for rendering the page.
+    Only elements placed by the page config are formatted to text.
     """
 
     resolved_config = resolve_ref(config)
@@ -89,10 +91,11 @@ def build_render_context(
 
 
 def build_dial_context(
-    config: dict, user_data: dict[str, str], scale: float = SCALE_PX_MM
+    config: dict, user_data: Mapping[str, int | str], scale: float = SCALE_PX_MM
 ) -> dict[str, dict]:
     """
-    Build dial data structure for counting data (predict)"""
+    Build dial data structure for counting data (predict).
+    Arcana values are formatted to text here, at render time."""
 
     # Извлекаем настройки
     fonts = config["fonts"]
@@ -157,10 +160,11 @@ def build_dial_context(
 
 
 def build_pythagorian_context(
-    config: dict, user_data: dict[str, str], scale: float = SCALE_PX_MM
+    config: dict, user_data: Mapping[str, int | str], scale: float = SCALE_PX_MM
 ) -> dict[str, dict]:
     """
-    Build dial data structure for pythagorian_table
+    Build dial data structure for pythagorian_table.
+    user_data maps digits "1".."9" to their counts.
     """
 
     fonts = config["fonts"]
@@ -195,7 +199,7 @@ def build_pythagorian_context(
         scaled_position = scale_position(raw_position, scale)
 
         context[key] = {
-            "text": str(value),
+            "text": format_pythagorian_cell(int(key), int(value)),
             "font": font_settings,
             "color": color_settings,
             "position": scaled_position,
@@ -0,0 +1,149 @@
+# utils/template_profiles.py
+"""Варианты шаблонов отчетов для профилей качества.
+
+Шаблоны - JPEG 2380 x 3368 (A4 при 288 dpi), которые встраиваются в
+каждый PDF без изменений. Для профилей из QUALITY_PROFILES строятся
+уменьшенные и пережатые Pillow копии шаблонов в PROFILES_PATH/<профиль>:
+- print   - исходные файлы;
+- screen  - 1240 px по ширине (150 dpi), качество 80;
+- preview - 620 px по ширине (75 dpi), качество 60.
+Страница PDF растягивает шаблон на свою ширину, а координаты текста
+заданы в миллиметрах, поэтому разметка от профиля не зависит.
+
+Варианты строятся заранее (python -m utils.template_profiles) или
+при первом обращении, если файла нет или он старше исходного шаблона.
+"""
+
+import argparse
+import os
+import threading
+from pathlib import Path
+from typing import Iterable, Literal, get_args
+
+from loguru import logger
+from PIL import Image
+
+from config.settings import PROFILES_PATH, QUALITY_PROFILES
+from utils.image_registry import clear_images, template_paths
+
+ProfileType = Literal["print", "screen", "preview"]
+
+DEFAULT_PROFILE: ProfileType = "print"
+
+_LOCK = threading.Lock()
+
+
+class TemplateProfileError(Exception):
+    pass
+
+
+def _profile_options(profile: str) -> dict | None:
+    if profile not in QUALITY_PROFILES:
+        logger.error(f"Неизвестный профиль качества {profile}")
+        raise TemplateProfileError(f"Неизвестный профиль качества {profile}")
+    return QUALITY_PROFILES[profile]
+
+
+def variant_path(template: Path, profile: ProfileType) -> Path:
+    """Путь варианта шаблона для профиля"""
+    if _profile_options(profile) is None:
+        return template
+    return PROFILES_PATH / profile / template.name
+
+
+def build_variant(
+    template: Path, profile: ProfileType, force: bool = False
+) -> Path:
+    """Строит вариант шаблона для профиля, если его нет или он устарел.
+
+    Args:
+        template (Path): исходный шаблон
+        profile (ProfileType): профиль качества
+        force (bool): перестроить даже актуальный вариант
+    Returns:
+        Path: путь варианта (для профиля без обработки - сам шаблон)
+    """
+    options = _profile_options(profile)
+    target = variant_path(template, profile)
+    if options is None:
+        return target
+
+    with _LOCK:
+        if (
+            not force
+            and target.exists()
+            and target.stat().st_mtime >= template.stat().st_mtime
+        ):
+            return target
+
+        try:
+            with Image.open(template) as image:
+                width = min(options["width"], image.width)
+                height = round(image.height * width / image.width)
+                variant = image.convert("RGB").resize(
+                    (width, height), Image.Resampling.LANCZOS)
+        except OSError as error:
+            logger.error(f"Шаблон {template} не удалось прочитать: {error}")
+            raise TemplateProfileError(
+                f"Ошибка чтения шаблона {template}") from error
+
+        if target.exists():
+            # в кэше изображений мог остаться прежний вариант
+            clear_images()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # другие процессы видят либо прежний, либо готовый вариант
+        tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        try:
+            variant.save(
+                tmp_path, "JPEG", quality=options["quality"], optimize=True,
+                dpi=(72, 72),
+            )
+            os.replace(tmp_path, target)
+        except OSError as error:
+            tmp_path.unlink(missing_ok=True)
+            logger.error(f"Вариант {target} не удалось записать: {error}")
+            raise TemplateProfileError(
+                f"Ошибка записи варианта {target}") from error
+        logger.debug(
+            f"Шаблон {template.name} ({profile}): {width} x {height},"
+            f" {target.stat().st_size / 1024:.0f} КБ"
+        )
+        return target
+
+
+def template_for(
+    template: Path, profile: ProfileType = DEFAULT_PROFILE
+) -> Path:
+    """Шаблон, который встраивается в отчет для профиля"""
+    return build_variant(template, profile)
+
+
+def build_variants(
+    profiles: Iterable[ProfileType] | None = None, force: bool = False
+) -> dict[ProfileType, list[Path]]:
+    """Строит варианты всех шаблонов из настроек для профилей"""
+    profiles = list(profiles or get_args(ProfileType))
+    return {
+        profile: [
+            build_variant(template, profile, force)
+            for template in dict.fromkeys(template_paths())
+        ]
+        for profile in profiles
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Сборка вариантов шаблонов для профилей качества")
+    parser.add_argument(
+        "--profile", action="append", choices=list(get_args(ProfileType)))
+    parser.add_argument("--force", action="store_true")
+    args = parser.parse_args()
+
+    for profile, paths in build_variants(args.profile, args.force).items():
+        size = sum(path.stat().st_size for path in paths)
+        print(f"{profile:<8} шаблонов: {len(paths)}  {size / 2**20:6.2f} МБ")
+
+
+if __name__ == "__main__":
+    main()
@@ -32,6 +32,11 @@ def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
         raise ValueError("Некорректный HEX-код.")
 
 
+def format_pythagorian_cell(digit: int, count: int) -> str:
+    """Текст ячейки таблицы Пифагора: цифра, повторенная count раз"""
+    return str(digit) * count if count else "—"
+
+
 def repr_data(data_to_print: dict | list | None) -> str | None:
     """
     Формирует строку для вывода данных о словаре или списке в логах.